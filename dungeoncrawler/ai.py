@@ -79,9 +79,16 @@ class IntentAI:
             raise ValueError("At least one intent weight must be greater than zero")
 
     # ------------------------------------------------------------------
-    def choose_intent(self, enemy, player):
+    def choose_intent(self, enemy, player, rng=None):
         """Select the next action and telegraph it to the player.
 
+        Parameters
+        ----------
+        rng:
+            Random source for the intent roll, usually the ``ai`` stream of
+            the game's :class:`~dungeoncrawler.core.rng.RNGContext`. Defaults
+            to the global :mod:`random` module.
+
         Returns
         -------
         tuple[str, str, str]
@@ -91,9 +98,11 @@ class IntentAI:
             foreshadow that intent.
         """
 
+        if rng is None:
+            rng = random
         intents = list(self.weights.keys())
         weights = list(self.weights.values())
-        intent_key = random.choices(intents, weights=weights, k=1)[0]
+        intent_key = rng.choices(intents, weights=weights, k=1)[0]
 
         # Map intents to actions and default telegraphs
         action = "attack"
@@ -108,7 +117,7 @@ class IntentAI:
         elif intent_key == "defensive" and enemy.health <= enemy.max_health // 3:
             action = "defend"
         elif intent_key == "unpredictable":
-            action = random.choice(["wild_attack", "defend"])
+            action = rng.choice(["wild_attack", "defend"])
 
         # Custom telegraphs for specific enemy archetypes
         telegraphs = self.TELEGRAPHS.get(enemy.name, {})
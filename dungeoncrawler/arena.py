@@ -0,0 +1,228 @@
+"""Silent, policy-driven duels through the real combat code.
+
+The ``python`` and ``numpy`` simulator engines model a fight with
+:mod:`dungeoncrawler.core.combat` alone.  The arena instead runs
+:func:`dungeoncrawler.combat.battle` itself against real
+:class:`~dungeoncrawler.entities.Player` and
+:class:`~dungeoncrawler.entities.Enemy` objects, so stamina skills, companion
+assists, status effects, intent AI, enemy abilities and traits all behave
+exactly as in a run.  An :class:`Arena` stands in for the
+:class:`~dungeoncrawler.dungeon.DungeonBase` pieces ``battle`` touches, and a
+:class:`DuelPolicy` answers its prompts.  All output is discarded through
+the renderer and the fighters' ``output_func``; no process-wide state such
+as ``sys.stdout`` is touched, so arenas can run on several threads.
+
+The arena backs the ``game`` engine of :mod:`dungeoncrawler.sim`::
+
+    python -m dungeoncrawler.sim Bandit --engine game --runs 2000
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional, Sequence
+
+from .ai import IntentAI
+from .autopilot import Policy
+from .combat import battle, bind_attributes
+from .combat_log import CombatLog
+from .core.bus import EventBus
+from .core.rng import RNGContext
+from .dungeon import ENEMY_ABILITIES, ENEMY_AI, ENEMY_TRAITS
+from .entities import Enemy, Player
+from .stats_logger import StatsLogger
+from .status_effects import adjust_skill_cost
+from .ui.terminal import Renderer
+
+# Battle prompts answered before the policy gives up and flees, guarding
+# against stalemates such as an enemy that out-regenerates the player.
+MAX_TURNS = 500
+
+
+def _discard(text: str) -> None:
+    """``output_func`` for arena fighters: drop the message."""
+
+
+class _SilentRenderer(Renderer):
+    def show_message(self, text: str, style: str | None = None) -> None:
+        pass
+
+
+class DuelPolicy(Policy):
+    """Battle policy that spends stamina on skills.
+
+    Below :attr:`low_health` the policy drinks a potion or bandages if it
+    can; otherwise it opens with Power Strike, then Feint, whenever they are
+    off cooldown and affordable, and attacks in between.  Unlike the
+    autopilot it never flees a winnable duel.
+    """
+
+    def __init__(self) -> None:
+        self._skill = "1"
+        self.turns = 0
+
+    def _ready(self, player: Player, key: str) -> bool:
+        skill = player.skills.get(key)
+        return (
+            skill is not None
+            and skill["cooldown"] == 0
+            and player.stamina >= adjust_skill_cost(player, skill["cost"])
+        )
+
+    def battle(self, game, text: str) -> str:
+        self.turns += 1
+        if self.turns > MAX_TURNS:
+            return "5"
+        player = game.player
+        if player.health < player.max_health * self.low_health:
+            if player.has_item("Health Potion"):
+                return "3"
+            if self._ready(player, "3"):
+                self._skill = "3"
+                return "4"
+            return "1"
+        for key in ("1", "2"):
+            if self._ready(player, key):
+                self._skill = key
+                return "4"
+        return "1"
+
+    def skill(self, game, text: str) -> str:
+        return self._skill
+
+
+class Arena:
+    """The parts of :class:`~dungeoncrawler.dungeon.DungeonBase` a battle uses.
+
+    Parameters
+    ----------
+    seed:
+        Seed for the arena's :class:`~dungeoncrawler.core.rng.RNGContext`.
+        Enemy stat rolls use its ``generation`` stream and the battle itself
+        the ``combat`` and ``ai`` streams, as in a real run.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.rng = RNGContext(seed)
+        self.player: Optional[Player] = None
+        self.renderer = _SilentRenderer()
+        self.combat_log = CombatLog()
+        self.stats_logger = StatsLogger(run_id=0)
+        # Nobody subscribes, so combat and status events cost nothing.
+        self.event_bus = EventBus()
+        self.boss_loot: Dict[str, list] = {}
+        self.last_action: Optional[str] = None
+
+    def announce(self, msg: str) -> None:
+        pass
+
+    def queue_message(self, text: str, output_func=None) -> str:
+        return text
+
+    def check_quest_progress(self) -> None:
+        pass
+
+    def duel(self, player: Player, enemy: Enemy, policy: Optional[Policy] = None) -> int:
+        """Fight ``enemy`` with ``player`` and return the rounds played.
+
+        ``policy`` defaults to a fresh :class:`DuelPolicy`.  The renderer
+        drops battle messages and the fighters' ``output_func`` is pointed
+        at a sink for the duel, so nothing is printed.
+        """
+
+        self.player = player
+        policy = policy or DuelPolicy()
+        fighters = [player, enemy, *player.companions]
+        with bind_attributes(fighters, output_func=_discard):
+            battle(self, enemy, input_func=lambda text: policy.answer(self, text))
+        return self.stats_logger.combat_rows.pop()["turns"]
+
+
+@dataclass
+class ArenaReport:
+    """Aggregate of an arena batch, with its throughput."""
+
+    wins: int
+    runs: int
+    total_turns: int
+    elapsed: float
+
+    @property
+    def battles_per_second(self) -> float:
+        return self.runs / self.elapsed if self.elapsed else 0.0
+
+
+def make_enemy(enemy_name: str, ranges: Mapping[str, object], rng) -> Enemy:
+    """Roll an :class:`Enemy` from simulator ``ranges`` the way generation does."""
+
+    weights = ENEMY_AI.get(enemy_name)
+    return Enemy(
+        enemy_name,
+        rng.randint(*ranges["health"]),
+        rng.randint(*ranges["attack"]),
+        ranges["defense"],
+        0,
+        ability=ENEMY_ABILITIES.get(enemy_name),
+        ai=IntentAI(**weights) if weights else None,
+        traits=ENEMY_TRAITS.get(enemy_name),
+    )
+
+
+def run_arena(
+    enemy_name: str,
+    runs: int,
+    seed: int | None = None,
+    player_stats: Mapping[str, int] | None = None,
+    floor: int | None = None,
+    stats: Sequence[int] | None = None,
+    policy_factory: Callable[[], Policy] = DuelPolicy,
+    loadout: Callable[[Player], None] | None = None,
+) -> ArenaReport:
+    """Fight ``runs`` duels against ``enemy_name`` through the real battle loop.
+
+    Parameters
+    ----------
+    enemy_name:
+        Enemy archetype to fight.
+    runs:
+        Number of duels.
+    seed:
+        Optional seed for deterministic results.
+    player_stats:
+        ``health``, ``attack`` and ``speed`` of the hero, as for
+        :func:`dungeoncrawler.sim.simulate_battles`.
+    floor, stats:
+        Enemy scaling and stat override, see
+        :func:`dungeoncrawler.sim.enemy_stat_ranges`.
+    policy_factory:
+        Callable returning the policy for each duel.
+    loadout:
+        Optional callable that equips each fresh :class:`Player` before the
+        fight, for example with gear, potions or companions.
+    """
+
+    from .sim import DEFAULT_PLAYER_STATS, enemy_stat_ranges
+
+    ranges = enemy_stat_ranges(enemy_name, floor, stats)
+    hero = {**DEFAULT_PLAYER_STATS, **(player_stats or {})}
+    arena = Arena(seed)
+    rolls = arena.rng.generation
+    wins = total_turns = 0
+    start = time.perf_counter()
+    for _ in range(runs):
+        player = Player("Hero")
+        player.max_health = player.health = hero["health"]
+        player.attack_power = hero["attack"]
+        player.speed = hero["speed"]
+        if loadout is not None:
+            loadout(player)
+        enemy = make_enemy(enemy_name, ranges, rolls)
+        turns = arena.duel(player, enemy, policy_factory())
+        if player.is_alive() and not enemy.is_alive():
+            wins += 1
+            total_turns += turns
+    return ArenaReport(wins, runs, total_turns, time.perf_counter() - start)
+
+
+__all__ = ["Arena", "ArenaReport", "DuelPolicy", "MAX_TURNS", "make_enemy", "run_arena"]
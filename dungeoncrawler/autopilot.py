@@ -0,0 +1,499 @@
+"""Headless autopilot that plays complete dungeon runs.
+
+A :class:`Policy` answers every prompt :meth:`DungeonBase.play_game` would
+normally read from the keyboard: movement, battle actions, skills,
+companions, the shop, riddles and floor descent.  :func:`run_autopilot`
+plays a batch of seeded runs through the real game loop, feeds each run's
+:class:`~dungeoncrawler.stats_logger.StatsLogger` and reports throughput.
+
+The autopilot can be run from the command line::
+
+    python -m dungeoncrawler.sim autopilot --runs 50 --class Warrior
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+from .core.rng import derive_seed
+from .entities import CLASS_DEFS, Enemy, Player
+from .items import Item
+from .stats_logger import StatsLogger
+
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from .dungeon import DungeonBase
+
+# Prompt prefixes mapped to the :class:`Policy` method answering them.  The
+# game's built-in English strings are matched, so headless runs should not
+# install a translation.
+PROMPTS: Tuple[Tuple[str, str], ...] = (
+    ("Action: ", "move"),
+    ("Choose action: ", "battle"),
+    ("Choose skill: ", "skill"),
+    ("Recruit this companion?", "companion"),
+    ("Choose enchantment: ", "enchant"),
+    ("Upgrade?", "upgrade"),
+    ("Choose an option:", "shop"),
+    ("Sell ", "sell"),
+    ("Enter item number to equip", "inventory"),
+    ("Answer: ", "riddle"),
+    ("Choice: ", "choice"),
+    ("Disarm ", "trap"),
+    ("Would you like to descend", "descend"),
+    ("Retire for score or Descend", "descend"),
+    ("Exit the dungeon or continue fighting?", "descend"),
+    ("Continue your last adventure?", "resume"),
+)
+
+# Menu keys for each step direction.
+MOVE_KEYS = {(-1, 0): "1", (1, 0): "2", (0, -1): "3", (0, 1): "4"}
+QUIT_KEY = "7"
+
+
+def classify_prompt(text: str) -> str:
+    """Return the :class:`Policy` method name that answers ``text``."""
+
+    for prefix, kind in PROMPTS:
+        if text.startswith(prefix):
+            return kind
+    return "other"
+
+
+def _holds_key(obj: object) -> bool:
+    return isinstance(obj, Item) and obj.name == "Key"
+
+
+def next_step(game: "DungeonBase") -> Optional[Tuple[int, int]]:
+    """Return the first ``(dx, dy)`` step towards the most useful tile.
+
+    Rooms collapse once the player leaves them, so the search only crosses
+    tiles that still exist.  With a key in hand the player heads for the
+    exit; otherwise the nearest key, then the nearest occupied room, then
+    the unexplored frontier is chosen.  The exit is avoided until a key is
+    held because entering it early would close it.  Enemies are only fought
+    when no route avoids them or when a floor objective has sealed the exit.
+
+    Apart from keys and the exit, targets are only approached through steps
+    that keep the player in the largest region still standing, so the
+    collapsing trail does not wall the player into a pocket.  Returns
+    ``None`` when the player is boxed in.
+    """
+
+    player = game.player
+    if player.has_item("Key") and game.exit_coords is None:
+        # A floor objective such as the Rat King seals the exit until its
+        # boss falls, so the remaining enemies are the way forward.
+        modes: Tuple[bool, ...] = (True,)
+    else:
+        modes = (False, True)
+    safe = _safe_steps(game)
+    for fight in modes:
+        found = _search(game, fight)
+        if found is None:
+            continue
+        rank, step = found
+        if rank == 0 or step in safe:
+            return step
+        found = _search(game, fight, safe)
+        if found is not None:
+            return found[1]
+    for fight in modes:
+        found = _search(game, fight)
+        if found is not None:
+            return found[1]
+    return None
+
+
+def _safe_steps(game: "DungeonBase") -> Set[Tuple[int, int]]:
+    """Return the steps into the largest region left when the player moves on."""
+
+    start = (game.player.x, game.player.y)
+    sizes: Dict[Tuple[int, int], int] = {}
+    for dx, dy in MOVE_KEYS:
+        first = (start[0] + dx, start[1] + dy)
+        if not _open(game, first):
+            continue
+        seen = {start, first}
+        stack = [first]
+        while stack:
+            x, y = stack.pop()
+            for ex, ey in MOVE_KEYS:
+                pos = (x + ex, y + ey)
+                if pos not in seen and _open(game, pos):
+                    seen.add(pos)
+                    stack.append(pos)
+        sizes[(dx, dy)] = len(seen)
+    largest = max(sizes.values(), default=0)
+    return {step for step, size in sizes.items() if size == largest}
+
+
+def _open(game: "DungeonBase", pos: Tuple[int, int]) -> bool:
+    x, y = pos
+    return 0 <= x < game.width and 0 <= y < game.height and game.rooms[y][x] is not None
+
+
+def _search(
+    game: "DungeonBase", fight: bool, steps: Optional[Set[Tuple[int, int]]] = None
+) -> Optional[Tuple[int, Tuple[int, int]]]:
+    """Breadth-first search for the best target.
+
+    Returns the target's rank and the first step towards it, optionally
+    restricted to first ``steps``.
+    """
+
+    player = game.player
+    start = (player.x, player.y)
+    has_key = player.has_item("Key")
+    parents: Dict[Tuple[int, int], Tuple[int, int]] = {start: start}
+    queue = deque([start])
+    best: List[Optional[Tuple[int, int]]] = [None, None, None]
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in MOVE_KEYS:
+            if steps is not None and (x, y) == start and (dx, dy) not in steps:
+                continue
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < game.width and 0 <= ny < game.height) or (nx, ny) in parents:
+                continue
+            room = game.rooms[ny][nx]
+            if room is None or (not has_key and (nx, ny) == game.exit_coords):
+                continue
+            parents[(nx, ny)] = (x, y)
+            if isinstance(room, Enemy):
+                if not fight:
+                    continue
+            else:
+                queue.append((nx, ny))
+            if has_key and (nx, ny) == game.exit_coords:
+                rank = 0
+            elif _holds_key(room):
+                rank = 0 if not has_key else 1
+            elif room != "Empty":
+                rank = 1
+            else:
+                rank = 2
+            if best[rank] is None:
+                best[rank] = (nx, ny)
+    rank, target = next(
+        ((rank, pos) for rank, pos in enumerate(best) if pos is not None), (0, None)
+    )
+    if target is None:
+        return None
+    while parents[target] != start:
+        target = parents[target]
+    return rank, (target[0] - start[0], target[1] - start[1])
+
+
+class Policy:
+    """Answers every prompt of a headless run.
+
+    :meth:`answer` dispatches on :func:`classify_prompt`; each prompt kind
+    has its own method returning the text the player would type.  The
+    defaults play a cautious greedy game: explore towards keys and rooms
+    with something in them, attack in battle, drink potions when low and
+    always descend.  Subclass and override individual methods to compare
+    strategies.
+    """
+
+    # Fraction of max health below which potions are used and fountains visited.
+    low_health = 0.35
+
+    def answer(self, game: "DungeonBase", text: str) -> str:
+        """Return the reply to prompt ``text``."""
+
+        return getattr(self, classify_prompt(text))(game, text)
+
+    def move(self, game: "DungeonBase", text: str) -> str:
+        step = next_step(game)
+        return QUIT_KEY if step is None else MOVE_KEYS[step]
+
+    def battle(self, game: "DungeonBase", text: str) -> str:
+        player = game.player
+        if player.health < player.max_health * self.low_health:
+            return "3" if player.has_item("Health Potion") else "5"
+        return "1"
+
+    def skill(self, game: "DungeonBase", text: str) -> str:
+        return "1"
+
+    def companion(self, game: "DungeonBase", text: str) -> str:
+        return "y"
+
+    def enchant(self, game: "DungeonBase", text: str) -> str:
+        return "4"
+
+    def upgrade(self, game: "DungeonBase", text: str) -> str:
+        return "y" if game.player.credits >= 50 else "n"
+
+    def shop(self, game: "DungeonBase", text: str) -> str:
+        """Buy the first affordable health potion, otherwise leave."""
+
+        from .config import config
+
+        for index, item in enumerate(game.shop_inventory, 1):
+            price = int(getattr(item, "price", 10) * config.loot_mult)
+            if item.name == "Health Potion" and game.player.credits >= price:
+                return str(index)
+        return str(len(game.shop_inventory) + 2)
+
+    def sell(self, game: "DungeonBase", text: str) -> str:
+        return ""
+
+    def inventory(self, game: "DungeonBase", text: str) -> str:
+        return ""
+
+    def riddle(self, game: "DungeonBase", text: str) -> str:
+        return ""
+
+    def choice(self, game: "DungeonBase", text: str) -> str:
+        """Drink from fountains while hurt; ignore other altars and caches."""
+
+        player = game.player
+        return "d" if player.health < player.max_health else ""
+
+    def trap(self, game: "DungeonBase", text: str) -> str:
+        return "s"
+
+    def descend(self, game: "DungeonBase", text: str) -> str:
+        return "d" if "(r/d)" in text else "y"
+
+    def resume(self, game: "DungeonBase", text: str) -> str:
+        return "n"
+
+    def other(self, game: "DungeonBase", text: str) -> str:
+        return ""
+
+
+@dataclass
+class RunResult:
+    """Outcome of a single autopilot run.
+
+    ``outcome`` is ``"died"``, ``"finished"`` when the run ended through the
+    game's own exit or retire flow, or ``"stalled"`` when the policy quit or
+    the action budget ran out.
+    """
+
+    seed: int
+    player_class: str
+    floor: int
+    outcome: str
+    actions: int
+    level: int
+    cause_of_death: Optional[str] = None
+
+
+@dataclass
+class AutopilotReport:
+    """Results of a batch of runs together with their wall-clock time."""
+
+    results: List[RunResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def runs_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def outcomes(self) -> Dict[str, int]:
+        return dict(Counter(r.outcome for r in self.results))
+
+    @property
+    def mean_floor(self) -> float:
+        return sum(r.floor for r in self.results) / len(self.results) if self.results else 0.0
+
+    def summary(self) -> str:
+        """Return a short plain-text summary."""
+
+        outcomes = ", ".join(f"{k}: {v}" for k, v in sorted(self.outcomes.items()))
+        return "\n".join(
+            [
+                f"Runs: {len(self.results)} ({outcomes})",
+                f"Mean floor reached: {self.mean_floor:.2f}",
+                f"Deepest floor: {max((r.floor for r in self.results), default=0)}",
+                f"Throughput: {self.runs_per_second:.2f} runs/s",
+            ]
+        )
+
+    def to_json(self, **meta: object) -> str:
+        payload = dict(meta)
+        payload.update(
+            {
+                "elapsed": self.elapsed,
+                "runs_per_second": self.runs_per_second,
+                "outcomes": self.outcomes,
+                "mean_floor": self.mean_floor,
+                "runs": [asdict(r) for r in self.results],
+            }
+        )
+        return json.dumps(payload, indent=2)
+
+
+def play_run(
+    seed: int,
+    player_class: str = "Warrior",
+    policy: Optional[Policy] = None,
+    max_actions: int = 2000,
+    log_dir: Path | str = "logs",
+) -> RunResult:
+    """Play one complete run with ``policy`` answering every prompt.
+
+    The game never touches save files, the leaderboard or run statistics.
+    Balance metrics are written by a :class:`StatsLogger` keyed by ``seed``.
+    """
+
+    from .dungeon import DungeonBase
+
+    if player_class != "Novice" and player_class not in CLASS_DEFS:
+        raise KeyError(f"Unknown player class: {player_class}")
+    policy = policy or Policy()
+    game = DungeonBase(10, 10, seed=seed)
+    game.persistent = False
+    # No think time between prompts to overlap with, so build floors on demand.
+    game.prefetch_floors = False
+    # Play as a returning player so results do not depend on local run history.
+    game.total_runs = 1
+    game.stats_logger = StatsLogger(run_id=seed, log_dir=log_dir)
+    player = Player("Autopilot")
+    if player_class != "Novice":
+        player.choose_class(player_class)
+    game.player = player
+
+    actions = 0
+    stalled = False
+
+    def answer(text: str) -> str:
+        nonlocal actions, stalled
+        reply = policy.answer(game, text)
+        if classify_prompt(text) == "move":
+            actions += 1
+            if actions > max_actions:
+                reply = QUIT_KEY
+            if reply == QUIT_KEY:
+                stalled = True
+        return reply
+
+    game.input_func = answer
+    game.play_game()
+
+    if not player.is_alive():
+        outcome = "died"
+    elif stalled:
+        outcome = "stalled"
+    else:
+        outcome = "finished"
+    return RunResult(
+        seed=seed,
+        player_class=player_class,
+        floor=game.current_floor,
+        outcome=outcome,
+        actions=actions,
+        level=player.level,
+        cause_of_death=player.cause_of_death if outcome == "died" else None,
+    )
+
+
+def run_autopilot(
+    runs: int,
+    player_class: str = "Warrior",
+    seed: int = 0,
+    policy: Optional[Policy] = None,
+    max_actions: int = 2000,
+    log_dir: Path | str = "logs",
+    quiet: bool = True,
+) -> AutopilotReport:
+    """Play ``runs`` complete runs and time them.
+
+    Parameters
+    ----------
+    runs:
+        Number of runs to play.
+    player_class:
+        Class chosen for every run.
+    seed:
+        Base seed.  Run ``i`` is seeded from ``seed`` and ``i`` only.
+    policy:
+        Prompt policy, :class:`Policy` by default.
+    max_actions:
+        Map actions allowed per run before it counts as stalled.
+    log_dir:
+        Directory receiving the :class:`StatsLogger` CSV files.
+    quiet:
+        Discard everything the game prints.
+    """
+
+    report = AutopilotReport()
+    sink = io.StringIO() if quiet else None
+    start = time.perf_counter()
+    for index in range(runs):
+        run_seed = derive_seed(seed, "autopilot", index)
+        with contextlib.redirect_stdout(sink) if sink else contextlib.nullcontext():
+            result = play_run(run_seed, player_class, policy, max_actions, log_dir)
+        if sink:
+            sink.seek(0)
+            sink.truncate()
+        report.results.append(result)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for ``python -m dungeoncrawler.sim autopilot``."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m dungeoncrawler.sim autopilot",
+        description="Play complete runs headlessly and report outcomes and throughput.",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs to play")
+    parser.add_argument(
+        "--class", dest="player_class", default="Warrior", help="Player class for every run"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for all runs")
+    parser.add_argument(
+        "--max-actions", type=int, default=2000, help="Map actions per run before giving up"
+    )
+    parser.add_argument("--log-dir", default="logs", help="Directory for StatsLogger CSV files")
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="Write JSON results to this path ('-' for stdout)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_autopilot(
+        args.runs,
+        player_class=args.player_class,
+        seed=args.seed,
+        max_actions=args.max_actions,
+        log_dir=args.log_dir,
+    )
+    # Keep stdout parseable when the JSON goes there.
+    out = sys.stderr if args.json_path == "-" else sys.stdout
+    print(report.summary(), file=out)
+    if args.json_path:
+        text = report.to_json(seed=args.seed, player_class=args.player_class)
+        if args.json_path == "-":
+            print(text)
+        else:
+            Path(args.json_path).write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+__all__ = [
+    "AutopilotReport",
+    "Policy",
+    "RunResult",
+    "classify_prompt",
+    "next_step",
+    "play_run",
+    "run_autopilot",
+]
@@ -0,0 +1,406 @@
+"""Parallel runner for the ``balance_thresholds.yml`` matchup matrix.
+
+Each matchup is split into fixed-size shards of runs.  Every shard receives a
+seed derived from the matchup and the shard index only, so the merged results
+are identical no matter how many worker processes execute them.  Shards are
+spread across a :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+With ``alpha`` set, each matchup instead runs as a single adaptive work item
+that stops as soon as its win rate is clearly inside or outside its band, and
+``runs`` acts as the budget.
+
+Results are cached on disk by :mod:`dungeoncrawler.sim_cache`, so re-running
+the matrix after a data edit only simulates the matchups it affects.
+
+The matrix can be run from the command line::
+
+    python -m dungeoncrawler.sim matrix --workers 8 --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .core.rng import derive_seed
+from .sim_cache import DEFAULT_CACHE_DIR, SimCache, matchup_key
+
+THRESHOLDS_PATH = Path(__file__).resolve().parent.parent / "balance_thresholds.yml"
+
+# Runs per shard.  Part of the seeding scheme: changing it changes results.
+DEFAULT_CHUNK_SIZE = 250
+
+
+@dataclass(frozen=True)
+class Matchup:
+    """Single entry of ``balance_thresholds.yml``."""
+
+    player_class: str
+    enemy_kind: str
+    floor: int
+    runs: int
+    min: float
+    max: float
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used for seeding and reporting."""
+
+        return f"{self.player_class}/{self.enemy_kind}/{self.floor}"
+
+
+@dataclass
+class MatchupResult:
+    """Merged outcome of all shards of a :class:`Matchup`."""
+
+    matchup: Matchup
+    wins: int
+    runs: int
+    total_turns: int
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.runs if self.runs else 0.0
+
+    @property
+    def avg_turns(self) -> float:
+        return self.total_turns / self.wins if self.wins else 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.matchup.min <= self.win_rate <= self.matchup.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self.matchup)
+        data.update(
+            {
+                "wins": self.wins,
+                "runs": self.runs,
+                "win_rate": self.win_rate,
+                "avg_turns": self.avg_turns,
+                "passed": self.passed,
+            }
+        )
+        return data
+
+
+def load_matchups(path: Path | str = THRESHOLDS_PATH) -> List[Matchup]:
+    """Read matchups from a ``balance_thresholds.yml`` style file.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If PyYAML is not installed.
+    """
+
+    try:
+        import yaml
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+        raise ModuleNotFoundError(
+            "PyYAML is required to read balance thresholds. Install it with `pip install pyyaml`."
+        ) from exc
+
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return [
+        Matchup(
+            player_class=case["player_class"],
+            enemy_kind=case["enemy_kind"],
+            floor=int(case.get("floor", 1)),
+            runs=int(case.get("runs", 100)),
+            min=float(case["min"]),
+            max=float(case["max"]),
+        )
+        for case in data.get("matchups", [])
+    ]
+
+
+def shard_seed(base_seed: int, matchup: Matchup, shard: int | str) -> int:
+    """Return the deterministic seed for ``shard`` of ``matchup``."""
+
+    return derive_seed(base_seed, matchup.key, shard)
+
+
+def plan_shards(
+    matchups: Sequence[Matchup], chunk_size: int = DEFAULT_CHUNK_SIZE, seed: int = 0
+) -> List[Tuple[int, Matchup, int, int]]:
+    """Split ``matchups`` into ``(index, matchup, runs, seed)`` work items."""
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    shards = []
+    for index, matchup in enumerate(matchups):
+        remaining = matchup.runs
+        shard = 0
+        while remaining > 0:
+            runs = min(chunk_size, remaining)
+            shards.append((index, matchup, runs, shard_seed(seed, matchup, shard)))
+            remaining -= runs
+            shard += 1
+    return shards
+
+
+def _run_shard(matchup: Matchup, runs: int, seed: int, engine: str) -> Tuple[int, int]:
+    from .sim import battle_outcomes, class_player_stats
+
+    return battle_outcomes(
+        matchup.enemy_kind,
+        runs,
+        seed=seed,
+        player_stats=class_player_stats(matchup.player_class),
+        engine=engine,
+        floor=matchup.floor,
+    )
+
+
+def _run_adaptive(matchup: Matchup, seed: int, engine: str, alpha: float) -> Tuple[int, int, int]:
+    from .sim import class_player_stats, sequential_outcomes
+
+    return sequential_outcomes(
+        matchup.enemy_kind,
+        matchup.runs,
+        (matchup.min, matchup.max),
+        seed=seed,
+        player_stats=class_player_stats(matchup.player_class),
+        engine=engine,
+        alpha=alpha,
+        floor=matchup.floor,
+    )
+
+
+def run_matrix(
+    matchups: Sequence[Matchup],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 0,
+    engine: str = "python",
+    alpha: Optional[float] = None,
+    cache: Optional[SimCache] = None,
+) -> List[MatchupResult]:
+    """Simulate every matchup and merge the shard results.
+
+    Parameters
+    ----------
+    matchups:
+        Matchups to evaluate, usually from :func:`load_matchups`.
+    workers:
+        Number of worker processes.  ``None`` uses every CPU and ``1`` runs
+        all shards in the current process.
+    chunk_size:
+        Number of runs per shard.
+    seed:
+        Base seed combined with each matchup and shard index.
+    engine:
+        Combat resolver passed to :func:`dungeoncrawler.sim.battle_outcomes`.
+    alpha:
+        Error rate for adaptive early stopping.  ``None`` runs every matchup
+        to its full ``runs`` count.
+    cache:
+        Optional :class:`~dungeoncrawler.sim_cache.SimCache`.  Matchups whose
+        inputs are unchanged are read from it and only the rest are simulated.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    if cache is None:
+        return _simulate_matrix(matchups, workers, chunk_size, seed, engine, alpha)
+
+    keys = [_cache_key(m, chunk_size, seed, engine, alpha) for m in matchups]
+    results: List[Optional[MatchupResult]] = []
+    pending: List[int] = []
+    for index, (matchup, key) in enumerate(zip(matchups, keys)):
+        cached = cache.get(key)
+        if cached is None:
+            pending.append(index)
+            results.append(None)
+        else:
+            results.append(MatchupResult(matchup, **cached))
+    computed = _simulate_matrix(
+        [matchups[i] for i in pending], workers, chunk_size, seed, engine, alpha
+    )
+    for index, result in zip(pending, computed):
+        cache.put(
+            keys[index],
+            {"wins": result.wins, "runs": result.runs, "total_turns": result.total_turns},
+        )
+        results[index] = result
+    return results  # type: ignore[return-value]
+
+
+def _cache_key(
+    matchup: Matchup, chunk_size: int, seed: int, engine: str, alpha: Optional[float]
+) -> str:
+    settings: Dict[str, Any] = {"floor": matchup.floor}
+    if alpha is None:
+        settings["chunk_size"] = chunk_size
+    else:
+        settings.update(alpha=alpha, band=[matchup.min, matchup.max])
+    return matchup_key(
+        matchup.player_class, matchup.enemy_kind, engine, seed, matchup.runs, **settings
+    )
+
+
+def _simulate_matrix(
+    matchups: Sequence[Matchup],
+    workers: int,
+    chunk_size: int,
+    seed: int,
+    engine: str,
+    alpha: Optional[float],
+) -> List[MatchupResult]:
+    if not matchups:
+        return []
+    if alpha is not None:
+        return _run_matrix_adaptive(matchups, workers, seed, engine, alpha)
+    shards = plan_shards(matchups, chunk_size, seed)
+    results = [MatchupResult(m, 0, 0, 0) for m in matchups]
+    if workers == 1 or len(shards) <= 1:
+        outcomes = [_run_shard(m, runs, s, engine) for _, m, runs, s in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            futures = [pool.submit(_run_shard, m, runs, s, engine) for _, m, runs, s in shards]
+            outcomes = [future.result() for future in futures]
+    for (index, _, runs, _), (wins, turns) in zip(shards, outcomes):
+        result = results[index]
+        result.wins += wins
+        result.runs += runs
+        result.total_turns += turns
+    return results
+
+
+def _run_matrix_adaptive(
+    matchups: Sequence[Matchup], workers: int, seed: int, engine: str, alpha: float
+) -> List[MatchupResult]:
+    seeds = [shard_seed(seed, m, "adaptive") for m in matchups]
+    if workers == 1 or len(matchups) <= 1:
+        outcomes = [_run_adaptive(m, s, engine, alpha) for m, s in zip(matchups, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(matchups))) as pool:
+            futures = [
+                pool.submit(_run_adaptive, m, s, engine, alpha) for m, s in zip(matchups, seeds)
+            ]
+            outcomes = [future.result() for future in futures]
+    return [
+        MatchupResult(m, wins, runs, turns) for m, (wins, runs, turns) in zip(matchups, outcomes)
+    ]
+
+
+def format_table(results: Sequence[MatchupResult]) -> str:
+    """Return a plain-text pass/fail table for ``results``."""
+
+    header = f"{'Class':<12} {'Enemy':<14} {'Floor':>5} {'Runs':>6} {'Win':>7} {'Band':>13}  Result"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        m = r.matchup
+        band = f"{m.min:.2f}-{m.max:.2f}"
+        lines.append(
+            f"{m.player_class:<12} {m.enemy_kind:<14} {m.floor:>5} {r.runs:>6} "
+            f"{r.win_rate:>7.3f} {band:>13}  {'PASS' if r.passed else 'FAIL'}"
+        )
+    failed = sum(1 for r in results if not r.passed)
+    lines.append(f"{len(results) - failed}/{len(results)} matchups within thresholds")
+    return "\n".join(lines)
+
+
+def results_to_json(results: Sequence[MatchupResult], **meta: Any) -> str:
+    """Serialise ``results`` (and optional run metadata) to JSON."""
+
+    payload = dict(meta)
+    payload["passed"] = all(r.passed for r in results)
+    payload["matchups"] = [r.to_dict() for r in results]
+    return json.dumps(payload, indent=2)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for ``python -m dungeoncrawler.sim matrix``.
+
+    Returns ``0`` when every matchup is inside its band and ``1`` otherwise so
+    the command can gate CI jobs.
+    """
+
+    from .sim import SAMPLING_ENGINES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m dungeoncrawler.sim matrix",
+        description="Run the balance threshold matrix across worker processes.",
+    )
+    parser.add_argument(
+        "--thresholds", default=str(THRESHOLDS_PATH), help="Path to balance_thresholds.yml"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: all CPUs)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Runs per shard")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for all shards")
+    parser.add_argument(
+        "--engine", choices=SAMPLING_ENGINES, default="python", help="Combat resolver"
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=None,
+        help="Stop each matchup early once it is clearly inside or outside its band "
+        "at this error rate",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="Directory for cached matchup results",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Simulate every matchup and skip the cache"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="Write JSON results to this path ('-' for stdout)",
+    )
+    args = parser.parse_args(argv)
+
+    matchups = load_matchups(args.thresholds)
+    cache = None if args.no_cache else SimCache(args.cache_dir)
+    results = run_matrix(
+        matchups,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        engine=args.engine,
+        alpha=args.alpha,
+        cache=cache,
+    )
+    # Keep stdout parseable when the JSON goes there.
+    out = sys.stderr if args.json_path == "-" else sys.stdout
+    print(format_table(results), file=out)
+    if cache is not None:
+        print(cache.report(), file=out)
+    if args.json_path:
+        text = results_to_json(
+            results,
+            seed=args.seed,
+            chunk_size=args.chunk_size,
+            engine=args.engine,
+            alpha=args.alpha,
+        )
+        if args.json_path == "-":
+            sys.stdout.write(text + "\n")
+        else:
+            Path(args.json_path).write_text(text + "\n", encoding="utf-8")
+    return 0 if all(r.passed for r in results) else 1
+
+
+__all__ = [
+    "Matchup",
+    "MatchupResult",
+    "format_table",
+    "load_matchups",
+    "plan_shards",
+    "results_to_json",
+    "run_matrix",
+    "shard_seed",
+]
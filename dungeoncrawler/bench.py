@@ -0,0 +1,373 @@
+"""Bulk dungeon generation benchmark and layout statistics.
+
+``gen`` builds every requested floor for a range of seeds with
+:func:`dungeoncrawler.map.build_floor`, spread across a
+:class:`~concurrent.futures.ProcessPoolExecutor`.  For each floor it reports
+build time percentiles and the peak memory allocated by a build, and it
+checks the generated layouts.  Build times are CPU times, so they stay
+comparable when there are more workers than cores.  The checks are:
+
+* the fraction of the floor that is walkable,
+* the number of regular enemies against
+  :func:`~dungeoncrawler.map.enemy_count_range`,
+* the walking distance from the start to the exit,
+* that the exit and every key can be reached from the start.
+
+Every floor of a seed comes from its own generation substream, so the layout
+figures depend only on the seeds and the code.  Only the timing and memory
+figures vary between runs, which keeps the JSON output diffable across
+commits::
+
+    python -m dungeoncrawler.bench gen --floors 1-18 --seeds 1000 --workers 8 --json gen.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .entities import Enemy
+from .items import Item
+from .map import DistanceField, FloorLayout, build_floor, enemy_count_range
+
+__all__ = [
+    "FloorSample",
+    "format_table",
+    "inspect_layout",
+    "parse_floors",
+    "plan_chunks",
+    "results_to_json",
+    "run_gen",
+    "summarize",
+]
+
+# Seeds built per work item.  Results do not depend on it.
+DEFAULT_CHUNK_SIZE = 50
+
+# Builds per floor that are repeated under :mod:`tracemalloc` for the
+# memory figures.  Tracing slows a build several times over, so it is
+# sampled.
+DEFAULT_MEMORY_SAMPLES = 20
+
+
+@dataclass
+class FloorSample:
+    """Measurements for one generated floor."""
+
+    seed: int
+    time_ms: float
+    peak_kb: Optional[float]
+    walkable: float
+    enemies: int
+    exit_distance: Optional[int]
+    exit_reachable: bool
+    keys_reachable: bool
+
+
+def parse_floors(text: str) -> List[int]:
+    """Return the floors in a spec such as ``"1-18"`` or ``"1,5,9-12"``."""
+
+    floors: List[int] = []
+    for part in text.split(","):
+        first, __, last = part.strip().partition("-")
+        floors.extend(range(int(first), int(last or first) + 1))
+    return sorted(set(floors))
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    """Return the nearest-rank ``q`` percentile of the sorted ``ordered``."""
+
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def inspect_layout(game: Any, layout: FloorLayout) -> Dict[str, Any]:
+    """Return the layout properties checked by ``gen`` for ``layout``."""
+
+    open_cells = layout.rooms.open_cells()
+    reach = DistanceField(open_cells, layout.start, free=())
+    keys = [
+        pos
+        for pos, obj in layout.rooms.objects.items()
+        if isinstance(obj, Item) and obj.name == "Key"
+    ]
+    enemies = sum(
+        1
+        for obj in layout.rooms.objects.values()
+        if isinstance(obj, Enemy) and obj.name in game.enemy_stats
+    )
+    exit_distance = reach.distance(layout.exit_coords) if layout.exit_coords else None
+    return {
+        "walkable": len(open_cells) / (layout.width * layout.height),
+        "enemies": enemies,
+        "exit_distance": exit_distance,
+        "exit_reachable": exit_distance is not None,
+        "keys_reachable": all(reach.distance(pos) is not None for pos in keys),
+    }
+
+
+def _run_chunk(floor: int, seeds: Sequence[int], trace_below: int) -> List[FloorSample]:
+    from .dungeon import DungeonBase
+
+    game = DungeonBase(1, 1, seed=seeds[0])
+    samples = []
+    for seed in seeds:
+        game.rng.reseed(seed)
+        settings = game._floor_settings(floor)
+        # CPU time, so builds sharing a core with other workers are not
+        # charged for the wait.
+        start = time.process_time()
+        layout = build_floor(game, floor, settings=settings)
+        elapsed = (time.process_time() - start) * 1000
+        peak_kb = None
+        if seed < trace_below:
+            tracemalloc.start()
+            build_floor(game, floor, settings=settings)
+            peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+        samples.append(FloorSample(seed, elapsed, peak_kb, **inspect_layout(game, layout)))
+    return samples
+
+
+def plan_chunks(
+    floors: Sequence[int], seeds: int, base_seed: int, chunk_size: int
+) -> List[Tuple[int, List[int]]]:
+    """Split the ``(floor, seed)`` grid into work items of ``chunk_size`` seeds."""
+
+    return [
+        (floor, list(range(first, min(first + chunk_size, base_seed + seeds))))
+        for floor in floors
+        for first in range(base_seed, base_seed + seeds, chunk_size)
+    ]
+
+
+def summarize(floor: int, size: Tuple[int, int], samples: Sequence[FloorSample]) -> Dict[str, Any]:
+    """Aggregate the samples of one floor into its report entry."""
+
+    times = sorted(s.time_ms for s in samples)
+    peaks = sorted(s.peak_kb for s in samples if s.peak_kb is not None)
+    walkable = [s.walkable for s in samples]
+    enemies = [s.enemies for s in samples]
+    distances = [s.exit_distance for s in samples if s.exit_distance is not None]
+    low, high = enemy_count_range(floor, *size)
+    return {
+        "floor": floor,
+        "size": list(size),
+        "samples": len(samples),
+        "time_ms": {
+            "p50": round(_percentile(times, 50), 3),
+            "p90": round(_percentile(times, 90), 3),
+            "p99": round(_percentile(times, 99), 3),
+            "max": round(times[-1], 3),
+        },
+        "peak_kb": (
+            {"p50": round(_percentile(peaks, 50), 1), "max": round(peaks[-1], 1)} if peaks else None
+        ),
+        "layout": {
+            "walkable": {
+                "mean": round(sum(walkable) / len(walkable), 4),
+                "min": round(min(walkable), 4),
+                "max": round(max(walkable), 4),
+            },
+            "enemies": {
+                "mean": round(sum(enemies) / len(enemies), 2),
+                "min": min(enemies),
+                "max": max(enemies),
+                "expected": [low, high],
+                "out_of_range": sum(1 for n in enemies if not low <= n <= high),
+            },
+            "exit_distance": (
+                {
+                    "mean": round(sum(distances) / len(distances), 2),
+                    "min": min(distances),
+                    "max": max(distances),
+                }
+                if distances
+                else None
+            ),
+            "unreachable_exit": sum(1 for s in samples if not s.exit_reachable),
+            "unreachable_key": sum(1 for s in samples if not s.keys_reachable),
+        },
+    }
+
+
+def floor_passed(entry: Dict[str, Any]) -> bool:
+    """Return whether every layout check of a :func:`summarize` entry held."""
+
+    layout = entry["layout"]
+    return not (
+        layout["enemies"]["out_of_range"] or layout["unreachable_exit"] or layout["unreachable_key"]
+    )
+
+
+def run_gen(
+    floors: Sequence[int],
+    seeds: int,
+    *,
+    base_seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    memory_samples: int = DEFAULT_MEMORY_SAMPLES,
+) -> List[Dict[str, Any]]:
+    """Build ``floors`` for ``seeds`` consecutive seeds and summarise each floor.
+
+    Parameters
+    ----------
+    floors:
+        Floor numbers to build.
+    seeds:
+        Number of seeds per floor, starting at ``base_seed``.
+    workers:
+        Worker processes.  Defaults to the CPU count; ``1`` runs in-process.
+    chunk_size:
+        Seeds built per work item.
+    memory_samples:
+        Number of leading seeds per floor whose build is repeated under
+        :mod:`tracemalloc`.
+
+    Returns
+    -------
+    list of dict
+        One :func:`summarize` entry per floor.
+    """
+
+    from .dungeon import DungeonBase
+
+    configs = DungeonBase(1, 1).floor_configs
+    missing = [floor for floor in floors if floor not in configs]
+    if missing:
+        raise ValueError(f"Floors not configured: {missing}")
+    workers = workers or os.cpu_count() or 1
+    chunks = plan_chunks(floors, seeds, base_seed, chunk_size)
+    trace_below = base_seed + memory_samples
+    if workers == 1 or len(chunks) <= 1:
+        outcomes = [_run_chunk(floor, chunk, trace_below) for floor, chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            futures = [
+                pool.submit(_run_chunk, floor, chunk, trace_below) for floor, chunk in chunks
+            ]
+            outcomes = [future.result() for future in futures]
+    samples: Dict[int, List[FloorSample]] = {floor: [] for floor in floors}
+    for (floor, __), chunk_samples in zip(chunks, outcomes):
+        samples[floor].extend(chunk_samples)
+    results = []
+    for floor in floors:
+        cfg = configs[floor]
+        size = tuple(cfg.get("size", (min(15, 8 + floor), min(15, 8 + floor))))
+        results.append(summarize(floor, size, samples[floor]))
+    return results
+
+
+def format_table(results: Sequence[Dict[str, Any]]) -> str:
+    """Return a plain-text per-floor table for ``run_gen`` results."""
+
+    header = (
+        f"{'Floor':>5} {'Size':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'Peak KB':>8} "
+        f"{'Walk':>6} {'Enemies':>9} {'Exit':>6}  Result"
+    )
+    lines = [header, "-" * len(header)]
+    for entry in results:
+        times, layout = entry["time_ms"], entry["layout"]
+        width, height = entry["size"]
+        peak = f"{entry['peak_kb']['max']:.0f}" if entry["peak_kb"] else "-"
+        exit_distance = layout["exit_distance"]
+        exit_mean = f"{exit_distance['mean']:.1f}" if exit_distance else "-"
+        lines.append(
+            f"{entry['floor']:>5} {width:>3}x{height:<3} {times['p50']:>8.2f} "
+            f"{times['p90']:>8.2f} {times['p99']:>8.2f} {peak:>8} "
+            f"{layout['walkable']['mean']:>6.1%} {layout['enemies']['mean']:>9.1f} "
+            f"{exit_mean:>6}  "
+            f"{'PASS' if floor_passed(entry) else 'FAIL'}"
+        )
+    failed = sum(1 for entry in results if not floor_passed(entry))
+    lines.append(f"{len(results) - failed}/{len(results)} floors passed layout checks")
+    return "\n".join(lines)
+
+
+def results_to_json(results: Sequence[Dict[str, Any]], **meta: Any) -> str:
+    """Serialise ``results`` (and optional run metadata) to JSON."""
+
+    payload = dict(meta)
+    payload["passed"] = all(floor_passed(entry) for entry in results)
+    payload["floors"] = list(results)
+    return json.dumps(payload, indent=2)
+
+
+def gen_main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for ``python -m dungeoncrawler.bench gen``.
+
+    Returns ``0`` when every floor passes its layout checks and ``1``
+    otherwise.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m dungeoncrawler.bench gen",
+        description="Mass-generate floors and report timing and layout statistics.",
+    )
+    parser.add_argument("--floors", default="1-18", help="Floors to build, e.g. 1-18 or 1,5,9-12")
+    parser.add_argument("--seeds", type=int, default=100, help="Seeds built per floor")
+    parser.add_argument("--seed", type=int, default=0, help="First seed")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: all CPUs)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Seeds per work item"
+    )
+    parser.add_argument(
+        "--memory-samples",
+        type=int,
+        default=DEFAULT_MEMORY_SAMPLES,
+        help="Builds per floor repeated under tracemalloc (0 disables)",
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="Write JSON results to this path ('-' for stdout)",
+    )
+    args = parser.parse_args(argv)
+
+    floors = parse_floors(args.floors)
+    start = time.perf_counter()
+    results = run_gen(
+        floors,
+        args.seeds,
+        base_seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        memory_samples=args.memory_samples,
+    )
+    elapsed = time.perf_counter() - start
+    # Keep stdout parseable when the JSON goes there.
+    out = sys.stderr if args.json_path == "-" else sys.stdout
+    print(format_table(results), file=out)
+    print(f"Built {len(floors) * args.seeds:,} floors in {elapsed:.1f}s", file=out)
+    if args.json_path:
+        text = results_to_json(results, seed=args.seed, seeds=args.seeds)
+        if args.json_path == "-":
+            sys.stdout.write(text + "\n")
+        else:
+            Path(args.json_path).write_text(text + "\n", encoding="utf-8")
+    return 0 if all(floor_passed(entry) for entry in results) else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Dispatch ``python -m dungeoncrawler.bench`` subcommands."""
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["gen"]:
+        sys.exit(gen_main(argv[1:]))
+    sys.exit("usage: python -m dungeoncrawler.bench gen [options]")
+
+
+if __name__ == "__main__":
+    main()
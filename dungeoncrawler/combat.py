@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
-from gettext import gettext as _
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
 
-from .combat_log import CombatLog
+from .combat_log import COMBAT_EVENTS, CombatLog
 from .constants import INVALID_KEY_MSG
+from .core.bus import EventBus
 from .core.combat import resolve_enemy_turn, resolve_player_action
 from .core.entity import Entity as CoreEntity
+from .i18n import gettext as _
 from .status_effects import format_status_tags
 from .ui.terminal import Renderer
 
@@ -17,11 +30,108 @@ if TYPE_CHECKING:  # pragma: no cover - for type hints only
     from .entities import Enemy, Player
 
 
+Reader = Callable[[Any], int]
+
+# How each core stat is read from a game entity.  The player's defense comes
+# from their armor, an enemy's from its own ``defense`` attribute.
+PLAYER_STATS: Dict[str, Reader] = {
+    "health": attrgetter("health"),
+    "attack": attrgetter("attack_power"),
+    "max_health": attrgetter("max_health"),
+    "defense": lambda player: getattr(player.armor, "defense", 0),
+    "speed": attrgetter("speed"),
+}
+ENEMY_STATS: Dict[str, Reader] = {
+    "health": attrgetter("health"),
+    "attack": attrgetter("attack_power"),
+    "max_health": attrgetter("max_health"),
+    "defense": attrgetter("defense"),
+    "speed": attrgetter("speed"),
+}
+
+
+class LiveStats(MutableMapping[str, int]):
+    """Stat mapping that reads from and writes to a game entity.
+
+    Reads go straight to ``owner`` so gear swaps, skills and companion hits
+    between actions are always seen.  Writes to ``health`` land on
+    ``owner.health``; any other key is kept in the mapping itself and
+    shadows the owner's value.
+    """
+
+    __slots__ = ("owner", "readers", "extra")
+
+    def __init__(self, owner: Any, readers: Dict[str, Reader]) -> None:
+        self.owner = owner
+        self.readers = readers
+        self.extra: Dict[str, int] = {}
+
+    def __getitem__(self, key: str) -> int:
+        extra = self.extra
+        if extra and key in extra:
+            return extra[key]
+        return self.readers[key](self.owner)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        extra = self.extra
+        if extra and key in extra:
+            return extra[key]
+        reader = self.readers.get(key)
+        return default if reader is None else reader(self.owner)
+
+    def __setitem__(self, key: str, value: int) -> None:
+        if key == "health":
+            self.owner.health = value
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.readers
+        for key in self.extra:
+            if key not in self.readers:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.readers.keys() | self.extra.keys())
+
+
+class Combatant(CoreEntity):
+    """Core entity bound to a game :class:`Player` or :class:`Enemy`.
+
+    :func:`battle` builds one per side when the fight starts and hands the
+    pair to every core resolver call.  Stats are a :class:`LiveStats` view
+    of ``owner``, so nothing needs copying back.  Status flags such as
+    ``defend_damage`` or ``advantage`` live on the combatant and carry over
+    to the following turns of the same battle.
+    """
+
+    def __init__(self, owner: Any, readers: Dict[str, Reader]) -> None:
+        super().__init__(owner.name, LiveStats(owner, readers))  # type: ignore[arg-type]
+        self.owner = owner
+
+    @classmethod
+    def for_player(cls, player: "Player") -> "Combatant":
+        """Return a combatant for ``player``."""
+
+        return cls(player, PLAYER_STATS)
+
+    @classmethod
+    def for_enemy(cls, enemy: "Enemy") -> "Combatant":
+        """Return a combatant for ``enemy``."""
+
+        return cls(enemy, ENEMY_STATS)
+
+
 def enemy_turn(
     enemy: "Enemy",
     player: "Player",
     renderer: Renderer | None = None,
     log: CombatLog | None = None,
+    combatants: Optional[Tuple[Combatant, Combatant]] = None,
+    bus: EventBus | None = None,
 ) -> None:
     """Handle the enemy's turn by applying status effects and attacking.
 
@@ -31,42 +141,60 @@ def enemy_turn(
         The active enemy in battle.
     player:
         The player being targeted.
+    combatants:
+        The battle's ``(enemy, player)`` :class:`Combatant` pair.  Built on
+        the spot when omitted.
+    bus:
+        Event bus the turn's events are published on.  Without one they go
+        straight to ``log`` and ``renderer``.
     """
 
-    renderer = renderer or Renderer()
     if enemy.is_alive():
         skip = enemy.apply_status_effects()
         if enemy.is_alive() and not skip:
-            enemy_entity = CoreEntity(
-                enemy.name,
-                {
-                    "health": enemy.health,
-                    "attack": getattr(enemy, "attack_power", 0),
-                    "defense": getattr(enemy, "defense", 0),
-                    "speed": getattr(enemy, "speed", 0),
-                },
-            )
+            if combatants is None:
+                combatants = Combatant.for_enemy(enemy), Combatant.for_player(player)
+            enemy_entity, player_entity = combatants
             # Use the preselected intent so the telegraphed action is executed.
-            enemy_entity.intent = (item for item in [(enemy.next_action, enemy.intent_message)])
-            player_entity = CoreEntity(
-                player.name,
-                {
-                    "health": player.health,
-                    "defense": getattr(player.armor, "defense", 0),
-                    "speed": getattr(player, "speed", 0),
-                },
-            )
-            events = resolve_enemy_turn(enemy_entity, player_entity)
-            enemy.health = enemy_entity.stats["health"]
-            player.health = player_entity.stats["health"]
-            for event in events:
-                if log is not None:
-                    log.handle_event(event)
-                renderer.handle_event(event)
+            enemy_entity.intent = iter(((enemy.next_action, enemy.intent_message),))
+            events = resolve_enemy_turn(enemy_entity, player_entity, enemy.rng)
+            if bus is not None:
+                bus.publish_all(events)
+            else:
+                renderer = renderer or Renderer()
+                for event in events:
+                    if log is not None:
+                        log.handle_event(event)
+                    renderer.handle_event(event)
         if enemy.heavy_cd > 0:
             enemy.heavy_cd -= 1
 
 
+@contextmanager
+def bind_attributes(entities: Iterable[Any], **values: Any) -> Iterator[None]:
+    """Set attributes on each of ``entities`` for the duration of a block.
+
+    Values the entities held on the instance before are put back afterwards,
+    and attributes they only inherited from their class are deleted again.
+    """
+
+    entities = list(entities)
+    missing = object()
+    saved = [{name: vars(entity).get(name, missing) for name in values} for entity in entities]
+    for entity in entities:
+        for name, value in values.items():
+            setattr(entity, name, value)
+    try:
+        yield
+    finally:
+        for entity, previous in zip(entities, saved):
+            for name, value in previous.items():
+                if value is missing:
+                    delattr(entity, name)
+                else:
+                    setattr(entity, name, value)
+
+
 def battle(game: "DungeonBase", enemy: "Enemy", input_func=None) -> None:
     """Run a battle between the player and ``enemy``.
 
@@ -90,171 +218,116 @@ def battle(game: "DungeonBase", enemy: "Enemy", input_func=None) -> None:
     renderer.show_message(encounter_msg)
     game.combat_log.log(encounter_msg)
     game.announce(f"{player.name} engages {enemy.name}!")
-    while player.is_alive() and enemy.is_alive():
-        skip_player = player.apply_status_effects()
-        for companion in getattr(player, "companions", []):
-            companion.assist(player, enemy)
-        if not enemy.is_alive():
-            break
-        if enemy.ai and hasattr(enemy.ai, "choose_intent"):
-            enemy.next_action, enemy.intent, enemy.intent_message = enemy.ai.choose_intent(
-                enemy, player
-            )
-            if enemy.intent_message:
-                msg = _(enemy.intent_message)
-                game.queue_message(msg, output_func=None)
-                game.combat_log.log(msg)
-        else:
-            enemy.next_action = None
-            enemy.intent = None
-            enemy.intent_message = ""
-        if skip_player:
-            before = player.health
-            enemy_turn(enemy, player, renderer, game.combat_log)
-            game.stats_logger.record_damage(taken=before - player.health)
-            game.stats_logger.record_turn()
-            continue
-
-        renderer.show_message(
-            _(f"Player Health: {player.health} {format_status_tags(player.status_effects)}")
-        )
-        renderer.show_message(
-            _(f"Enemy Health: {enemy.health} {format_status_tags(enemy.status_effects)}")
-        )
-        if enemy.intent:
-            renderer.show_message(_(f"Intent: {enemy.intent}"))
-        if enemy.intent_message:
-            renderer.show_message(_(enemy.intent_message))
-        renderer.show_message(_(f"Stamina: {player.stamina}/{player.max_stamina}"))
-        renderer.show_message(
-            _("1. Attack\n2. Defend\n3. Use Health Potion\n4. Use Skill\n5. Flee")
-        )
-        choice = input_func(_("Choose action: "))
-        if choice == "1":
-            enemy_before = enemy.health
-            p_entity = CoreEntity(
-                player.name,
-                {
-                    "health": player.health,
-                    "attack": getattr(player, "attack_power", 0),
-                    "max_health": player.max_health,
-                    "defense": getattr(player.armor, "defense", 0),
-                    "speed": getattr(player, "speed", 0),
-                },
-            )
-            e_entity = CoreEntity(
-                enemy.name,
-                {
-                    "health": enemy.health,
-                    "attack": getattr(enemy, "attack_power", 0),
-                    "max_health": enemy.max_health,
-                    "defense": getattr(enemy, "defense", 0),
-                    "speed": getattr(enemy, "speed", 0),
-                },
-            )
-            events = resolve_player_action(p_entity, e_entity, "attack")
-            player.health = p_entity.stats["health"]
-            enemy.health = e_entity.stats["health"]
-            for event in events:
-                game.combat_log.handle_event(event)
-                renderer.handle_event(event)
-            game.announce(_("A fierce attack lands!"))
-            game.stats_logger.record_damage(dealt=enemy_before - enemy.health)
-            before = player.health
-            enemy_turn(enemy, player, renderer, game.combat_log)
-            game.stats_logger.record_damage(taken=before - player.health)
-            game.stats_logger.record_turn()
-            game.last_action = "attack"
-        elif choice == "2":
-            enemy_before = enemy.health
-            p_entity = CoreEntity(
-                player.name,
-                {
-                    "health": player.health,
-                    "attack": getattr(player, "attack_power", 0),
-                    "max_health": player.max_health,
-                    "defense": getattr(player.armor, "defense", 0),
-                    "speed": getattr(player, "speed", 0),
-                },
-            )
-            e_entity = CoreEntity(
-                enemy.name,
-                {
-                    "health": enemy.health,
-                    "attack": getattr(enemy, "attack_power", 0),
-                    "max_health": enemy.max_health,
-                    "defense": getattr(enemy, "defense", 0),
-                    "speed": getattr(enemy, "speed", 0),
-                },
+    combat_rng = game.rng.combat
+    bus = getattr(game, "event_bus", None)
+    if bus is None:
+        bus = EventBus()
+        bus.subscribe(game.combat_log.handle_event, *COMBAT_EVENTS)
+        bus.subscribe(renderer.handle_event)
+    fighters = (player, enemy, *getattr(player, "companions", []))
+    # The stream and bus only apply to this fight; afterwards rolls and
+    # status messages go back to each fighter's own ``rng`` and ``output_func``.
+    with bind_attributes(fighters, rng=combat_rng, event_bus=bus):
+        p_entity, e_entity = Combatant.for_player(player), Combatant.for_enemy(enemy)
+        combatants = (e_entity, p_entity)
+        while player.is_alive() and enemy.is_alive():
+            # Batched subscribers receive each turn's events together.
+            bus.flush()
+            skip_player = player.apply_status_effects()
+            for companion in getattr(player, "companions", []):
+                companion.assist(player, enemy)
+            if not enemy.is_alive():
+                break
+            if enemy.ai and hasattr(enemy.ai, "choose_intent"):
+                enemy.next_action, enemy.intent, enemy.intent_message = enemy.ai.choose_intent(
+                    enemy, player, game.rng.ai
+                )
+                if enemy.intent_message:
+                    msg = _(enemy.intent_message)
+                    game.queue_message(msg, output_func=None)
+                    game.combat_log.log(msg)
+            else:
+                enemy.next_action = None
+                enemy.intent = None
+                enemy.intent_message = ""
+            if skip_player:
+                before = player.health
+                enemy_turn(enemy, player, combatants=combatants, bus=bus)
+                game.stats_logger.record_damage(taken=before - player.health)
+                game.stats_logger.record_turn()
+                continue
+
+            renderer.show_message(
+                _(f"Player Health: {player.health} {format_status_tags(player.status_effects)}")
             )
-            events = resolve_player_action(p_entity, e_entity, "defend")
-            player.health = p_entity.stats["health"]
-            enemy.health = e_entity.stats["health"]
-            for event in events:
-                game.combat_log.handle_event(event)
-                renderer.handle_event(event)
-            game.stats_logger.record_damage(dealt=enemy_before - enemy.health)
-            before = player.health
-            enemy_turn(enemy, player, renderer, game.combat_log)
-            game.stats_logger.record_damage(taken=before - player.health)
-            game.stats_logger.record_turn()
-            game.last_action = "defend"
-        elif choice == "3":
-            player.use_health_potion()
-            before = player.health
-            enemy_turn(enemy, player, renderer, game.combat_log)
-            game.stats_logger.record_damage(taken=before - player.health)
-            game.stats_logger.record_turn()
-            game.last_action = "item"
-        elif choice == "4":
-            enemy_before = enemy.health
-            skill_name = player.use_skill(enemy)
-            if skill_name:
-                game.stats_logger.record_skill(skill_name)
-            game.announce(_("Special skill unleashed!"))
-            game.stats_logger.record_damage(dealt=enemy_before - enemy.health)
-            before = player.health
-            enemy_turn(enemy, player, renderer, game.combat_log)
-            game.stats_logger.record_damage(taken=before - player.health)
-            game.stats_logger.record_turn()
-            game.last_action = "skill"
-        elif choice == "5":
-            p_entity = CoreEntity(
-                player.name,
-                {
-                    "health": player.health,
-                    "attack": getattr(player, "attack_power", 0),
-                    "max_health": player.max_health,
-                    "defense": getattr(player.armor, "defense", 0),
-                    "speed": getattr(player, "speed", 0),
-                },
+            renderer.show_message(
+                _(f"Enemy Health: {enemy.health} {format_status_tags(enemy.status_effects)}")
             )
-            e_entity = CoreEntity(
-                enemy.name,
-                {
-                    "health": enemy.health,
-                    "attack": getattr(enemy, "attack_power", 0),
-                    "max_health": enemy.max_health,
-                    "defense": getattr(enemy, "defense", 0),
-                    "speed": getattr(enemy, "speed", 0),
-                },
+            if enemy.intent:
+                renderer.show_message(_(f"Intent: {enemy.intent}"))
+            if enemy.intent_message:
+                renderer.show_message(_(enemy.intent_message))
+            renderer.show_message(_(f"Stamina: {player.stamina}/{player.max_stamina}"))
+            renderer.show_message(
+                _("1. Attack\n2. Defend\n3. Use Health Potion\n4. Use Skill\n5. Flee")
             )
-            events = resolve_player_action(p_entity, e_entity, "flee")
-            for event in events:
-                game.combat_log.handle_event(event)
-                renderer.handle_event(event)
-            if getattr(events[-1], "value", 0):
-                game.announce(f"{player.name} flees from {enemy.name}!")
+            choice = input_func(_("Choose action: "))
+            if choice == "1":
+                enemy_before = enemy.health
+                events = resolve_player_action(p_entity, e_entity, "attack", combat_rng)
+                bus.publish_all(events)
+                game.announce(_("A fierce attack lands!"))
+                game.stats_logger.record_damage(dealt=enemy_before - enemy.health)
+                before = player.health
+                enemy_turn(enemy, player, combatants=combatants, bus=bus)
+                game.stats_logger.record_damage(taken=before - player.health)
                 game.stats_logger.record_turn()
-                break
-            before = player.health
-            enemy_turn(enemy, player, renderer, game.combat_log)
-            game.stats_logger.record_damage(taken=before - player.health)
-            game.stats_logger.record_turn()
-            game.last_action = "flee"
-        else:
-            renderer.show_message(_(INVALID_KEY_MSG))
-        player.decrement_cooldowns()
+                game.last_action = "attack"
+            elif choice == "2":
+                enemy_before = enemy.health
+                events = resolve_player_action(p_entity, e_entity, "defend", combat_rng)
+                bus.publish_all(events)
+                game.stats_logger.record_damage(dealt=enemy_before - enemy.health)
+                before = player.health
+                enemy_turn(enemy, player, combatants=combatants, bus=bus)
+                game.stats_logger.record_damage(taken=before - player.health)
+                game.stats_logger.record_turn()
+                game.last_action = "defend"
+            elif choice == "3":
+                player.use_health_potion()
+                before = player.health
+                enemy_turn(enemy, player, combatants=combatants, bus=bus)
+                game.stats_logger.record_damage(taken=before - player.health)
+                game.stats_logger.record_turn()
+                game.last_action = "item"
+            elif choice == "4":
+                enemy_before = enemy.health
+                skill_name = player.use_skill(enemy, input_func=input_func)
+                if skill_name:
+                    game.stats_logger.record_skill(skill_name)
+                game.announce(_("Special skill unleashed!"))
+                game.stats_logger.record_damage(dealt=enemy_before - enemy.health)
+                before = player.health
+                enemy_turn(enemy, player, combatants=combatants, bus=bus)
+                game.stats_logger.record_damage(taken=before - player.health)
+                game.stats_logger.record_turn()
+                game.last_action = "skill"
+            elif choice == "5":
+                events = resolve_player_action(p_entity, e_entity, "flee", combat_rng)
+                bus.publish_all(events)
+                if getattr(events[-1], "value", 0):
+                    game.announce(f"{player.name} flees from {enemy.name}!")
+                    game.stats_logger.record_turn()
+                    break
+                before = player.health
+                enemy_turn(enemy, player, combatants=combatants, bus=bus)
+                game.stats_logger.record_damage(taken=before - player.health)
+                game.stats_logger.record_turn()
+                game.last_action = "flee"
+            else:
+                renderer.show_message(_(INVALID_KEY_MSG))
+            player.decrement_cooldowns()
+        bus.flush()
 
     if not enemy.is_alive():
         game.announce(f"{enemy.name} has been defeated!")
@@ -12,7 +12,10 @@ from dataclasses import dataclass
 from typing import List
 
 from .config import config
-from .core.events import AttackResolved, Event
+from .core.events import AttackResolved, Event, IntentTelegraphed, StatusApplied
+
+# Event types a game's combat log subscribes to.
+COMBAT_EVENTS = (AttackResolved, StatusApplied, IntentTelegraphed)
 
 
 @dataclass
@@ -59,4 +62,4 @@ class CombatLog:
         return self.log(msg)
 
 
-__all__ = ["CombatLog"]
+__all__ = ["COMBAT_EVENTS", "CombatLog"]
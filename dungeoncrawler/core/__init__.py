@@ -1,7 +1,9 @@
 """Core infrastructure components for dungeon crawler."""
 
+from .bus import EventBus
 from .map import GameMap
+from .rng import RNGContext
 from .save import load_game, save_game
 from .state import GameState
 
-__all__ = ["GameMap", "GameState", "save_game", "load_game"]
+__all__ = ["EventBus", "GameMap", "GameState", "RNGContext", "save_game", "load_game"]
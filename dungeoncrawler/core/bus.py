@@ -0,0 +1,150 @@
+"""In-process publish/subscribe bus for core events.
+
+Producers such as :func:`dungeoncrawler.combat.battle` and the status effect
+handlers publish :class:`~dungeoncrawler.core.events.Event` objects.  The
+renderer, the combat log or a test listen without knowing who produced them.
+
+Subscriptions are filtered by event type and match subclasses, so listening
+for :class:`~dungeoncrawler.core.events.Event` receives everything.  A handler
+is called either synchronously on :meth:`EventBus.publish` or, when
+subscribed with ``batched=True``, once per :meth:`EventBus.flush` with the
+list of events queued since the last flush.  Games flush once per turn.
+
+Publishing on a bus without subscribers returns immediately, so headless
+simulations pay nothing for events nobody reads.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Tuple, Type
+
+from .events import Event
+
+Handler = Callable[[Event], None]
+BatchHandler = Callable[[List[Event]], None]
+
+
+class Subscription:
+    """A handler registered on an :class:`EventBus`.
+
+    Parameters
+    ----------
+    handler:
+        Callable receiving one event, or a list of events when ``batched``.
+    event_types:
+        Event classes the handler listens for, subclasses included.
+    batched:
+        Whether events are queued until :meth:`EventBus.flush`.
+    """
+
+    __slots__ = ("handler", "event_types", "batched", "pending")
+
+    def __init__(
+        self, handler: Callable, event_types: Tuple[Type[Event], ...], batched: bool
+    ) -> None:
+        self.handler = handler
+        self.event_types = event_types
+        self.batched = batched
+        self.pending: List[Event] = []
+
+    def wants(self, event_type: type) -> bool:
+        """Return whether events of ``event_type`` reach this subscription."""
+
+        return issubclass(event_type, self.event_types)
+
+
+class EventBus:
+    """Type-filtered event dispatcher with synchronous and batched delivery."""
+
+    def __init__(self) -> None:
+        self._subscriptions: List[Subscription] = []
+        # Per concrete event type: the synchronous handlers and the batched
+        # subscriptions it reaches.  Rebuilt lazily after (un)subscribing.
+        self._routes: Dict[type, Tuple[Tuple[Handler, ...], Tuple[Subscription, ...]]] = {}
+        self._has_pending = False
+
+    def subscribe(
+        self, handler: Callable, *event_types: Type[Event], batched: bool = False
+    ) -> Subscription:
+        """Register ``handler`` for ``event_types`` and return its subscription.
+
+        Parameters
+        ----------
+        handler:
+            Called with each event, or with a list of events on
+            :meth:`flush` when ``batched`` is ``True``.
+        event_types:
+            Event classes to receive.  Defaults to every event.
+        batched:
+            Queue events and deliver them together on :meth:`flush`.
+        """
+
+        subscription = Subscription(handler, event_types or (Event,), batched)
+        self._subscriptions.append(subscription)
+        self._routes.clear()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove ``subscription``, dropping events it has not received yet."""
+
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            subscription.pending.clear()
+            self._routes.clear()
+
+    def _route(self, event_type: type) -> Tuple[Tuple[Handler, ...], Tuple[Subscription, ...]]:
+        route = self._routes.get(event_type)
+        if route is None:
+            matching = [sub for sub in self._subscriptions if sub.wants(event_type)]
+            route = (
+                tuple(sub.handler for sub in matching if not sub.batched),
+                tuple(sub for sub in matching if sub.batched),
+            )
+            self._routes[event_type] = route
+        return route
+
+    def has_subscribers(self, event_type: type = Event) -> bool:
+        """Return whether any subscription would receive ``event_type``.
+
+        Producers may check this before building costly events.
+        """
+
+        if not self._subscriptions:
+            return False
+        handlers, batched = self._route(event_type)
+        return bool(handlers or batched)
+
+    def publish(self, event: Event) -> None:
+        """Deliver ``event`` to matching synchronous handlers and queues."""
+
+        if not self._subscriptions:
+            return
+        handlers, batched = self._route(type(event))
+        for handler in handlers:
+            handler(event)
+        if batched:
+            for subscription in batched:
+                subscription.pending.append(event)
+            self._has_pending = True
+
+    def publish_all(self, events: Iterable[Event]) -> None:
+        """Publish each of ``events`` in order."""
+
+        if not self._subscriptions:
+            return
+        for event in events:
+            self.publish(event)
+
+    def flush(self) -> None:
+        """Hand every batched subscription the events queued for it."""
+
+        if not self._has_pending:
+            return
+        self._has_pending = False
+        for subscription in list(self._subscriptions):
+            if subscription.batched and subscription.pending:
+                pending, subscription.pending = subscription.pending, []
+                subscription.handler(pending)
+
+
+__all__ = ["EventBus", "Subscription"]
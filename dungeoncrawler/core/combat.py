@@ -2,8 +2,10 @@
 
 The functions defined here operate on :class:`~dungeoncrawler.core.entity.Entity`
 instances and return typed event objects describing the outcome of an action.
-No printing or random number generation occurs which makes the module suitable
-for unit testing and simulations.
+No printing occurs and every random roll is drawn from the ``rng`` argument
+(usually the ``combat`` stream of a :class:`~dungeoncrawler.core.rng.RNGContext`),
+which makes the module suitable for unit testing and parallel simulations.
+When ``rng`` is omitted the global :mod:`random` module is used.
 """
 
 from __future__ import annotations
@@ -14,6 +16,7 @@ from typing import List
 from .data import load_items
 from .entity import Entity
 from .events import AttackResolved, Event, IntentTelegraphed, StatusApplied
+from .rng import RandomSource
 
 
 def calculate_hit(attacker: Entity, defender: Entity) -> int:
@@ -77,7 +80,9 @@ def calculate_damage(attacker: Entity, defender: Entity, critical: bool = False)
 # ---------------------------------------------------------------------------
 
 
-def resolve_attack(attacker: Entity, defender: Entity) -> AttackResolved:
+def resolve_attack(
+    attacker: Entity, defender: Entity, rng: RandomSource | None = None
+) -> AttackResolved:
     """Resolve a basic attack from ``attacker`` to ``defender``.
 
     Temporary status flags on the attacker may modify the outcome:
@@ -87,6 +92,8 @@ def resolve_attack(attacker: Entity, defender: Entity) -> AttackResolved:
       double damage on a successful hit. The flag is consumed.
     """
 
+    if rng is None:
+        rng = random
     heavy = "heavy" in attacker.status
     wild = "wild" in attacker.status
     if heavy:
@@ -97,17 +104,16 @@ def resolve_attack(attacker: Entity, defender: Entity) -> AttackResolved:
     hit = calculate_hit(attacker, defender)
     if wild:
         hit = max(0, hit - 20)
-    roll = random.randint(1, 100)
+    roll = rng.randint(1, 100)
     attack_val = attacker.stats.get("attack", 0)
     defense_val = defender.stats.get("defense", 0)
     if roll > hit:
-        msg = f"{attacker.name} misses {defender.name}."
         return AttackResolved(
-            msg, attacker.name, defender.name, 0, 0, attack_val, defense_val, False
+            None, attacker.name, defender.name, 0, False, attack_val, defense_val, False, False
         )
 
     crit_chance = calculate_crit(attacker, defender)
-    critical = random.randint(1, 100) <= crit_chance
+    critical = rng.randint(1, 100) <= crit_chance
 
     raw_damage = max(0, attack_val - defense_val)
     damage = raw_damage
@@ -120,24 +126,20 @@ def resolve_attack(attacker: Entity, defender: Entity) -> AttackResolved:
     base_damage = damage
     if heavy:
         damage = int(damage * 1.5)
-    if wild and random.randint(1, 100) >= 95:
+    if wild and rng.randint(1, 100) >= 95:
         damage *= 2
     if damage != base_damage:
         delta = damage - base_damage
         defender.stats["health"] = max(0, defender.stats.get("health", 0) - delta)
     defeated = int(not defender.is_alive())
-    if critical:
-        msg = f"{attacker.name} critically hits {defender.name} for {damage} damage."
-    else:
-        msg = f"{attacker.name} hits {defender.name} for {damage} damage."
-    if defeated:
-        msg += f" {defender.name} is defeated."
     return AttackResolved(
-        msg, attacker.name, defender.name, damage, defeated, attack_val, defense_val, critical
+        None, attacker.name, defender.name, damage, defeated, attack_val, defense_val, critical
     )
 
 
-def resolve_player_action(player: Entity, enemy: Entity, action: str) -> List[Event]:
+def resolve_player_action(
+    player: Entity, enemy: Entity, action: str, rng: RandomSource | None = None
+) -> List[Event]:
     """Resolve a player's ``action`` against ``enemy``.
 
     Parameters
@@ -149,11 +151,15 @@ def resolve_player_action(player: Entity, enemy: Entity, action: str) -> List[Ev
     action:
         Action keyword. Supported values are ``"attack"``, ``"defend"``,
         ``"use_health_potion"`` and ``"flee"``.
+    rng:
+        Random source for all rolls. Defaults to the global :mod:`random`.
     """
 
+    if rng is None:
+        rng = random
     events: List[Event] = []
     if action == "attack":
-        events.append(resolve_attack(player, enemy))
+        events.append(resolve_attack(player, enemy, rng))
     elif action == "defend":
         player.status.extend(["defend_damage", "defend_attack"])
         events.append(StatusApplied(f"{player.name} defends.", player.name, "defend", 1))
@@ -182,7 +188,7 @@ def resolve_player_action(player: Entity, enemy: Entity, action: str) -> List[Ev
     elif action == "flee":
         speed_diff = player.stats.get("speed", 0) - enemy.stats.get("speed", 0)
         chance = max(10, min(90, 40 + speed_diff * 5))
-        roll = random.randint(1, 100)
+        roll = rng.randint(1, 100)
         success = int(roll <= chance)
         if success:
             msg = f"{player.name} flees from {enemy.name}."
@@ -195,11 +201,14 @@ def resolve_player_action(player: Entity, enemy: Entity, action: str) -> List[Ev
     return events
 
 
-def resolve_enemy_turn(enemy: Entity, player: Entity) -> List[Event]:
+def resolve_enemy_turn(
+    enemy: Entity, player: Entity, rng: RandomSource | None = None
+) -> List[Event]:
     """Resolve the enemy's turn against ``player``.
 
     The enemy first telegraphs its intent then performs the action. If no intent
-    generator is provided the enemy defaults to a basic attack.
+    generator is provided the enemy defaults to a basic attack. Rolls are drawn
+    from ``rng`` as in :func:`resolve_player_action`.
     """
 
     if not enemy.is_alive():
@@ -220,17 +229,17 @@ def resolve_enemy_turn(enemy: Entity, player: Entity) -> List[Event]:
     events.append(IntentTelegraphed(message, enemy.name, action))
 
     if action == "attack":
-        events.append(resolve_attack(enemy, player))
+        events.append(resolve_attack(enemy, player, rng))
     elif action == "defend":
         enemy.status.extend(["defend_damage", "defend_attack"])
         events.append(StatusApplied(f"{enemy.name} defends.", enemy.name, "defend", 1))
     elif action == "heavy_attack":
         enemy.status.append("heavy")
-        events.append(resolve_attack(enemy, player))
+        events.append(resolve_attack(enemy, player, rng))
     elif action == "wild_attack":
         enemy.status.append("wild")
-        events.append(resolve_attack(enemy, player))
+        events.append(resolve_attack(enemy, player, rng))
     else:
-        events.append(resolve_attack(enemy, player))
+        events.append(resolve_attack(enemy, player, rng))
 
     return events
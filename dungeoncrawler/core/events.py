@@ -1,24 +1,64 @@
-"""Typed event objects produced by core game mechanics."""
+"""Typed event objects produced by core game mechanics.
+
+Events are slotted dataclasses.  An event either carries its text or leaves it
+as ``None`` and has it formatted from the class ``template`` when
+:attr:`Event.message` is first read; the formatted text is then stored in
+``text`` so later reads return it directly.  Producers that emit many events, like
+:func:`~dungeoncrawler.core.combat.resolve_attack`, use templates.  Batch
+simulations that never read the messages then never pay for formatting them.
+"""
 
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
 from .data import load_events
+from .rng import RandomSource
 
 EVENT_DATA = load_events()
 
+# ``slots=True`` needs Python 3.10; older interpreters get regular dataclasses.
+SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**SLOTS)
 class Event:
-    """Base class for all core events."""
+    """Base class for all core events.
+
+    Parameters
+    ----------
+    text:
+        Human readable text, or ``None`` to format it from ``template``.
+    """
 
-    message: str
+    text: Optional[str]
 
+    # ``str.format`` template applied to the event's fields.
+    template: ClassVar[str] = ""
 
-@dataclass
+    @property
+    def message(self) -> str:
+        """Return the human readable text of the event.
+
+        Templated events are formatted on the first read and the result is
+        kept in :attr:`text`.
+        """
+
+        text = self.text
+        if text is None:
+            text = self.text = self.render()
+        return text
+
+    def render(self) -> str:
+        """Format ``template`` with the event's fields."""
+
+        return self.template.format(**{f.name: getattr(self, f.name) for f in fields(self)})
+
+
+@dataclass(**SLOTS)
 class AttackResolved(Event):
     """Result of a combat attack action."""
 
@@ -29,9 +69,26 @@ class AttackResolved(Event):
     attack: int = 0
     defense: int = 0
     critical: bool = False
+    hit: bool = True
+
+    template: ClassVar[str] = "{attacker} hits {defender} for {damage} damage."
+    crit_template: ClassVar[str] = "{attacker} critically hits {defender} for {damage} damage."
+    miss_template: ClassVar[str] = "{attacker} misses {defender}."
+    defeated_template: ClassVar[str] = " {defender} is defeated."
+
+    def render(self) -> str:
+        if not self.hit:
+            template = self.miss_template
+        elif self.critical:
+            template = self.crit_template
+        else:
+            template = self.template
+        if self.defeated:
+            template += self.defeated_template
+        return template.format(attacker=self.attacker, defender=self.defender, damage=self.damage)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class StatusApplied(Event):
     """A temporary status was applied to an entity."""
 
@@ -41,7 +98,25 @@ class StatusApplied(Event):
     value: int = 0
 
 
-@dataclass
+@dataclass(**SLOTS)
+class StatusTicked(Event):
+    """An active status effect acted on an entity or wore off.
+
+    Without ``text`` the message is ``pattern`` formatted with ``name`` (the
+    target), ``remaining`` and ``damage``.
+    """
+
+    target: str
+    status: str
+    remaining: int = 0
+    damage: int = 0
+    pattern: str = ""
+
+    def render(self) -> str:
+        return self.pattern.format(name=self.target, remaining=self.remaining, damage=self.damage)
+
+
+@dataclass(**SLOTS)
 class IntentTelegraphed(Event):
     """An enemy revealed its next action before taking it."""
 
@@ -49,15 +124,17 @@ class IntentTelegraphed(Event):
     intent: str
 
 
-@dataclass
+@dataclass(**SLOTS)
 class TileDiscovered(Event):
     """A new map tile has been revealed to the player."""
 
     x: int
     y: int
 
+    template: ClassVar[str] = "Tile ({x},{y}) discovered"
 
-@dataclass
+
+@dataclass(**SLOTS)
 class ItemGained(Event):
     """An item was added to an entity's inventory."""
 
@@ -90,16 +167,22 @@ class Fountain:
     curse_chance: float = EVENT_DATA.get("fountain", {}).get("curse_chance", 0.1)
     rarity: str = EVENT_DATA.get("fountain", {}).get("rarity", "common")
 
-    def interact(self, player, action: str) -> List[Event]:
-        """Return a list of events produced by interacting with the fountain."""
+    def interact(self, player, action: str, rng: RandomSource | None = None) -> List[Event]:
+        """Return a list of events produced by interacting with the fountain.
+
+        Heal and blessing rolls are drawn from ``rng``, defaulting to the
+        global :mod:`random` module.
+        """
 
+        if rng is None:
+            rng = random
         events: List[Event] = []
         if self.uses <= 0:
             return [Event("The fountain is dry.")]
 
         action = action.lower()
         if action == "drink":
-            heal = int(random.randint(6, 10) * player.stats.get("heal_multiplier", 1))
+            heal = int(rng.randint(6, 10) * player.stats.get("heal_multiplier", 1))
             hp = player.stats.get("health", 0)
             max_hp = player.stats.get("max_health", hp)
             player.stats["health"] = min(max_hp, hp + heal)
@@ -112,7 +195,7 @@ class Fountain:
                     value=heal,
                 )
             )
-            roll = random.random()
+            roll = rng.random()
             if roll < self.bless_chance:
                 player.status.append("blessed")
                 events.append(
@@ -142,14 +225,16 @@ class Fountain:
         return events
 
 
-def handle_fountain(player, action: str, fountain: Optional[Fountain] = None) -> List[Event]:
+def handle_fountain(
+    player, action: str, fountain: Optional[Fountain] = None, rng: RandomSource | None = None
+) -> List[Event]:
     """Convenience wrapper around :class:`Fountain.interact`.
 
     ``fountain`` may be provided to persist remaining uses between calls.
     """
 
     fountain = fountain or Fountain()
-    return fountain.interact(player, action)
+    return fountain.interact(player, action, rng)
 
 
 @dataclass
@@ -3,27 +3,239 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass, field
-from typing import Any, List, Optional, Set, Tuple
+from itertools import compress
+from typing import Any, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from .events import TileDiscovered
 
 Tile = Optional[Any]
 
+# Number of set bits in each byte value, for ``bytes.translate`` popcounts.
+_POPCOUNT = bytes(bin(value).count("1") for value in range(256))
+
+
+class RowView(SequenceABC):
+    """Mutable view of row ``y`` of a packed grid that reads like a list.
+
+    Subclasses supply :meth:`_get` and :meth:`_set` for an in-range column;
+    the view resolves negative indices, raises :class:`IndexError` outside
+    ``0 <= x < grid.width`` and handles slices, iteration and comparison.
+    """
+
+    __slots__ = ("_grid", "_y")
+
+    def __init__(self, grid: Any, y: int) -> None:
+        self._grid = grid
+        self._y = y
+
+    def _get(self, x: int) -> Any:
+        raise NotImplementedError
+
+    def _set(self, x: int, value: Any) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def _index(self, x: int) -> int:
+        width = self._grid.width
+        if x < 0:
+            x += width
+        if not 0 <= x < width:
+            raise IndexError("row index out of range")
+        return x
+
+    def __getitem__(self, x: Union[int, slice]) -> Any:
+        if isinstance(x, slice):
+            return [self._get(i) for i in range(*x.indices(self._grid.width))]
+        return self._get(self._index(x))
+
+    def __setitem__(self, x: int, value: Any) -> None:
+        self._set(self._index(x), value)
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._get, range(self._grid.width))
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return list(self) == list(other)  # type: ignore[call-overload]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _BitRow(RowView):
+    """Mutable view of one :class:`BitGrid` row reading as ``bool`` values."""
+
+    __slots__ = ()
+
+    def _get(self, x: int) -> bool:
+        return self._grid.get(x, self._y)
+
+    def _set(self, x: int, value: bool) -> None:
+        self._grid.set(x, self._y, value)
+
+
+class BitGrid:
+    """Packed ``width × height`` boolean layer, one bit per cell.
+
+    Used for the fog-of-war ``visible`` and ``discovered`` layers.  ``grid[y][x]``
+    reads and writes like the nested ``bool`` lists it replaces, while
+    :meth:`clear` and :meth:`count` work on the packed bytes directly.
+    """
+
+    __slots__ = ("width", "height", "bits", "_zeros", "_rows")
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        size = (width * height + 7) // 8
+        self.bits = bytearray(size)
+        self._zeros = bytes(size)
+        self._rows = [_BitRow(self, y) for y in range(height)]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> "BitGrid":
+        """Build a layer from nested lists of truthy values."""
+
+        height = len(rows)
+        grid = cls(len(rows[0]) if height else 0, height)
+        for y, row in enumerate(rows):
+            for x, value in enumerate(row):
+                if value:
+                    grid.set(x, y)
+        return grid
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> _BitRow:
+        return self._rows[y]
+
+    def __iter__(self) -> Iterator[_BitRow]:
+        return iter(self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitGrid):
+            return self.width == other.width and self.bits == other.bits
+        try:
+            return self.to_lists() == [list(row) for row in other]  # type: ignore[attr-defined]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BitGrid({self.width}x{self.height}, {self.count()} set)"
+
+    def get(self, x: int, y: int) -> bool:
+        """Return whether ``(x, y)`` is set."""
+
+        index = y * self.width + x
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def row_mask(self, y: int) -> int:
+        """Return row ``y`` as an integer whose bit ``x`` is cell ``(x, y)``.
+
+        Reads the packed bytes in one slice, so callers that walk a whole row
+        avoid a view lookup per cell.
+        """
+
+        start = y * self.width
+        chunk = self.bits[start >> 3 : (start + self.width + 7) >> 3]
+        return (int.from_bytes(chunk, "little") >> (start & 7)) & ((1 << self.width) - 1)
+
+    def set(self, x: int, y: int, value: bool = True) -> None:
+        """Set or clear ``(x, y)``."""
+
+        index = y * self.width + x
+        if value:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def add(self, x: int, y: int) -> bool:
+        """Set ``(x, y)`` and return ``True`` if it was previously clear."""
+
+        return self.add_index(y * self.width + x)
+
+    def add_index(self, index: int) -> bool:
+        """Set the cell at row-major ``index`` and return whether it was clear."""
+
+        mask = 1 << (index & 7)
+        byte = self.bits[index >> 3]
+        if byte & mask:
+            return False
+        self.bits[index >> 3] = byte | mask
+        return True
+
+    def discard_index(self, index: int) -> None:
+        """Clear the cell at row-major ``index``."""
+
+        self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def indices(self) -> Set[int]:
+        """Return the row-major indices of every set cell."""
+
+        bits = self.bits
+        found: Set[int] = set()
+        for offset in compress(range(len(bits)), bits):
+            byte = bits[offset]
+            base = offset << 3
+            while byte:
+                low = byte & -byte
+                found.add(base + low.bit_length() - 1)
+                byte ^= low
+        return found
+
+    def clear(self) -> None:
+        """Clear every cell in place."""
+
+        self.bits[:] = self._zeros
+
+    def count(self) -> int:
+        """Return the number of set cells."""
+
+        return sum(self.bits.translate(_POPCOUNT))
+
+    def to_lists(self) -> List[List[bool]]:
+        """Return the layer as nested ``bool`` lists."""
+
+        return [list(row) for row in self._rows]
+
+
+def as_bitgrid(layer: Any, width: int, height: int) -> BitGrid:
+    """Return ``layer`` as a :class:`BitGrid` of the given size.
+
+    A matching :class:`BitGrid` is returned unchanged so callers can keep
+    updating it in place; nested lists are packed, and anything else yields an
+    empty layer.
+    """
+
+    if isinstance(layer, BitGrid):
+        if layer.width == width and layer.height == height:
+            return layer
+        return BitGrid(width, height)
+    if layer and len(layer) == height and len(layer[0]) == width:
+        return BitGrid.from_rows(layer)
+    return BitGrid(width, height)
+
 
 @dataclass
 class GameMap:
     """Grid based dungeon map with fog-of-war support."""
 
     grid: List[List[Tile]]
-    discovered: List[List[bool]] = field(init=False)
-    visible: List[List[bool]] = field(init=False)
+    discovered: BitGrid = field(init=False)
+    visible: BitGrid = field(init=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - simple initialisation
         height = len(self.grid)
         width = len(self.grid[0]) if height else 0
-        self.discovered = [[False for _ in range(width)] for _ in range(height)]
-        self.visible = [[False for _ in range(width)] for _ in range(height)]
+        self.discovered = BitGrid(width, height)
+        self.visible = BitGrid(width, height)
 
     # ------------------------------------------------------------------
     # Fog of war utilities
@@ -55,13 +267,16 @@ class GameMap:
         revealed during this update.
         """
 
-        self.visible = [[False for _ in row] for row in self.grid]
+        height = len(self.grid)
+        width = len(self.grid[0]) if height else 0
+        visible = self.visible = as_bitgrid(self.visible, width, height)
+        discovered = self.discovered = as_bitgrid(self.discovered, width, height)
+        visible.clear()
         events: List[TileDiscovered] = []
         for x, y in self.compute_visibility(px, py, radius):
-            self.visible[y][x] = True
-            if not self.discovered[y][x]:
-                self.discovered[y][x] = True
-                events.append(TileDiscovered(f"Tile ({x},{y}) discovered", x, y))
+            visible.set(x, y)
+            if discovered.add(x, y):
+                events.append(TileDiscovered(None, x, y))
         return events
 
 
@@ -81,7 +296,7 @@ def update_visibility(game) -> List[TileDiscovered]:
 
     gm = GameMap(game.rooms)
     gm.discovered = game.discovered
-    gm.visible = [[False for __ in range(game.width)] for __ in range(game.height)]
+    gm.visible = game.visible
     radius = 6 if getattr(game, "current_floor", 1) == 1 else 3 + game.current_floor // 2
     events = gm.update_visibility(game.player.x, game.player.y, radius)
     game.visible = gm.visible
@@ -0,0 +1,130 @@
+"""Per-game random number generation with named substreams.
+
+Every game session owns a :class:`RNGContext`.  Subsystems draw from their own
+named stream so, for example, an extra combat roll never shifts the layout of
+the next floor.  Streams of a seeded context are independent
+:class:`random.Random` instances derived from the run seed, which keeps
+concurrent games and parallel simulations reproducible without touching the
+global :mod:`random` state.
+
+An unseeded context hands out the global :mod:`random` module for every
+stream.  That preserves the historical behaviour of ad-hoc sessions and lets
+tests keep steering outcomes by patching functions on :mod:`random`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from types import ModuleType
+from typing import Dict, Optional, Union
+
+STREAMS = ("generation", "combat", "ai", "loot", "events")
+
+# Either a private generator or the global :mod:`random` module.
+RandomSource = Union[random.Random, ModuleType]
+
+
+def derive_seed(seed: int, *parts: object) -> int:
+    """Return a stable 64-bit seed derived from ``seed`` and ``parts``."""
+
+    text = ":".join(str(part) for part in (seed, *parts)).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(text).digest()[:8], "big")
+
+
+class RNGContext:
+    """Collection of named random streams for a single game or simulation.
+
+    Parameters
+    ----------
+    seed:
+        Run seed.  ``None`` makes every stream fall back to the global
+        :mod:`random` module.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """Restart every stream from ``seed``."""
+
+        self.seed = seed
+        self._streams.clear()
+
+    def stream(self, name: str) -> RandomSource:
+        """Return the generator for stream ``name``.
+
+        Raises
+        ------
+        KeyError
+            If ``name`` is not one of :data:`STREAMS`.
+        """
+
+        if name not in STREAMS:
+            raise KeyError(f"Unknown random stream: {name}")
+        if self.seed is None:
+            return random
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(derive_seed(self.seed, name))
+        return rng
+
+    def floor_stream(self, floor: int) -> RandomSource:
+        """Return a fresh generator for building ``floor``.
+
+        Each call restarts from a seed derived from the run seed and
+        ``floor``, so a floor's layout does not depend on anything drawn
+        before it and can be rebuilt, or built ahead of time, on its own.
+        Unseeded contexts return the global :mod:`random` module.
+        """
+
+        if self.seed is None:
+            return random
+        return random.Random(derive_seed(self.seed, "generation", floor))
+
+    @property
+    def generation(self) -> RandomSource:
+        """Stream for dungeon layout, room names and quests."""
+
+        return self.stream("generation")
+
+    @property
+    def combat(self) -> RandomSource:
+        """Stream for hit, crit and damage rolls."""
+
+        return self.stream("combat")
+
+    @property
+    def ai(self) -> RandomSource:
+        """Stream for enemy intent selection."""
+
+        return self.stream("ai")
+
+    @property
+    def loot(self) -> RandomSource:
+        """Stream for treasure and shop stock."""
+
+        return self.stream("loot")
+
+    @property
+    def events(self) -> RandomSource:
+        """Stream for floor events, riddles and traps."""
+
+        return self.stream("events")
+
+
+def stream_for(owner: object, name: str, default: RandomSource = random) -> RandomSource:
+    """Return stream ``name`` of ``owner.rng`` or ``default``.
+
+    Helpers that receive a game object use this so they also work with
+    lightweight stand-ins that carry no :class:`RNGContext`.
+    """
+
+    context = getattr(owner, "rng", None)
+    if isinstance(context, RNGContext):
+        return context.stream(name)
+    return default
+
+
+__all__ = ["RNGContext", "RandomSource", "STREAMS", "derive_seed", "stream_for"]
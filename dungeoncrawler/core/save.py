@@ -11,6 +11,15 @@ from ..constants import SAVE_FILE
 SCHEMA_VERSION = 1
 
 
+def _encode(value: Any) -> Any:
+    """Serialise packed grid layers as nested lists for :func:`json.dump`."""
+
+    to_lists = getattr(value, "to_lists", None)
+    if to_lists is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return to_lists()
+
+
 def save_game(state: Mapping[str, Any] | object) -> None:
     """Persist ``state`` to :data:`SAVE_FILE` using JSON.
 
@@ -28,7 +37,7 @@ def save_game(state: Mapping[str, Any] | object) -> None:
 
     data = {"version": SCHEMA_VERSION, "state": payload}
     with SAVE_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f)
+        json.dump(data, f, default=_encode)
 
 
 def load_game() -> Optional[Dict[str, Any]]:
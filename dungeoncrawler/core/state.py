@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from .map import GameMap
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
-    from ..entities import Player
+    from ..config import Config
+    from ..entities import Enemy, Player
 
 
 @dataclass
@@ -39,3 +40,29 @@ class GameState:
     def queue_message(self, message: str) -> None:
         """Append ``message`` to the log buffer."""
         self.log.append(message)
+
+    @property
+    def config(self) -> "Config":
+        """The active game configuration, as adjusted by floor hooks."""
+        from ..config import config
+
+        return config
+
+    @property
+    def enemies(self) -> List["Enemy"]:
+        """Enemies on the current floor, in placement order."""
+        from ..entities import Enemy
+        from ..grid import find_entities
+
+        return [enemy for enemy, __, __ in find_entities(self.game_map.grid, Enemy)]
+
+    @property
+    def elites(self) -> List["Enemy"]:
+        """Enemies on the current floor whose rarity is ``"elite"``."""
+        return [enemy for enemy in self.enemies if getattr(enemy, "rarity", "") == "elite"]
+
+    def find_enemy(self, name: str) -> Optional[Tuple["Enemy", int, int]]:
+        """Return ``(enemy, x, y)`` for the enemy called ``name`` or ``None``."""
+        from ..grid import find_enemy
+
+        return find_enemy(self.game_map.grid, name)
@@ -11,21 +11,28 @@ import time
 from functools import lru_cache
 from gettext import gettext as _
 from pathlib import Path
+from typing import Callable
 
 from . import combat as combat_module
 from . import data
 from . import map as map_module
 from . import shop as shop_module
-from .combat_log import CombatLog
+from .combat_log import COMBAT_EVENTS, CombatLog
 from .config import config
 from .constants import ANNOUNCER_LINES, INVALID_KEY_MSG, RIDDLES, RUN_FILE, SAVE_FILE, SCORE_FILE
-from .core import GameState
-from .core.map import GameMap
+from .core import GameState, RNGContext
+from .core.bus import EventBus
+from .core.map import BitGrid, GameMap
+from .core.rng import derive_seed
 from .data import FloorDefinition, load_items
 from .entities import SKILL_DEFS, Companion, Enemy, Player
 from .events import CacheEvent
+from .floor_cache import FloorCache, floor_key
+from .grid import RoomNames, TileGrid, find_tiles, open_cells
 from .items import Armor, Item, Trinket, Weapon
+from .pathfinding import Pathfinder
 from .plugins import apply_enemy_plugins, apply_item_plugins
+from .prefetch import FloorPrefetcher
 from .quests import EscortNPC, EscortQuest, FetchQuest, HuntQuest
 from .rendering import Renderer, render_map_string
 from .stats_logger import StatsLogger
@@ -80,9 +87,8 @@ LEADERBOARD_SORT_KEYS = {
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
-# Predefined word lists used for random room name generation. Keeping them at
-# module scope avoids recreating the lists on every call to
-# ``generate_room_name`` which occurs hundreds of times per floor.
+# Word lists room names are drawn from.  :class:`~dungeoncrawler.grid.RoomNames`
+# picks one of each per cell by hashing the floor's name seed.
 ROOM_NAME_ADJECTIVES = [
     "Collapsed",
     "Echoing",
@@ -295,22 +301,26 @@ class DungeonBase:
     def __init__(self, width, height, seed: int | None = None):
         self.width = width
         self.height = height
-        if seed is not None:
-            random.seed(seed)
-        self.random = random
-        map_module.random = self.random
+        self.rng = RNGContext(seed)
         self.seed = seed
-        self.rooms = [[None for __ in range(width)] for __ in range(height)]
-        self.room_names = [
-            [self.generate_room_name() for __ in range(width)] for __ in range(height)
-        ]
+        self.rooms = TileGrid(width, height)
+        names_seed = random.getrandbits(64) if seed is None else derive_seed(seed, "room_names")
+        self.room_names = self.room_name_layer(width, height, names_seed)
         self.visited_rooms = set()
-        self.discovered = [[False for __ in range(width)] for __ in range(height)]
-        self.visible = [[False for __ in range(width)] for __ in range(height)]
+        self.discovered = BitGrid(width, height)
+        self.visible = BitGrid(width, height)
+        # Cells lit by the last visibility update, see ``map.update_visibility``.
+        self.lit_cells = None
+        # Walking distances and free cells from the floor's start, set by
+        # ``map.generate_dungeon``.
+        self.distance_field = None
+        self._pathfinder: Pathfinder | None = None
         self.player = None
         self.exit_coords = None
         self.tutorial_complete = False
-        self.shop_items, self.rare_loot = load_items()
+        # ``load_items`` is cached; copy its lists before extending them.
+        shop_items, rare_loot = load_items()
+        self.shop_items, self.rare_loot = list(shop_items), list(rare_loot)
         apply_item_plugins(self.shop_items)
         self.shop_items.extend(
             [
@@ -387,6 +397,11 @@ class DungeonBase:
         self.combat_log = CombatLog()
         self.messages: list[str] = []
         self.renderer = Renderer()
+        # Combat and status events reach whichever log and renderer the game
+        # currently holds; see :mod:`dungeoncrawler.core.bus`.
+        self.event_bus = EventBus()
+        self.event_bus.subscribe(self._log_event, *COMBAT_EVENTS)
+        self.event_bus.subscribe(self._render_event)
         # Schedule the first shop to appear on floor 2
         self.next_shop_floor = 2
         self.floor_hooks: list[FloorHooks] = [FloorHooks()]
@@ -395,6 +410,24 @@ class DungeonBase:
         # Track whether late-game scaling has been applied to avoid stacking
         self._tier_two_scaled = False
         self._base_trap_chance = config.trap_chance
+        # Answers interactive prompts; ``None`` reads from stdin.  Headless
+        # runners install a callable here instead of patching ``input``.
+        self.input_func: Callable[[str], str] | None = None
+        # Whether saves, scores and run statistics are written to disk.
+        self.persistent = True
+        # Seeded runs build the next floor on a worker thread while the
+        # current one is played; see :mod:`dungeoncrawler.prefetch`.
+        self.prefetch_floors = True
+        self.floor_prefetcher = FloorPrefetcher()
+        # Optional on-disk cache of generated floors keyed by seed, floor and
+        # configuration; see :mod:`dungeoncrawler.floor_cache`.
+        self.floor_cache: FloorCache | None = None
+
+    def _log_event(self, event) -> None:
+        self.combat_log.handle_event(event)
+
+    def _render_event(self, event) -> None:
+        self.renderer.handle_event(event)
 
     def queue_message(self, text: str, output_func=print):
         """Store ``text`` for later rendering and optionally display it."""
@@ -406,8 +439,23 @@ class DungeonBase:
             output_func(text)
         return text
 
+    def prompt(self, text: str) -> str:
+        """Return the player's answer to ``text`` using :attr:`input_func`."""
+
+        return (self.input_func or input)(text)
+
+    def run_event(self, event, output_func=None) -> None:
+        """Trigger ``event``, routing its prompts through :attr:`input_func` when set."""
+
+        kwargs = {}
+        if self.input_func is not None:
+            kwargs["input_func"] = self.input_func
+        if output_func is not None:
+            kwargs["output_func"] = output_func
+        event.trigger(self, **kwargs)
+
     def announce(self, msg):
-        self.queue_message(_(f"[Announcer] {self.random.choice(ANNOUNCER_LINES)} {msg}"))
+        self.queue_message(_(f"[Announcer] {self.rng.events.choice(ANNOUNCER_LINES)} {msg}"))
 
     def _make_state(self, floor: int) -> GameState:
         """Construct a :class:`GameState` snapshot for hooks."""
@@ -425,6 +473,9 @@ class DungeonBase:
         )
 
     def save_game(self, floor):
+        if not self.persistent:
+            return
+
         def serialize_item(item):
             if item is None:
                 return None
@@ -489,6 +540,16 @@ class DungeonBase:
             logger.exception("Failed to save game to %s", SAVE_FILE)
             self.renderer.show_message(_("Failed to save game."))
 
+    def delete_save(self) -> None:
+        """Remove the save file, typically once a run has ended."""
+
+        if not self.persistent or not os.path.exists(SAVE_FILE):
+            return
+        try:
+            os.remove(SAVE_FILE)
+        except OSError:
+            logger.exception("Failed to remove save file %s", SAVE_FILE)
+
     def load_game(self):
         if os.path.exists(SAVE_FILE):
             try:
@@ -590,6 +651,8 @@ class DungeonBase:
         self.run_stats["total_runs"] = self.total_runs
         self.run_stats["unlocks"] = self.unlocks
         self.run_stats["max_floor"] = self.max_floor
+        if not self.persistent:
+            return
         try:
             with open(RUN_FILE, "w") as f:
                 json.dump(self.run_stats, f)
@@ -604,7 +667,7 @@ class DungeonBase:
         self.save_run_stats()
 
         records = []
-        if os.path.exists(SCORE_FILE):
+        if self.persistent and os.path.exists(SCORE_FILE):
             try:
                 with open(SCORE_FILE) as f:
                     records = json.load(f)
@@ -635,6 +698,8 @@ class DungeonBase:
                 "timestamp": now,
             }
         )
+        if not self.persistent:
+            return
         # Keep the last 100 entries to prevent the file from growing indefinitely.
         records = records[-100:]
         try:
@@ -645,7 +710,7 @@ class DungeonBase:
 
         # Use a dummy input function when running in a non-interactive
         # environment so tests do not block waiting for keyboard input.
-        input_func = input if sys.stdin.isatty() else (lambda _: "1")
+        input_func = self.input_func or (input if sys.stdin.isatty() else (lambda _: "1"))
         try:
             self.view_leaderboard(records, input_func=input_func)
         except (OSError, EOFError):
@@ -653,7 +718,7 @@ class DungeonBase:
             # showing the interactive leaderboard in that case.
             pass
 
-    def view_leaderboard(self, records=None, input_func=input, sort_by: str = "score"):
+    def view_leaderboard(self, records=None, input_func=None, sort_by: str = "score"):
         """Display leaderboard entries stored on disk.
 
         Parameters
@@ -701,7 +766,7 @@ class DungeonBase:
         # Prompt for a class if the player has not yet chosen one.
         self.offer_class(input_func=input_func)
 
-    def offer_class(self, input_func=input):
+    def offer_class(self, input_func=None):
         """Allow the player to choose a class.
 
         The choice is permanent and only offered on floor 1 while the player is
@@ -716,6 +781,8 @@ class DungeonBase:
             self.save_run_stats()
         if self.player.class_type != "Novice":
             return
+        if input_func is None:
+            input_func = self.prompt
 
         print(_("It's time to choose your class! This choice is permanent."))
         classes = {
@@ -768,7 +835,7 @@ class DungeonBase:
         if self.player.guild:
             return
         if input_func is None:
-            input_func = input
+            input_func = self.prompt
         print(_("Guilds now accept new members! This choice is permanent."))
         guilds = {
             "1": ("Warriors' Guild", _("Bonus Health")),
@@ -795,7 +862,7 @@ class DungeonBase:
         if self.player.race:
             return
         if input_func is None:
-            input_func = input
+            input_func = self.prompt
         print(_("New races are available to you! This choice is permanent."))
         races = {
             "1": ("Human", _("Versatile")),
@@ -816,21 +883,22 @@ class DungeonBase:
         if race:
             self.player.choose_race(race[0])
 
-    def generate_room_name(self, room_type=None):
-        names = {
-            "Treasure": "Glittering Vault",
-            "Trap": "Booby-Trapped Passage",
-            "Enemy": "Cursed Hall",
-            "Exit": "Sealed Gate",
-            "Key": "Hidden Niche",
-            "Sanctuary": "Sacred Sanctuary",
-            "Empty": "Silent Chamber",
-        }
+    @property
+    def pathfinder(self) -> Pathfinder:
+        """Cached :class:`~dungeoncrawler.pathfinding.Pathfinder` for :attr:`rooms`.
 
-        if room_type in names:
-            return names[room_type]
+        A new one is made when :attr:`rooms` is replaced, i.e. once per floor.
+        """
 
-        return f"{self.random.choice(ROOM_NAME_ADJECTIVES)} {self.random.choice(ROOM_NAME_NOUNS)}"
+        finder = self._pathfinder
+        if finder is None or finder.rooms is not self.rooms:
+            finder = self._pathfinder = Pathfinder(self.rooms)
+        return finder
+
+    def room_name_layer(self, width: int, height: int, seed: int) -> RoomNames:
+        """Return the room names of a ``width`` x ``height`` floor derived from ``seed``."""
+
+        return RoomNames(width, height, seed, ROOM_NAME_ADJECTIVES, ROOM_NAME_NOUNS)
 
     def generate_dungeon(self, floor=1):
         """Generate the dungeon layout for ``floor`` and persist progress.
@@ -840,6 +908,10 @@ class DungeonBase:
         now hook in a call to :meth:`save_game` after generation.  This mirrors
         how the interactive game behaves and ensures the tests have access to a
         freshly saved state whenever a new floor is created.
+
+        A floor prepared in the background by :attr:`floor_prefetcher` is
+        swapped in when it was built from the same seed and settings, and
+        building ``floor + 1`` starts once this floor is in place.
         """
 
         # Compute per-floor enemy scaling.  Each floor adds a small bump to
@@ -847,19 +919,15 @@ class DungeonBase:
         # the dungeon (floor 10 and beyond) a one-time "hard band" further
         # boosts difficulty.  The debug flag disables all automatic scaling to
         # keep deterministic values for tests.
+        settings = self._floor_settings(floor)
         if not config.enable_debug:
-            config.enemy_hp_mult = 1 + 0.05 * (floor - 1)
-            config.enemy_dmg_mult = 1 + 0.04 * (floor - 1)
-            if floor >= 10:
-                config.enemy_hp_mult += 0.15
-                config.enemy_dmg_mult += 0.10
-                if not self._tier_two_scaled:
-                    self._tier_two_scaled = True
+            config.enemy_hp_mult = settings.enemy_hp_mult
+            config.enemy_dmg_mult = settings.enemy_dmg_mult
+            if floor >= map_module.HARD_BAND_FLOOR and not self._tier_two_scaled:
+                self._tier_two_scaled = True
 
         # Apply high floor debuffs
-        config.trap_chance = self._base_trap_chance
-        if floor >= 11:
-            config.trap_chance += 0.2
+        config.trap_chance = settings.trap_chance
         self.player.heal_multiplier = 0.5 if floor >= 10 else 1.0
         if floor >= 10:
             # A sandstorm blankets the high floors, limiting sight to four tiles.
@@ -870,32 +938,80 @@ class DungeonBase:
         else:
             self.player.vision = 6 if floor == 1 else 3 + floor // 2
 
-        map_module.generate_dungeon(self, floor)
+        layout = self.floor_prefetcher.take((self.rng.seed, floor, settings))
+        if layout is None:
+            layout = self._build_floor(floor, settings)
+        map_module.install_floor(self, layout)
         self.generate_quest(floor)
         # Persist progress so players can safely quit between floors
         self.save_game(floor)
+        self._prefetch_floor(floor + 1)
+
+    def _floor_settings(self, floor: int) -> map_module.FloorSettings:
+        """Return the configuration :meth:`generate_dungeon` uses for ``floor``."""
+
+        if config.enable_debug:
+            hp_mult, dmg_mult = config.enemy_hp_mult, config.enemy_dmg_mult
+        else:
+            hp_mult, dmg_mult = map_module.floor_multipliers(floor)
+        trap_chance = self._base_trap_chance
+        if floor >= 11:
+            trap_chance += 0.2
+        return map_module.FloorSettings(hp_mult, dmg_mult, trap_chance, config.loot_mult)
+
+    def _prefetch_floor(self, floor: int) -> None:
+        """Start building ``floor`` in the background for seeded runs.
+
+        Unseeded games draw from the global :mod:`random` module, whose
+        sequence a worker thread would disturb, so they generate on demand.
+        """
+
+        if not self.prefetch_floors or self.rng.seed is None or floor not in self.floor_configs:
+            return
+        settings = self._floor_settings(floor)
+        self.floor_prefetcher.start(
+            (self.rng.seed, floor, settings), lambda: self._build_floor(floor, settings)
+        )
+
+    def _build_floor(
+        self, floor: int, settings: map_module.FloorSettings
+    ) -> map_module.FloorLayout:
+        """Build ``floor``, going through :attr:`floor_cache` for seeded runs."""
+
+        cache = self.floor_cache
+        key = floor_key(self, floor, settings) if cache is not None else None
+        if key is None:
+            return map_module.build_floor(self, floor, settings=settings)
+        layout = cache.get(key, self)
+        if layout is None:
+            layout = map_module.build_floor(self, floor, settings=settings)
+            cache.put(key, layout, self)
+        return layout
 
     def generate_quest(self, floor):
         """Create a simple quest for the current floor."""
 
         self.active_quest = None
         start = (self.player.x, self.player.y)
-        empty = [
-            (x, y)
-            for y in range(self.height)
-            for x in range(self.width)
-            if self.rooms[y][x] == "Empty"
-        ]
+        empty = find_tiles(self.rooms, "Empty")
         if not empty:
             return
-        qtype = self.random.choice(["fetch", "hunt", "escort"])
-        self.random.shuffle(empty)
+        rng = self.rng.generation
+        qtype = rng.choice(["fetch", "hunt", "escort"])
+        rng.shuffle(empty)
+        field = self.distance_field
+        if field is None or field.origin != start:
+            field = self.distance_field = map_module.DistanceField(
+                open_cells(self.rooms), start, empty, limit=map_module.NEAR_START_STEPS
+            )
         if qtype == "fetch":
             item = Item("Ancient Relic", "A quest item")
-            candidates = [
-                pos for pos in empty if abs(pos[0] - start[0]) + abs(pos[1] - start[1]) <= 15
-            ]
-            loc = candidates[0] if candidates else empty[0]
+            loc = field.take_within(
+                map_module.NEAR_START_STEPS,
+                rng,
+                lambda pos: self.rooms[pos[1]][pos[0]] == "Empty",
+            )
+            loc = loc or empty[0]
             self.rooms[loc[1]][loc[0]] = [CacheEvent(), item]
             self.active_quest = FetchQuest(
                 item,
@@ -904,14 +1020,14 @@ class DungeonBase:
                 flavor=_("A whisper speaks of a hidden cache."),
             )
         elif qtype == "hunt":
-            name = self.random.choice(list(self.enemy_stats.keys()))
+            name = rng.choice(list(self.enemy_stats.keys()))
             hp_min, hp_max, atk_min, atk_max, defense = self.enemy_stats[name]
             enemy = Enemy(
                 name,
                 hp_max + floor * 2,
                 atk_max + floor * 2,
                 defense + floor // 2,
-                self.random.randint(30, 60),
+                rng.randint(30, 60),
                 traits=self.enemy_traits.get(name),
             )
             enemy.xp = max(5, (enemy.health + enemy.attack_power + enemy.defense) // 15)
@@ -933,6 +1049,7 @@ class DungeonBase:
                 reward=50,
                 flavor=_("A traveler seeks safe passage to the exit."),
             )
+        field.discard(loc)
 
     def check_quest_progress(self):
         """Update and resolve the active quest."""
@@ -959,14 +1076,16 @@ class DungeonBase:
         elif isinstance(quest, EscortQuest):
             npc = quest.npc
             if not npc.following:
-                dist = abs(npc.x - self.player.x) + abs(npc.y - self.player.y)
-                if dist <= 5:
-                    step_x = 1 if self.player.x > npc.x else -1 if self.player.x < npc.x else 0
-                    step_y = 1 if self.player.y > npc.y else -1 if self.player.y < npc.y else 0
+                # Walk one step along the corridors once the player is within
+                # five steps, never onto a wall or an occupied room.
+                player_pos = (self.player.x, self.player.y)
+                step = self.pathfinder.step_toward((npc.x, npc.y), player_pos, limit=5)
+                if step is not None and (
+                    step == player_pos or self.rooms[step[1]][step[0]] == "Empty"
+                ):
                     self.rooms[npc.y][npc.x] = "Empty"
-                    npc.x += step_x
-                    npc.y += step_y
-                    if (npc.x, npc.y) == (self.player.x, self.player.y):
+                    npc.x, npc.y = step
+                    if step == player_pos:
                         npc.following = True
                     else:
                         self.rooms[npc.y][npc.x] = npc
@@ -983,7 +1102,7 @@ class DungeonBase:
         if self.player is None:
             floor = self.load_game()
             if self.player:
-                cont = input(_("Continue your last adventure? (y/n): "))
+                cont = self.prompt(_("Continue your last adventure? (y/n): "))
                 if cont.lower() != "y":
                     self.player = None
                     floor = 1
@@ -992,8 +1111,8 @@ class DungeonBase:
         if self.player is None:
             raise ValueError("Player must be created before starting the game.")
         # Begin a new run with a fresh seed and timestamp
-        self.seed = self.random.randrange(2**32)
-        self.random.seed(self.seed)
+        self.seed = self.rng.generation.randrange(2**32)
+        self.rng.reseed(self.seed)
         self.run_start = time.time()
         self.renderer.show_message(_("Welcome to Dungeon Crawler!"))
         while self.player.is_alive() and floor <= 18:
@@ -1032,7 +1151,7 @@ class DungeonBase:
                         "5. Visit Shop 6. Inventory 7. Quit 8. Show Map 9. View Leaderboard"
                     )
                 )
-                choice = input(_("Action: "))
+                choice = self.prompt(_("Action: "))
                 if not self.handle_input(choice):
                     self.stats_logger.finalize(self, self.player.cause_of_death or "Quit")
                     return
@@ -1054,11 +1173,7 @@ class DungeonBase:
         )
         self.record_score(floor, died=True)
         self.stats_logger.finalize(self, self.player.cause_of_death or "Unknown")
-        if os.path.exists(SAVE_FILE):
-            try:
-                os.remove(SAVE_FILE)
-            except OSError:
-                logger.exception("Failed to remove save file %s", SAVE_FILE)
+        self.delete_save()
 
     def handle_input(self, choice: str) -> bool:
         """Handle a menu ``choice`` from the player.
@@ -1092,7 +1207,7 @@ class DungeonBase:
             self.renderer.show_message(_("Thanks for playing!"))
             return False
         elif choice == "8":
-            self.view_map()
+            self.view_map(input_func=self.input_func)
             self.last_action = "other"
         elif choice == "9":
             self.view_leaderboard()
@@ -1231,14 +1346,15 @@ class DungeonBase:
                 return floor, False
 
         if (
-            self.player.x == self.exit_coords[0]
+            self.exit_coords is not None
+            and self.player.x == self.exit_coords[0]
             and self.player.y == self.exit_coords[1]
             and self.player.has_item("Key")
         ):
             self.renderer.show_message(_("You reach the Sealed Gate."))
             if floor == 9:
                 prompt = _("Retire for score or Descend (r/d): ")
-                choice = input(prompt).strip().lower()
+                choice = self.prompt(prompt).strip().lower()
                 if choice.startswith("d"):
                     self.player.decay_wounds()
                     floor += 1
@@ -1249,11 +1365,7 @@ class DungeonBase:
                     return floor, False
                 self.renderer.show_message(_("You retire from the dungeon."))
                 self.record_score(floor)
-                if os.path.exists(SAVE_FILE):
-                    try:
-                        os.remove(SAVE_FILE)
-                    except OSError:
-                        logger.exception("Failed to remove save file %s", SAVE_FILE)
+                self.delete_save()
                 return floor, None
             elif floor == 18:
                 keys = sum(
@@ -1262,20 +1374,19 @@ class DungeonBase:
                 slots = self.floor_configs.get(18, {}).get("boss_slots", 1)
                 if keys < slots:
                     proceed = (
-                        input(_("Exit the dungeon or continue fighting? (y/n): ")).strip().lower()
+                        self.prompt(_("Exit the dungeon or continue fighting? (y/n): "))
+                        .strip()
+                        .lower()
                     )
                     if proceed != "y":
                         return floor, True
                 self.player.score_buff += keys * 100
                 self.record_score(floor)
-                if os.path.exists(SAVE_FILE):
-                    try:
-                        os.remove(SAVE_FILE)
-                    except OSError:
-                        logger.exception("Failed to remove save file %s", SAVE_FILE)
+                self.delete_save()
                 return floor, None
             else:
-                proceed = input(_("Would you like to descend to the next floor? (y/n): ")).lower()
+                proceed = self.prompt(_("Would you like to descend to the next floor? (y/n): "))
+                proceed = proceed.lower()
                 if proceed == "y":
                     self.player.decay_wounds()
                     floor += 1
@@ -1288,11 +1399,7 @@ class DungeonBase:
                 self.renderer.show_message(_("You chose to exit the dungeon."))
 
             self.record_score(floor)
-            if os.path.exists(SAVE_FILE):
-                try:
-                    os.remove(SAVE_FILE)
-                except OSError:
-                    logger.exception("Failed to remove save file %s", SAVE_FILE)
+            self.delete_save()
             return floor, None
 
         return floor, True
@@ -1323,20 +1430,21 @@ class DungeonBase:
         map_module.handle_room(self, x, y)
 
     def battle(self, enemy):
-        combat_module.battle(self, enemy)
+        combat_module.battle(self, enemy, input_func=self.input_func)
 
     def audience_gift(self):
-        if self.random.random() < 0.1:
+        rng = self.rng.events
+        if rng.random() < 0.1:
             self.renderer.show_message(
                 _("A package falls from above! It's a gift from the audience.")
             )
-            if self.random.random() < 0.5:
+            if rng.random() < 0.5:
                 item = Item("Health Potion", "Restores 20 health")
                 self.player.collect_item(item)
                 self.renderer.show_message(_(f"You received a {item.name}."))
                 self.announce(f"{self.player.name} gains a helpful item!")
             else:
-                damage = self.random.randint(5, 15)
+                damage = rng.randint(5, 15)
                 self.player.take_damage(damage, source="Audience Gift")
                 self.renderer.show_message(_(f"Uh-oh! It explodes and deals {damage} damage."))
                 self.announce("The crowd loves a good prank!")
@@ -1345,8 +1453,8 @@ class DungeonBase:
         """Give the player a temporary inspire buff."""
         self.player.status_effects["inspire"] = turns
 
-    def shop(self, input_func=input, output_func=print):
-        shop_module.shop(self, input_func=input_func, output_func=output_func)
+    def shop(self, input_func=None, output_func=print):
+        shop_module.shop(self, input_func=input_func or self.prompt, output_func=output_func)
 
     def restock_shop(self, count: int = 4) -> None:
         """Refresh the available shop inventory."""
@@ -1357,22 +1465,24 @@ class DungeonBase:
         base = self.shop_items[:1]
         pool = self.shop_items[1:]
         k = min(max(0, count - len(base)), len(pool))
-        self.shop_inventory = base + self.random.sample(pool, k)
+        self.shop_inventory = base + self.rng.loot.sample(pool, k)
 
     def get_sale_price(self, item):
         return shop_module.get_sale_price(item)
 
-    def sell_items(self, input_func=input, output_func=print):
-        shop_module.sell_items(self, input_func=input_func, output_func=output_func)
+    def sell_items(self, input_func=None, output_func=print):
+        shop_module.sell_items(self, input_func=input_func or self.prompt, output_func=output_func)
 
-    def show_inventory(self, input_func=input, output_func=print):
-        shop_module.show_inventory(self, input_func=input_func, output_func=output_func)
+    def show_inventory(self, input_func=None, output_func=print):
+        shop_module.show_inventory(
+            self, input_func=input_func or self.prompt, output_func=output_func
+        )
 
     def riddle_challenge(self):
         """Present the player with a riddle for a potential reward."""
-        riddle, answer = self.random.choice(self.riddles)
+        riddle, answer = self.rng.events.choice(self.riddles)
         print(_("A sage poses a riddle:\n") + riddle)
-        response = input(_("Answer: ")).strip().lower()
+        response = self.prompt(_("Answer: ")).strip().lower()
         if response == answer:
             reward = 50
             print(_(f"Correct! You receive {reward} credits."))
@@ -1399,16 +1509,16 @@ class DungeonBase:
 
             # Fall back to the unweighted list if weights produced an empty pool
             pool = weighted_events or events
-            event_cls = self.random.choice(pool)
+            event_cls = self.rng.events.choice(pool)
             event = event_cls()
-            event.trigger(self)
+            self.run_event(event)
 
     def trigger_signature_event(self) -> None:
         """Select and trigger one signature event from the curated pool."""
         if not self.signature_events:
             return
-        event_cls = self.random.choice(self.signature_events)
-        event_cls().trigger(self)
+        event_cls = self.rng.events.choice(self.signature_events)
+        self.run_event(event_cls())
 
     # Floor-specific events keep gameplay varied without hardcoding logic in
     # play_game. Additional floors can be added here easily.
@@ -1422,7 +1532,7 @@ class DungeonBase:
             print(_("A traveling merchant sets up shop."))
             self.restock_shop()
             self.shop()
-            self.next_shop_floor = floor + self.random.randint(2, 3)
+            self.next_shop_floor = floor + self.rng.loot.randint(2, 3)
 
         events = {
             1: self._floor_one_event,
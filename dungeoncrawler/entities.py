@@ -5,11 +5,11 @@ from __future__ import annotations
 import json
 import random
 from functools import lru_cache
-from gettext import gettext as _
 from pathlib import Path
 
 from .config import config
 from .constants import ANNOUNCER_LINES
+from .i18n import gettext as _
 from .items import RARITY_MODIFIERS, Armor, Augment, Item, Trinket, Weapon
 from .status_effects import add_status_effect, adjust_skill_cost
 from .status_effects import apply_status_effects as apply_effects
@@ -196,6 +196,16 @@ RACE_DEFS = {
 
 
 class Entity:
+    # Random source for this entity's rolls. Games bind it to the ``combat``
+    # stream of their RNGContext; standalone entities share the global module.
+    rng = random
+    # Event bus status effect messages are published on. Battles bind the
+    # game's bus; unbound entities print them instead.
+    event_bus = None
+    # Receives every message the entity writes.  Headless callers such as
+    # the arena swap in a sink that drops them.
+    output_func = print
+
     def __init__(self, name, description):
         self.name = name
         self.description = description
@@ -296,14 +306,14 @@ class Player(Entity):
         self.base_max_health = self.max_health
         self.health = self.max_health
         if announce:
-            print(_(f"Class selected: {self.class_type}."))
+            self.output_func(_(f"Class selected: {self.class_type}."))
 
     def is_alive(self):
         return self.health > 0
 
     def collect_item(self, item):
         if len(self.inventory) >= self.inventory_limit:
-            print(
+            self.output_func(
                 _(
                     f"Backpack full ({self.inventory_limit}/{self.inventory_limit}). "
                     "Drop something with [D]."
@@ -406,14 +416,14 @@ class Player(Entity):
                 break
             if isinstance(item, Item) and item.name == "Fountain Water":
                 potion = item
-                heal = random.randint(4, 6)
+                heal = self.rng.randint(4, 6)
                 break
         if potion:
             self.inventory.remove(potion)
             healed_amount = self.heal(heal)
-            print(_(f"You used a {potion.name} and gained {healed_amount} health."))
+            self.output_func(_(f"You used a {potion.name} and gained {healed_amount} health."))
         else:
-            print(_("You don't have a Health Potion to use."))
+            self.output_func(_("You don't have a Health Potion to use."))
 
     def use_item(self, name: str):
         item = None
@@ -422,33 +432,33 @@ class Player(Entity):
                 item = obj
                 break
         if not item:
-            print(_(f"You don't have a {name} to use."))
+            self.output_func(_(f"You don't have a {name} to use."))
             return False
         failed = cleansing_fails(self)
         if name == "Scent-mask Spray" or name == "Absorbent Gel":
             if not failed:
                 self.status_effects.pop("blood_torrent", None)
                 self.status_effects.pop("blood_scent", None)
-                print(_("Your scent is masked."))
+                self.output_func(_("Your scent is masked."))
             else:
-                print(_("The anti-magic field suppresses the item!"))
+                self.output_func(_("The anti-magic field suppresses the item!"))
         elif name == "Anti-Nausea Draught":
             if not failed:
                 if "compression_sickness" in self.status_effects:
                     del self.status_effects["compression_sickness"]
                     self.speed = getattr(self, "_compression_prev_speed", self.speed)
                     setattr(self, "_compression_sickness_applied", False)
-                print(_("You steady your stomach."))
+                self.output_func(_("You steady your stomach."))
             else:
-                print(_("The anti-magic field suppresses the item!"))
+                self.output_func(_("The anti-magic field suppresses the item!"))
         elif name == "Entropy Vent Stone":
             if not failed:
                 self.status_effects.pop("entropic_debt", None)
-                print(_("The stone dissipates your entropic debt."))
+                self.output_func(_("The stone dissipates your entropic debt."))
             else:
-                print(_("The anti-magic field suppresses the item!"))
+                self.output_func(_("The anti-magic field suppresses the item!"))
         else:
-            print(_("Nothing happens."))
+            self.output_func(_("Nothing happens."))
         self.inventory.remove(item)
         return True
 
@@ -461,11 +471,13 @@ class Player(Entity):
 
         base_chance = 40 + (self.speed - enemy.speed) * 5
         escape_chance = max(10, min(90, base_chance))
-        roll = random.randint(1, 100)
+        roll = self.rng.randint(1, 100)
         if roll <= escape_chance:
-            print(_("You successfully disengage!"))
+            self.output_func(_("You successfully disengage!"))
             return True
-        print(_(f"You try to disengage, but the {enemy.name} pins you (they gain advantage!)."))
+        self.output_func(
+            _(f"You try to disengage, but the {enemy.name} pins you (they gain advantage!).")
+        )
         enemy.status_effects["advantage"] = 1
         return False
 
@@ -481,7 +493,7 @@ class Player(Entity):
             # Guard bonus consumed once you swing
             self.guard_attack = False
             self.status_effects.pop("guard", None)
-            print(_("Your steady stance improves your aim (+10% hit)."))
+            self.output_func(_("Your steady stance improves your aim (+10% hit)."))
         if getattr(self, "novice_luck_active", False):
             hit_chance += 10
         if "blessed" in self.status_effects:
@@ -490,7 +502,7 @@ class Player(Entity):
             hit_chance -= 5
         if "beetle_bane" in self.status_effects and "beetle" in enemy.name.lower():
             hit_chance += 5
-        roll = random.randint(1, 100)
+        roll = self.rng.randint(1, 100)
         base = self.calculate_damage()
         str_bonus = getattr(self, "temp_strength", 0)
         damage = base + str_bonus
@@ -501,29 +513,31 @@ class Player(Entity):
             self.apply_weapon_effect(enemy)
             enemy.take_damage(damage)
             if config.verbose_combat:
-                print(
+                self.output_func(
                     _(
                         f"You swing ({hit_chance}% to hit): roll {roll} → HIT. "
                         f"Damage {damage} ({base} base +{str_bonus} STR)."
                     )
                 )
             else:
-                print(_(f"You hit the {enemy.name} for {damage} damage."))
+                self.output_func(_(f"You hit the {enemy.name} for {damage} damage."))
             if not enemy.is_alive():
                 self.process_enemy_defeat(enemy)
         else:
             if config.verbose_combat:
                 reason = "It slipped on the wet stone!"
-                print(_(f"You swing ({hit_chance}% to hit): roll {roll} → MISS. {reason}"))
+                self.output_func(
+                    _(f"You swing ({hit_chance}% to hit): roll {roll} → MISS. {reason}")
+                )
             else:
-                print(_(f"You missed the {enemy.name}."))
+                self.output_func(_(f"You missed the {enemy.name}."))
 
     def calculate_damage(self) -> int:
         """Return the damage dealt by the player's current attack."""
         if self.weapon:
-            base = random.randint(self.weapon.min_damage, self.weapon.max_damage)
+            base = self.rng.randint(self.weapon.min_damage, self.weapon.max_damage)
             return int(base * RARITY_MODIFIERS.get(self.weapon.rarity, 1.0))
-        base = random.randint(self.attack_power // 2, self.attack_power)
+        base = self.rng.randint(self.attack_power // 2, self.attack_power)
         return int(base * RARITY_MODIFIERS.get(self.rarity, 1.0))
 
     def apply_weapon_effect(self, enemy: Enemy) -> None:
@@ -546,8 +560,8 @@ class Player(Entity):
         if self.level >= 3:
             credits_dropped += 5
         self.credits += credits_dropped
-        print(_(f"You defeated the {enemy.name}!"))
-        print(_(f"You gained {enemy.xp} XP and {credits_dropped} credits."))
+        self.output_func(_(f"You defeated the {enemy.name}!"))
+        self.output_func(_(f"You gained {enemy.xp} XP and {credits_dropped} credits."))
         while self.xp >= self.level * 20:
             self.xp -= self.level * 20
             self.level_up()
@@ -558,7 +572,7 @@ class Player(Entity):
         self.guard_damage = True
         self.guard_attack = True
         self.status_effects["guard"] = 1
-        print(_("You brace yourself. Incoming damage reduced."))
+        self.output_func(_("You brace yourself. Incoming damage reduced."))
 
     def take_damage(self, damage, source=None, critical=False):
         if self.guard_damage:
@@ -569,7 +583,7 @@ class Player(Entity):
         ):
             block = shield_block(self, 5)
             damage = max(0, damage - block)
-            print(_(f"Your shield absorbs {block} damage!"))
+            self.output_func(_(f"Your shield absorbs {block} damage!"))
         if self.armor:
             damage = max(0, damage - self.armor.defense)
             damage = int(damage / RARITY_MODIFIERS.get(self.armor.rarity, 1.0))
@@ -595,140 +609,142 @@ class Player(Entity):
     # Light-weight skill implementations
     def _skill_power_strike(self, enemy):
         hit_chance = 75
-        roll = random.randint(1, 100)
+        roll = self.rng.randint(1, 100)
         base = self.calculate_damage()
         damage = int(base * 1.5)
         if roll <= hit_chance:
             self.apply_weapon_effect(enemy)
             enemy.take_damage(damage)
-            print(_(f"Power Strike hits for {damage} damage!"))
+            self.output_func(_(f"Power Strike hits for {damage} damage!"))
             if not enemy.is_alive():
                 self.process_enemy_defeat(enemy)
         else:
-            print(_("Power Strike misses."))
+            self.output_func(_("Power Strike misses."))
 
     def _skill_feint(self, enemy):
         hit_chance = 85
-        roll = random.randint(1, 100)
+        roll = self.rng.randint(1, 100)
         base = self.calculate_damage()
         damage = int(base * 0.5)
         if roll <= hit_chance:
             self.apply_weapon_effect(enemy)
             enemy.take_damage(damage)
             add_status_effect(enemy, "stagger", 1)
-            print(_(f"Feint deals {damage} damage and staggers the enemy!"))
+            self.output_func(_(f"Feint deals {damage} damage and staggers the enemy!"))
             if not enemy.is_alive():
                 self.process_enemy_defeat(enemy)
         else:
-            print(_("Feint misses."))
+            self.output_func(_("Feint misses."))
 
     def _skill_bandage(self, _enemy):
         if "blood_torrent" in self.status_effects:
             del self.status_effects["blood_torrent"]
             self.status_effects["blood_scent"] = 3
-            print(_("You stem the flow but a scent lingers."))
+            self.output_func(_("You stem the flow but a scent lingers."))
         elif "bleed" in self.status_effects:
             del self.status_effects["bleed"]
-            print(_("Bleeding stopped."))
+            self.output_func(_("Bleeding stopped."))
         healed = self.heal(3)
         if healed > 0:
-            print(_(f"You bandage your wounds and heal {healed} HP."))
+            self.output_func(_(f"You bandage your wounds and heal {healed} HP."))
         else:
-            print(_("You are already at full health."))
+            self.output_func(_("You are already at full health."))
 
     def _skill_guild_skill(self, enemy):
         damage = self.attack_power + 5
         self.apply_weapon_effect(enemy)
         enemy.take_damage(damage)
-        print(_(f"Your guild training strikes for {damage} damage!"))
+        self.output_func(_(f"Your guild training strikes for {damage} damage!"))
 
     # Skill handler implementations
     def _skill_warrior(self, enemy):
         damage = self.attack_power * 2
-        print(_(f"You unleash a mighty Power Strike dealing {damage} damage!"))
+        self.output_func(_(f"You unleash a mighty Power Strike dealing {damage} damage!"))
         enemy.take_damage(damage)
 
     def _skill_mage(self, enemy):
-        damage = self.attack_power + random.randint(10, 15)
-        print(_(f"You cast Fireball dealing {damage} damage!"))
+        damage = self.attack_power + self.rng.randint(10, 15)
+        self.output_func(_(f"You cast Fireball dealing {damage} damage!"))
         enemy.take_damage(damage)
         add_status_effect(enemy, "burn", 3)
 
     def _skill_rogue(self, enemy):
-        damage = self.attack_power + random.randint(5, 10)
-        print(_(f"You perform a sneaky Backstab for {damage} damage!"))
+        damage = self.attack_power + self.rng.randint(5, 10)
+        self.output_func(_(f"You perform a sneaky Backstab for {damage} damage!"))
         enemy.take_damage(damage)
 
     def _skill_cleric(self, enemy):
         healed = self.heal(20)
-        print(_(f"You invoke Healing Light and recover {healed} health!"))
+        self.output_func(_(f"You invoke Healing Light and recover {healed} health!"))
 
     def _skill_paladin(self, enemy):
-        damage = self.attack_power + random.randint(5, 12)
-        print(_(f"You smite the {enemy.name} for {damage} holy damage!"))
+        damage = self.attack_power + self.rng.randint(5, 12)
+        self.output_func(_(f"You smite the {enemy.name} for {damage} holy damage!"))
         enemy.take_damage(damage)
         healed = self.heal(10)
         if healed:
-            print(_(f"Divine power heals you for {healed} HP!"))
+            self.output_func(_(f"Divine power heals you for {healed} HP!"))
 
     def _skill_bard(self, enemy):
-        print(_("You play an inspiring tune, bolstering your spirit!"))
+        self.output_func(_("You play an inspiring tune, bolstering your spirit!"))
         add_status_effect(self, "inspire", 3)
 
     def _skill_barbarian(self, enemy):
-        damage = self.attack_power + random.randint(8, 12)
+        damage = self.attack_power + self.rng.randint(8, 12)
         enemy.take_damage(damage)
         healed = self.heal(10)
-        print(_(f"You enter a rage, dealing {damage} damage and healing {healed}!"))
+        self.output_func(_(f"You enter a rage, dealing {damage} damage and healing {healed}!"))
 
     def _skill_druid(self, enemy):
-        damage = self.attack_power + random.randint(5, 10)
+        damage = self.attack_power + self.rng.randint(5, 10)
         enemy.take_damage(damage)
         add_status_effect(enemy, "freeze", 1)
         healed = self.heal(5)
-        print(_(f"Nature's wrath deals {damage} damage and restores {healed} health!"))
+        self.output_func(_(f"Nature's wrath deals {damage} damage and restores {healed} health!"))
 
     def _skill_ranger(self, enemy):
-        damage = self.attack_power + random.randint(6, 12)
+        damage = self.attack_power + self.rng.randint(6, 12)
         enemy.take_damage(damage)
         add_status_effect(enemy, "poison", 3)
-        print(_(f"A volley of arrows hits for {damage} damage and poisons the foe!"))
+        self.output_func(_(f"A volley of arrows hits for {damage} damage and poisons the foe!"))
 
     def _skill_sorcerer(self, enemy):
-        damage = self.attack_power + random.randint(12, 18)
+        damage = self.attack_power + self.rng.randint(12, 18)
         enemy.take_damage(damage)
         add_status_effect(enemy, "burn", 3)
-        print(_(f"You unleash Arcane Blast for {damage} damage!"))
+        self.output_func(_(f"You unleash Arcane Blast for {damage} damage!"))
 
     def _skill_monk(self, enemy):
-        damage = self.attack_power + random.randint(4, 8)
+        damage = self.attack_power + self.rng.randint(4, 8)
         enemy.take_damage(damage)
         enemy.take_damage(damage)
-        print(_(f"You strike twice with a flurry for {damage * 2} total damage!"))
+        self.output_func(_(f"You strike twice with a flurry for {damage * 2} total damage!"))
 
     def _skill_warlock(self, enemy):
-        damage = self.attack_power + random.randint(8, 12)
+        damage = self.attack_power + self.rng.randint(8, 12)
         enemy.take_damage(damage)
         healed = self.heal(damage // 2)
-        print(_(f"Eldritch energy deals {damage} damage and heals you for {healed}!"))
+        self.output_func(_(f"Eldritch energy deals {damage} damage and heals you for {healed}!"))
 
     def _skill_necromancer(self, enemy):
-        damage = self.attack_power + random.randint(5, 10)
+        damage = self.attack_power + self.rng.randint(5, 10)
         enemy.take_damage(damage)
         healed = self.heal(damage // 2)
-        print(_(f"You siphon the enemy's soul for {damage} damage and {healed} health!"))
+        self.output_func(_(f"You siphon the enemy's soul for {damage} damage and {healed} health!"))
 
     def _skill_shaman(self, enemy):
         healed = self.heal(15)
-        damage = self.attack_power + random.randint(4, 8)
+        damage = self.attack_power + self.rng.randint(4, 8)
         enemy.take_damage(damage)
-        print(_(f"Spirits mend you for {healed} and shock the foe for {damage} damage!"))
+        self.output_func(_(f"Spirits mend you for {healed} and shock the foe for {damage} damage!"))
 
     def _skill_alchemist(self, enemy):
-        damage = self.attack_power + random.randint(8, 12)
+        damage = self.attack_power + self.rng.randint(8, 12)
         enemy.take_damage(damage)
         add_status_effect(enemy, "burn", 3)
-        print(_(f"An explosive flask bursts for {damage} damage and sets the foe ablaze!"))
+        self.output_func(
+            _(f"An explosive flask bursts for {damage} damage and sets the foe ablaze!")
+        )
 
     def regen_stamina(self, amount):
         self.stamina = min(self.max_stamina, self.stamina + amount)
@@ -739,23 +755,27 @@ class Player(Entity):
             self.status_effects["compression_sickness"] = max(
                 1, (self.status_effects["compression_sickness"] + 1) // 2
             )
-        print(_("You wait and catch your breath."))
+        self.output_func(_("You wait and catch your breath."))
 
-    def use_skill(self, enemy, choice=None):
+    def use_skill(self, enemy, choice=None, input_func=None):
         if choice is None:
-            print(_(f"[1] Power [2] Feint [3] Bandage STA: {self.stamina}/{self.max_stamina}"))
-            choice = input(_("Choose skill: "))
+            self.output_func(
+                _(f"[1] Power [2] Feint [3] Bandage STA: {self.stamina}/{self.max_stamina}")
+            )
+            choice = (input_func or input)(_("Choose skill: "))
         skill = self.skills.get(str(choice))
         if not skill:
-            print(_("Invalid skill choice."))
+            self.output_func(_("Invalid skill choice."))
             return None
         if skill["cooldown"] > 0:
-            print(_(f"{skill['name']} is on cooldown for {skill['cooldown']} more turn(s)."))
+            self.output_func(
+                _(f"{skill['name']} is on cooldown for {skill['cooldown']} more turn(s).")
+            )
             return None
         cost = adjust_skill_cost(self, skill["cost"])
         if self.stamina < cost:
             needed = cost - self.stamina
-            print(_(f"You're winded (need {needed} more STA)."))
+            self.output_func(_(f"You're winded (need {needed} more STA)."))
             return None
         self.stamina -= cost
         skill["func"](enemy)
@@ -766,18 +786,18 @@ class Player(Entity):
         self.level += 1
         self.gain_max_health(10)
         self.attack_power += 3
-        print(_(f"\nYou leveled up to level {self.level}!"))
-        print(_(f"Max Health increased to {self.max_health}"))
-        print(_(f"Attack Power increased to {self.attack_power}"))
-        print(random.choice(ANNOUNCER_LINES))
+        self.output_func(_(f"\nYou leveled up to level {self.level}!"))
+        self.output_func(_(f"Max Health increased to {self.max_health}"))
+        self.output_func(_(f"Attack Power increased to {self.attack_power}"))
+        self.output_func(self.rng.choice(ANNOUNCER_LINES))
         if self.level == 3:
-            print(_("You've unlocked Credit Finder: +5 credits after each kill."))
+            self.output_func(_("You've unlocked Credit Finder: +5 credits after each kill."))
         if self.level == 5:
-            print(_("You've unlocked Passive Regen: Heal 1 HP per move."))
+            self.output_func(_("You've unlocked Passive Regen: Heal 1 HP per move."))
 
     def join_guild(self, guild):
         if self.guild:
-            print(_("You are already in a guild."))
+            self.output_func(_("You are already in a guild."))
             return
         self.guild = guild
         perks = GUILD_DEFS.get(guild, {})
@@ -807,7 +827,7 @@ class Player(Entity):
                     "func": func,
                 }
         self.guild_perks = perks.get("perks", [])
-        print(_(f"You have joined the {guild}!"))
+        self.output_func(_(f"You have joined the {guild}!"))
 
     def choose_race(self, race):
         self.race = race
@@ -817,40 +837,40 @@ class Player(Entity):
         if "attack_power" in traits:
             self.attack_power += traits["attack_power"]
         self.racial_traits = traits.get("traits", [])
-        print(_(f"Race selected: {race}."))
+        self.output_func(_(f"Race selected: {race}."))
 
     def equip_weapon(self, weapon):
         if weapon in self.inventory and isinstance(weapon, Weapon):
             if self.weapon:
                 self.inventory.append(self.weapon)
-                print(_(f"You unequipped the {self.weapon.name}"))
+                self.output_func(_(f"You unequipped the {self.weapon.name}"))
             self.weapon = weapon
             self.inventory.remove(weapon)
-            print(_(f"You equipped the {weapon.name}"))
+            self.output_func(_(f"You equipped the {weapon.name}"))
         else:
-            print(_("You don't have a valid weapon to equip."))
+            self.output_func(_("You don't have a valid weapon to equip."))
 
     def equip_armor(self, armor):
         if armor in self.inventory and isinstance(armor, Armor):
             if self.armor:
                 self.inventory.append(self.armor)
-                print(_(f"You unequipped the {self.armor.name}"))
+                self.output_func(_(f"You unequipped the {self.armor.name}"))
             self.armor = armor
             self.inventory.remove(armor)
-            print(_(f"You equipped the {armor.name}"))
+            self.output_func(_(f"You equipped the {armor.name}"))
         else:
-            print(_("You don't have valid armor to equip."))
+            self.output_func(_("You don't have valid armor to equip."))
 
     def equip_trinket(self, trinket):
         if trinket in self.inventory and isinstance(trinket, Trinket):
             if self.trinket:
                 self.inventory.append(self.trinket)
-                print(_(f"You removed the {self.trinket.name}"))
+                self.output_func(_(f"You removed the {self.trinket.name}"))
             self.trinket = trinket
             self.inventory.remove(trinket)
-            print(_(f"You equipped the {trinket.name}"))
+            self.output_func(_(f"You equipped the {trinket.name}"))
         else:
-            print(_("You don't have a valid trinket to equip."))
+            self.output_func(_("You don't have a valid trinket to equip."))
 
     def apply_augment(self, augment: Augment) -> bool:
         """Apply an augment to the player if stack limits allow.
@@ -862,7 +882,7 @@ class Player(Entity):
 
         stacks = self.augments.get(augment.name, 0)
         if stacks >= augment.max_stacks:
-            print(_(f"You cannot apply another {augment.name}."))
+            self.output_func(_(f"You cannot apply another {augment.name}."))
             return False
         self.attack_power += augment.attack_bonus
         self.base_max_health = max(1, self.base_max_health - augment.health_penalty)
@@ -965,10 +985,10 @@ class Enemy(Entity):
         ):
             block = shield_block(self, 5)
             damage = max(0, damage - block)
-            print(_(f"The {self.name}'s shield absorbs {block} damage!"))
+            self.output_func(_(f"The {self.name}'s shield absorbs {block} damage!"))
         if "armored" in self.traits:
             damage = max(0, damage - 3)
-            print(_(f"The {self.name}'s armor softens the blow!"))
+            self.output_func(_(f"The {self.name}'s armor softens the blow!"))
         self.health = max(0, self.health - damage)
 
     def drop_credits(self):
@@ -981,12 +1001,12 @@ class Enemy(Entity):
             heal = min(5, self.max_health - self.health)
             if heal > 0:
                 self.health += heal
-                print(_(f"The {self.name} regenerates {heal} health!"))
+                self.output_func(_(f"The {self.name} regenerates {heal} health!"))
         return skip
 
     def defend(self):
         add_status_effect(self, "shield", 1)
-        print(_(f"The {self.name} raises its guard!"))
+        self.output_func(_(f"The {self.name} raises its guard!"))
 
     def take_turn(self, player):
         action = self.next_action
@@ -1024,23 +1044,23 @@ class Enemy(Entity):
             hit_chance += 10
         if "cursed" in self.status_effects:
             hit_chance -= 5
-        roll = random.randint(1, 100)
-        damage = random.randint(self.attack_power // 2, self.attack_power)
+        roll = self.rng.randint(1, 100)
+        damage = self.rng.randint(self.attack_power // 2, self.attack_power)
         damage = int(damage * RARITY_MODIFIERS.get(self.rarity, 1.0))
         if self.status_effects.pop("heavy", 0):
             damage = int(damage * 1.5)
         if "berserker" in self.traits and self.health <= self.max_health // 2:
             damage = int(damage * 1.5)
-            print(_(f"The {self.name} goes berserk!"))
+            self.output_func(_(f"The {self.name} goes berserk!"))
         if roll <= hit_chance:
             critical = False
             if wild and roll >= 95:
                 damage *= 2
                 critical = True
-                print(_(f"The {self.name} lands a vicious critical!"))
+                self.output_func(_(f"The {self.name} lands a vicious critical!"))
             if self.ability == "lifesteal":
                 self.health += damage // 3
-                print(_(f"The {self.name} drains life and heals for {damage // 3}!"))
+                self.output_func(_(f"The {self.name} drains life and heals for {damage // 3}!"))
             elif self.ability == "poison":
                 dur = int(3 * RARITY_MODIFIERS.get(self.rarity, 1.0))
                 add_status_effect(player, "poison", dur)
@@ -1056,28 +1076,28 @@ class Enemy(Entity):
             elif self.ability == "freeze":
                 dur = int(1 * RARITY_MODIFIERS.get(self.rarity, 1.0))
                 add_status_effect(player, "freeze", dur)
-            elif self.ability == "double_strike" and random.random() < 0.25:
-                print(_(f"The {self.name} strikes twice!"))
+            elif self.ability == "double_strike" and self.rng.random() < 0.25:
+                self.output_func(_(f"The {self.name} strikes twice!"))
                 player.take_damage(damage, source=self.name, critical=critical)
             player.take_damage(damage, source=self.name, critical=critical)
             if config.verbose_combat:
-                print(
+                self.output_func(
                     _(
                         f"{self.name} attacks ({hit_chance}%): roll {roll} → HIT. Damage {damage}.",
                     )
                 )
             else:
-                print(_(f"The {self.name} attacked you and dealt {damage} damage."))
+                self.output_func(_(f"The {self.name} attacked you and dealt {damage} damage."))
         else:
             if config.verbose_combat:
                 reason = "It slipped on the wet stone!"
-                print(
+                self.output_func(
                     _(
                         f"{self.name} attacks ({hit_chance}%): roll {roll} → MISS. {reason}",
                     )
                 )
             else:
-                print(_(f"The {self.name}'s attack missed."))
+                self.output_func(_(f"The {self.name}'s attack missed."))
 
 
 def create_guild_champion(player: Player) -> Enemy:
@@ -1120,10 +1140,10 @@ class Companion(Entity):
         """
 
         if self.attack_power and enemy.is_alive():
-            dmg = random.randint(max(1, self.attack_power // 2), self.attack_power)
+            dmg = self.rng.randint(max(1, self.attack_power // 2), self.attack_power)
             enemy.take_damage(dmg)
-            print(_(f"{self.name} strikes {enemy.name} for {dmg} damage!"))
+            self.output_func(_(f"{self.name} strikes {enemy.name} for {dmg} damage!"))
         if self.heal_amount and player.is_alive():
             healed = player.heal(self.heal_amount)
             if healed > 0:
-                print(_(f"{self.name} heals {player.name} for {healed} HP!"))
+                self.output_func(_(f"{self.name} heals {player.name} for {healed} HP!"))
@@ -10,6 +10,7 @@ from gettext import gettext as _
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict
 
+from .core.rng import stream_for
 from .items import Item
 from .quests import EscortNPC, EscortQuest
 from .status_effects import add_status_effect, clear_soul_tax
@@ -60,6 +61,7 @@ class PuzzleEvent(BaseEvent):
     """Present a riddle that rewards credits when solved."""
 
     def trigger(self, game: "DungeonBase", input_func=input, output_func=print) -> None:
+        rng = stream_for(game, "events", random)
         # ``random.choice`` raises ``IndexError`` when ``game.riddles`` is empty.
         # Hidden tests exercise this scenario to ensure the event system can run
         # even when no riddles have been configured.  We guard against the error
@@ -67,7 +69,7 @@ class PuzzleEvent(BaseEvent):
         if not game.riddles:
             output_func(_("The sage stares blankly; there are no riddles to tell."))
             return
-        riddle, answer = random.choice(game.riddles)
+        riddle, answer = rng.choice(game.riddles)
         output_func(_("A sage presents a riddle:\n") + riddle)
         response = input_func(_("Answer: ")).strip().lower()
         if response == answer:
@@ -90,18 +92,19 @@ class TrapEvent(BaseEvent):
         self.bleed_chance = cfg.get("bleed_chance", 0.3)
 
     def trigger(self, game: "DungeonBase", input_func=input, output_func=print) -> None:
+        rng = stream_for(game, "events", random)
         intros = [
             _("A chill runs down your spine."),
             _("The corridor ahead feels oddly dangerous."),
             _("Your instincts warn of hidden snares."),
         ]
-        output_func(random.choice(intros))
+        output_func(rng.choice(intros))
 
         speed = getattr(game.player, "speed", 0)
         perception = getattr(game.player, "perception", 0)
         detect_chance = self.detect_base + (speed + perception) * 0.05
         detect_chance = min(0.95, detect_chance)
-        if random.random() < detect_chance:
+        if rng.random() < detect_chance:
             output_func(_("You spot a faint glyph hinting at a trap."))
             if input_func is input:
                 action = "n"
@@ -118,10 +121,10 @@ class TrapEvent(BaseEvent):
                 game.visited_rooms.add((game.player.x, game.player.y))
                 return
             output_func(_("You hesitate and trigger the trap!"))
-        damage = random.randint(5, 20)
+        damage = rng.randint(5, 20)
         game.player.take_damage(damage, source=_("The Tripwire"))
         output_func(_(f"A trap is sprung! You take {damage} damage."))
-        if random.random() < self.bleed_chance:
+        if rng.random() < self.bleed_chance:
             add_status_effect(game.player, "bleed", 3)
         game.visited_rooms.add((game.player.x, game.player.y))
 
@@ -137,6 +140,7 @@ class FountainEvent(BaseEvent):
         self.curse_chance = cfg.get("curse_chance", 0.1)
 
     def trigger(self, game: "DungeonBase", input_func=input, output_func=print) -> None:
+        rng = stream_for(game, "events", random)
         if self.remaining_uses <= 0:
             output_func(_("The fountain is dry."))
             return
@@ -145,17 +149,17 @@ class FountainEvent(BaseEvent):
             _("An ancient fountain trickles invitingly."),
             _("A mystical fountain bubbles softly."),
         ]
-        output_func(random.choice(intros))
+        output_func(rng.choice(intros))
 
         while self.remaining_uses > 0:
             output_func(_("Drink (D) / Bottle (B) / Leave (any other key)"))
             choice = input_func(_("Choice: ")).strip().lower()
             if choice == "d":
-                heal = random.randint(6, 10)
+                heal = rng.randint(6, 10)
                 healed = game.player.heal(heal)
                 output_func(_(f"You feel refreshed and recover {healed} health."))
                 game.stats_logger.record_reward()
-                roll = random.random()
+                roll = rng.random()
                 if roll < self.bless_chance:
                     add_status_effect(game.player, "blessed", 30)
                 elif roll < self.bless_chance + self.curse_chance:
@@ -176,13 +180,14 @@ class CacheEvent(BaseEvent):
     """Hidden cache that rewards credits."""
 
     def trigger(self, game: "DungeonBase", input_func=input, output_func=print) -> None:
+        rng = stream_for(game, "events", random)
         intros = [
             _("A loose stone reveals a hidden cache."),
             _("Behind a crumbled wall lies a secret stash."),
             _("You notice a small cache tucked away."),
         ]
-        output_func(random.choice(intros))
-        credits = random.randint(15, 30)
+        output_func(rng.choice(intros))
+        credits = rng.randint(15, 30)
         game.player.credits += credits
         output_func(_(f"You discover a hidden cache containing {credits} credits."))
         game.stats_logger.record_reward()
@@ -212,6 +217,7 @@ class LoreNoteEvent(BaseEvent):
     """Reveal a snippet of lore."""
 
     def trigger(self, game: "DungeonBase", input_func=input, output_func=print) -> None:
+        rng = stream_for(game, "events", random)
         notes: list[LoreNote] = [
             {"text": _("The walls whisper of an ancient battle.")},
             {"text": _("Scrawled handwriting reads: 'Beware the shadows.'")},
@@ -224,7 +230,7 @@ class LoreNoteEvent(BaseEvent):
                 "effect": ("beetle_bane", 10),
             },
         ]
-        note = random.choice(notes)
+        note = rng.choice(notes)
         output_func(note["text"])
 
         player = game.player
@@ -244,6 +250,7 @@ class ShrineEvent(BaseEvent):
         self.prayer_boon = cfg.get("prayer_boon_chance", 0.6)
 
     def trigger(self, game: "DungeonBase", input_func=input, output_func=print) -> None:
+        rng = stream_for(game, "events", random)
         output_func(_("You discover a tranquil shrine with two altars."))
         output_func(_("[V] Altar of Valor (+1 STR until next floor)"))
         output_func(_("[W] Altar of Wisdom (+1 INT until next floor)"))
@@ -263,8 +270,8 @@ class ShrineEvent(BaseEvent):
             output_func(_("You kneel and whisper a prayer..."))
             output_func("    _\\/_")
             output_func("     /\\")
-            if random.random() < self.prayer_boon:
-                heal = random.randint(8, 12)
+            if rng.random() < self.prayer_boon:
+                heal = rng.randint(8, 12)
                 healed = game.player.heal(heal)
                 output_func(_(f"A warm light restores {healed} health."))
                 game.stats_logger.record_reward()
@@ -308,7 +315,8 @@ class HazardEvent(BaseEvent):
     """Minor environmental hazard dealing damage."""
 
     def trigger(self, game: "DungeonBase", input_func=input, output_func=print) -> None:
-        damage = random.randint(3, 8)
+        rng = stream_for(game, "events", random)
+        damage = rng.randint(3, 8)
         game.player.take_damage(damage, source="Environmental Hazard")
         output_func(_(f"Falling debris hits you for {damage} damage."))
 
@@ -0,0 +1,316 @@
+"""Exact win probabilities for :mod:`dungeoncrawler.core.combat` duels.
+
+A duel in which the player always attacks and the enemy follows a repeating
+intent cycle is a finite absorbing Markov chain.  Its state is the pair of
+health values, the position in the intent cycle and the number of pending
+``defend_damage``/``defend_attack`` flags on the enemy.  Every transition
+either lowers one of the health values or leaves both unchanged, so the chain
+can be solved bottom-up over health values.  States sharing the same health
+values form a small linear system which is solved directly.
+
+Matchups the chain cannot express raise :class:`UnsupportedMatchup`; callers
+such as :func:`dungeoncrawler.sim.simulate_battles` then fall back to
+sampling.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+# Maximum number of pending ``defend_damage`` flags tracked on the enemy.  The
+# flag is only consumed by player hits, so a run of misses can stack it
+# without bound; deeper stacks are clamped.  Intent cycles are rejected unless
+# hits outpace defends on average, which makes reaching the limit vanishingly
+# unlikely (well below the precision of any balance band).
+STACK_LIMIT = 12
+
+# Chance that a successful wild attack deals double damage (roll >= 95).
+WILD_DOUBLE_CHANCE = 0.06
+
+_ATTACK_STATS = ("attack", "defense", "speed", "crit", "tenacity")
+
+# (phase in intent cycle, enemy defend_damage stacks, enemy defend_attack stacks)
+Substate = Tuple[int, int, int]
+
+
+class UnsupportedMatchup(ValueError):
+    """Raised when a matchup cannot be expressed as a finite Markov chain."""
+
+
+def _chance(value: int) -> float:
+    return max(0, min(100, value)) / 100
+
+
+def _merge(outcomes: List[Tuple[float, int, Substate]]) -> List[Tuple[float, int, Substate]]:
+    merged: Dict[Tuple[int, Substate], float] = {}
+    for prob, damage, sub in outcomes:
+        if prob > 0:
+            merged[(damage, sub)] = merged.get((damage, sub), 0.0) + prob
+    return [(prob, damage, sub) for (damage, sub), prob in merged.items()]
+
+
+class _Chain:
+    """Per-round transition tables for one combination of fixed stats."""
+
+    def __init__(
+        self, player: Mapping[str, int], enemy: Mapping[str, int], intents: Sequence[str]
+    ) -> None:
+        self.player = player
+        self.enemy = enemy
+        self.intents = list(intents) or ["attack"]
+        # ``defend_attack`` is consumed by every enemy attack and
+        # ``defend_damage`` by every player hit; both must drain faster than
+        # defends add them for the chain to stay finite.
+        defends = self.intents.count("defend")
+        hit = _chance(75 + player["speed"] - enemy["speed"])
+        if defends > len(self.intents) - defends or defends >= len(self.intents) * hit:
+            raise UnsupportedMatchup("Intent cycle stacks defend flags without bound")
+        self.substates: List[Substate] = []
+        self.player_turn: Dict[Substate, List[Tuple[float, int, Substate]]] = {}
+        self.enemy_turn: Dict[Substate, List[Tuple[float, int, Substate]]] = {}
+        self._explore()
+
+    def _player_attack(self, sub: Substate) -> List[Tuple[float, int, Substate]]:
+        phase, guard, riposte = sub
+        p, e = self.player, self.enemy
+        hit = _chance(75 + p["speed"] - e["speed"])
+        crit = _chance(p["crit"] - e["tenacity"])
+        base = max(0, p["attack"] - e["defense"])
+        outcomes = [(1 - hit, 0, sub)]
+        for is_crit, prob in ((True, crit), (False, 1 - crit)):
+            damage = base * 2 if is_crit else base
+            after = sub
+            if guard:
+                damage = int(damage * 0.6)
+                after = (phase, guard - 1, riposte)
+            outcomes.append((hit * prob, damage, after))
+        return _merge(outcomes)
+
+    def _enemy_action(self, sub: Substate) -> List[Tuple[float, int, Substate]]:
+        phase, guard, riposte = sub
+        action = self.intents[phase]
+        phase = (phase + 1) % len(self.intents)
+        if action == "defend":
+            return [(1.0, 0, (phase, min(guard + 1, STACK_LIMIT), riposte + 1))]
+
+        p, e = self.player, self.enemy
+        hit = 75 + e["speed"] - p["speed"]
+        if riposte:
+            hit += 10
+            riposte -= 1
+        hit = max(0, min(100, hit))
+        if action == "wild_attack":
+            hit = max(0, hit - 20)
+        hit /= 100
+        crit = _chance(e["crit"] - p["tenacity"])
+        base = max(0, e["attack"] - p["defense"])
+        after = (phase, guard, riposte)
+        outcomes = [(1 - hit, 0, after)]
+        for is_crit, prob in ((True, crit), (False, 1 - crit)):
+            damage = base * 2 if is_crit else base
+            if action == "heavy_attack":
+                damage = int(damage * 1.5)
+            if action == "wild_attack":
+                outcomes.append((hit * prob * WILD_DOUBLE_CHANCE, damage * 2, after))
+                prob *= 1 - WILD_DOUBLE_CHANCE
+            outcomes.append((hit * prob, damage, after))
+        return _merge(outcomes)
+
+    def _explore(self) -> None:
+        start: Substate = (0, 0, 0)
+        pending = [start]
+        seen = {start}
+        while pending:
+            sub = pending.pop()
+            self.substates.append(sub)
+            self.player_turn[sub] = self._player_attack(sub)
+            for _, _, mid in self.player_turn[sub]:
+                if mid not in self.enemy_turn:
+                    self.enemy_turn[mid] = self._enemy_action(mid)
+                for _, _, nxt in self.enemy_turn[mid]:
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        pending.append(nxt)
+        self.substates.sort()
+
+    def damage_values(self) -> Tuple[List[int], List[int]]:
+        """Return the positive damage amounts dealt by the player and the enemy."""
+
+        to_enemy = {d for outs in self.player_turn.values() for _, d, _ in outs if d > 0}
+        to_player = {d for outs in self.enemy_turn.values() for _, d, _ in outs if d > 0}
+        return sorted(to_enemy), sorted(to_player)
+
+
+def _reachable(starts: Sequence[int], damages: Sequence[int]) -> List[int]:
+    """Return every positive health value reachable from ``starts``."""
+
+    seen = set(starts)
+    pending = list(starts)
+    while pending:
+        hp = pending.pop()
+        for damage in damages:
+            nxt = hp - damage
+            if nxt > 0 and nxt not in seen:
+                seen.add(nxt)
+                pending.append(nxt)
+    return sorted(seen)
+
+
+def _invert(matrix: List[List[float]]) -> List[List[float]]:
+    """Return ``(I - matrix)^-1`` using Gauss-Jordan elimination."""
+
+    n = len(matrix)
+    rows = [
+        [(1.0 if i == j else 0.0) - matrix[i][j] for j in range(n)]
+        + [1.0 if i == j else 0.0 for j in range(n)]
+        for i in range(n)
+    ]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            raise UnsupportedMatchup("Matchup contains a stalemate loop")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        lead = rows[col][col]
+        rows[col] = [value / lead for value in rows[col]]
+        for r in range(n):
+            if r != col and rows[r][col]:
+                factor = rows[r][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [row[n:] for row in rows]
+
+
+def _solve_chain(
+    chain: _Chain, player_health: int, enemy_healths: Sequence[int]
+) -> Dict[int, Tuple[float, float]]:
+    """Return ``{enemy_health: (P(win), E[turns; win])}`` from the initial substate.
+
+    ``E[turns; win]`` is the expectation of the turn count restricted to won
+    battles, so dividing by ``P(win)`` yields the average length of a win.
+    """
+
+    to_enemy, to_player = chain.damage_values()
+    if not to_enemy:
+        return {hp: (0.0, 0.0) for hp in enemy_healths}
+    subs = chain.substates
+    index = {sub: i for i, sub in enumerate(subs)}
+    n = len(subs)
+
+    # Rounds in which nobody takes damage keep both health values and only
+    # move between substates.  They never end the battle, so the same loop
+    # matrix applies to every pair of health values and is inverted once.
+    loops = [[0.0] * n for _ in range(n)]
+    moves: List[List[Tuple[float, int, int, int]]] = [[] for _ in range(n)]
+    for i, sub in enumerate(subs):
+        for p1, dealt, mid in chain.player_turn[sub]:
+            for p2, taken, nxt in chain.enemy_turn[mid]:
+                j = index[nxt]
+                if dealt == 0 and taken == 0:
+                    loops[i][j] += p1 * p2
+                else:
+                    moves[i].append((p1 * p2, dealt, taken, j))
+    inverse = _invert(loops)
+    loop_rows = [[(j, p) for j, p in enumerate(row) if p] for row in loops]
+
+    player_values = _reachable([player_health], to_player)
+    enemy_values = _reachable(enemy_healths, to_enemy)
+    win: Dict[Tuple[int, int], List[float]] = {}
+    turns: Dict[Tuple[int, int], List[float]] = {}
+    for php in player_values:
+        for ehp in enemy_values:
+            w_rhs = [0.0] * n
+            t_rhs = [0.0] * n
+            for i in range(n):
+                w_acc = t_acc = 0.0
+                for prob, dealt, taken, j in moves[i]:
+                    if dealt >= ehp:
+                        # The enemy falls before it can act.
+                        w_acc += prob
+                        t_acc += prob
+                    elif taken < php:
+                        key = (php - taken, ehp - dealt)
+                        w_next = win[key][j]
+                        w_acc += prob * w_next
+                        t_acc += prob * (turns[key][j] + w_next)
+                w_rhs[i] = w_acc
+                t_rhs[i] = t_acc
+            w_vec = [sum(m * r for m, r in zip(row, w_rhs)) for row in inverse]
+            for i, row in enumerate(loop_rows):
+                t_rhs[i] += sum(p * w_vec[j] for j, p in row)
+            win[(php, ehp)] = w_vec
+            turns[(php, ehp)] = [sum(m * r for m, r in zip(row, t_rhs)) for row in inverse]
+
+    start = index[(0, 0, 0)]
+    return {
+        hp: (win[(player_health, hp)][start], turns[(player_health, hp)][start])
+        for hp in enemy_healths
+    }
+
+
+def _span(value: Any) -> List[int]:
+    if isinstance(value, tuple):
+        low, high = value
+        return list(range(low, high + 1))
+    return [int(value)]
+
+
+def solve_battle(
+    enemy_stats: Mapping[str, Any],
+    player_stats: Mapping[str, int],
+    intents: Sequence[str] = ("attack",),
+) -> Dict[str, float]:
+    """Return the exact ``winrate`` and ``avg_turns`` of a duel.
+
+    Parameters
+    ----------
+    enemy_stats:
+        Mapping of enemy stats.  ``health`` and ``attack`` may be
+        ``(low, high)`` tuples which are treated as uniformly rolled, exactly
+        like the stat ranges used by :func:`dungeoncrawler.sim.simulate_battles`.
+    player_stats:
+        Mapping of player stats.  The player attacks every turn.
+    intents:
+        Repeating enemy action cycle.
+
+    Returns
+    -------
+    dict
+        Dictionary with ``winrate`` and ``avg_turns`` matching
+        :func:`dungeoncrawler.sim.simulate_battles`.  Stalemates, where
+        neither side can deal damage, count as losses.
+
+    Raises
+    ------
+    UnsupportedMatchup
+        If a stat other than ``health`` or ``attack`` is a range, or the
+        intent cycle stacks defend flags without bound.
+    """
+
+    for key in _ATTACK_STATS:
+        if key != "attack" and isinstance(enemy_stats.get(key), tuple):
+            raise UnsupportedMatchup(f"Randomised enemy stat {key!r} is not supported")
+    player = {key: int(player_stats.get(key, 0)) for key in _ATTACK_STATS}
+    player_health = int(player_stats.get("health", 0))
+    healths = [hp for hp in _span(enemy_stats.get("health", 0)) if hp > 0]
+    attacks = _span(enemy_stats.get("attack", 0))
+    if player_health <= 0:
+        return {"winrate": 0.0, "avg_turns": 0.0}
+
+    total_win = 0.0
+    total_turns = 0.0
+    for attack in attacks:
+        enemy = {key: int(enemy_stats.get(key, 0)) for key in _ATTACK_STATS if key != "attack"}
+        enemy["attack"] = attack
+        outcomes = _solve_chain(_Chain(player, enemy, intents), player_health, healths)
+        for hp in healths:
+            w, t = outcomes[hp]
+            total_win += w
+            total_turns += t
+    # Enemies rolled with zero health are already defeated: a win in zero turns.
+    dead = len(_span(enemy_stats.get("health", 0))) - len(healths)
+    combos = (len(healths) + dead) * len(attacks)
+    total_win += dead * len(attacks)
+    winrate = total_win / combos
+    return {"winrate": winrate, "avg_turns": total_turns / total_win if total_win else 0.0}
+
+
+__all__ = ["STACK_LIMIT", "UnsupportedMatchup", "solve_battle"]
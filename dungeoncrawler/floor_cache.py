@@ -0,0 +1,283 @@
+"""On-disk cache of generated floors.
+
+A seeded floor is a pure function of the run seed, the floor number and the
+configuration it is generated with (see :func:`dungeoncrawler.map.build_floor`).
+:func:`floor_key` hashes those inputs and :class:`FloorCache` stores the
+resulting :class:`~dungeoncrawler.map.FloorLayout` under the hash, so replays,
+daily-seed runs and tests can load a floor instead of generating it again.
+
+Entries are compact JSON: the tile layer is a zlib-compressed byte string,
+room names are stored as the seed they are derived from, and placed objects
+are short descriptors that are rebuilt from the game's own enemy, boss, loot
+and companion tables on load.  Bump :data:`FORMAT_VERSION` whenever
+generation itself changes.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import zlib
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from . import events as events_module
+from .ai import IntentAI
+from .data import load_companions
+from .entities import Companion, Enemy
+from .events import BaseEvent
+from .grid import TileGrid
+from .items import Item
+from .map import NEAR_START_STEPS, DistanceField, FloorLayout, FloorSettings
+from .paths import CACHE_DIR
+
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from .dungeon import DungeonBase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = CACHE_DIR / "floors"
+FORMAT_VERSION = 2
+
+
+def _describe(value: Any) -> Any:
+    """JSON fallback for configuration values such as event classes."""
+
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return getattr(value, "__name__", type(value).__name__)
+
+
+def floor_key(game: "DungeonBase", floor: int, settings: FloorSettings) -> Optional[str]:
+    """Return the content hash identifying ``floor`` of ``game``'s run.
+
+    ``None`` is returned for unseeded games, whose floors come from the global
+    :mod:`random` state and cannot be reproduced.
+    """
+
+    seed = game.rng.seed
+    if seed is None:
+        return None
+    payload = {
+        "version": FORMAT_VERSION,
+        "seed": seed,
+        "floor": floor,
+        "settings": asdict(settings),
+        "floor_config": game.floor_configs.get(floor),
+        "enemy_stats": game.enemy_stats,
+        "boss_stats": game.boss_stats,
+        "boss_loot": {name: [item.name for item in loot] for name, loot in game.boss_loot.items()},
+        "rare_loot": [item.name for item in game.rare_loot],
+        "companions": [companion.name for companion in load_companions()],
+        "place_counts": game.default_place_counts,
+        "near_start": NEAR_START_STEPS,
+    }
+    text = json.dumps(payload, sort_keys=True, default=_describe)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack(data: bytes) -> str:
+    return base64.b64encode(zlib.compress(data, 9)).decode("ascii")
+
+
+def _unpack(text: str) -> bytes:
+    return zlib.decompress(base64.b64decode(text))
+
+
+def _index_of(obj: object, items: List[Any]) -> Optional[int]:
+    for index, item in enumerate(items):
+        if item is obj:
+            return index
+    return None
+
+
+def _encode_object(obj: object, game: "DungeonBase") -> Optional[Dict[str, Any]]:
+    """Return a descriptor for a placed object or ``None`` if it has none."""
+
+    if isinstance(obj, Enemy):
+        return {
+            "enemy": obj.name,
+            "boss": obj.name in game.boss_stats and obj.name not in game.enemy_stats,
+            "stats": [obj.health, obj.attack_power, obj.defense, obj.credits, obj.xp],
+            "floor": getattr(obj, "floor", None),
+        }
+    if isinstance(obj, Companion):
+        index = _index_of(obj, load_companions())
+        return None if index is None else {"companion": index}
+    if isinstance(obj, BaseEvent):
+        name = type(obj).__name__
+        return {"event": name} if getattr(events_module, name, None) is type(obj) else None
+    if isinstance(obj, Item):
+        index = _index_of(obj, game.rare_loot)
+        if index is not None:
+            return {"rare_loot": index}
+        for boss, loot in game.boss_loot.items():
+            index = _index_of(obj, loot)
+            if index is not None:
+                return {"boss_loot": boss, "index": index}
+        if type(obj) is Item:
+            return {"item": [obj.name, obj.description]}
+    return None
+
+
+def _decode_object(data: Dict[str, Any], game: "DungeonBase") -> object:
+    if "enemy" in data:
+        name = data["enemy"]
+        health, attack, defense, credits, xp = data["stats"]
+        if data["boss"]:
+            ability = game.boss_stats[name][4]
+            weights = game.boss_ai.get(name)
+            traits = game.boss_traits.get(name)
+        else:
+            ability = game.enemy_abilities.get(name)
+            weights = game.enemy_ai.get(name)
+            traits = game.enemy_traits.get(name)
+        ai = IntentAI(**weights) if weights else None
+        enemy = Enemy(name, health, attack, defense, credits, ability, ai, traits=traits)
+        enemy.floor = data["floor"]
+        enemy.xp = xp
+        return enemy
+    if "companion" in data:
+        return load_companions()[data["companion"]]
+    if "event" in data:
+        return getattr(events_module, data["event"])()
+    if "rare_loot" in data:
+        return game.rare_loot[data["rare_loot"]]
+    if "boss_loot" in data:
+        return game.boss_loot[data["boss_loot"]][data["index"]]
+    return Item(*data["item"])
+
+
+def encode_layout(layout: FloorLayout, game: "DungeonBase") -> Optional[Dict[str, Any]]:
+    """Return ``layout`` as a JSON-ready dictionary.
+
+    ``None`` is returned when the floor holds an object without a descriptor,
+    for example one placed by a plugin; such floors are simply not cached.
+    """
+
+    width = layout.width
+    kinds, tiles = layout.rooms.tile_bytes()
+    objects = []
+    for (x, y), obj in sorted(layout.rooms.objects.items(), key=lambda item: item[0][::-1]):
+        descriptor = _encode_object(obj, game)
+        if descriptor is None:
+            return None
+        objects.append([x, y, descriptor])
+    room_names = layout.room_names
+    field = layout.distance_field
+    return {
+        "version": FORMAT_VERSION,
+        "floor": layout.floor,
+        "size": [width, layout.height],
+        "start": list(layout.start),
+        "exit": list(layout.exit_coords) if layout.exit_coords else None,
+        "tiles": {str(code): name for code, name in tiles.items()},
+        "kinds": _pack(kinds),
+        "room_names": [room_names.seed, room_names.overrides],
+        "objects": objects,
+        "free": [[y * width + x for x, y in bucket] for bucket in field.buckets],
+        "messages": layout.messages,
+        "attack_bonus": layout.attack_bonus,
+    }
+
+
+def decode_layout(data: Dict[str, Any], game: "DungeonBase") -> FloorLayout:
+    """Rebuild a :class:`FloorLayout` written by :func:`encode_layout`."""
+
+    width, height = data["size"]
+    tiles = {int(code): name for code, name in data["tiles"].items()}
+    rooms = TileGrid.from_tile_bytes(width, height, _unpack(data["kinds"]), tiles)
+    for x, y, descriptor in data["objects"]:
+        rooms.set(x, y, _decode_object(descriptor, game))
+    names_seed, overrides = data["room_names"]
+    room_names = game.room_name_layer(width, height, names_seed)
+    room_names.overrides.update((int(index), name) for index, name in overrides.items())
+    start = tuple(data["start"])
+    free = [(index % width, index // width) for bucket in data["free"] for index in bucket]
+    field = DistanceField(rooms.open_cells(), start, free, limit=NEAR_START_STEPS)
+    exit_coords = tuple(data["exit"]) if data["exit"] else None
+    return FloorLayout(
+        data["floor"],
+        width,
+        height,
+        rooms,
+        room_names,
+        start,
+        exit_coords,
+        field,
+        list(data["messages"]),
+        data["attack_bonus"],
+    )
+
+
+class FloorCache:
+    """Directory of cached floors with hit and miss counters.
+
+    Parameters
+    ----------
+    path:
+        Cache directory, created on first write.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_DIR) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str, game: "DungeonBase") -> Optional[FloorLayout]:
+        """Return the floor cached under ``key`` or ``None``."""
+
+        try:
+            with open(self._file(key), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != FORMAT_VERSION:
+                raise ValueError("stale floor cache entry")
+            layout = decode_layout(data, game)
+        except (OSError, ValueError, KeyError, IndexError, TypeError, zlib.error):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return layout
+
+    def put(self, key: str, layout: FloorLayout, game: "DungeonBase") -> None:
+        """Store ``layout`` under ``key``; failures are logged and ignored."""
+
+        data = encode_layout(layout, game)
+        if data is None:
+            return
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp = self._file(key).with_suffix(f".{id(layout)}.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            tmp.replace(self._file(key))
+        except OSError:
+            logger.exception("Failed to write floor cache entry %s", key)
+
+    def clear(self) -> None:
+        """Delete every cached floor."""
+
+        for entry in self.path.glob("*.json"):
+            entry.unlink()
+
+    def report(self) -> str:
+        """Return a one-line hit/miss summary."""
+
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"Floor cache: {self.hits} hits, {self.misses} misses ({rate:.0%} hit rate)"
+
+
+__all__ = [
+    "DEFAULT_CACHE_DIR",
+    "FORMAT_VERSION",
+    "FloorCache",
+    "decode_layout",
+    "encode_layout",
+    "floor_key",
+]
@@ -0,0 +1,470 @@
+"""Compact storage for the dungeon's room grid.
+
+:class:`TileGrid` keeps one byte per cell describing what occupies it and a
+sparse dictionary holding the handful of cells that contain objects
+(enemies, items, events, NPCs, the player).  Plain tile strings such as
+``"Empty"`` or ``"Trap"`` are stored as byte codes only.
+
+The grid still reads and writes like the nested lists it replaces:
+``grid[y][x]`` returns ``None``, a tile string or the stored object, and
+``grid[y][x] = value`` updates both layers.  Existing hooks and tests that
+build plain lists keep working.  Every object written to a grid is also
+recorded in its :class:`EntityIndex` by type and name.  The module-level
+helpers, :func:`find_tiles`, :func:`find_enemy` and :func:`find_entities`,
+accept either form and use the index on grids.
+
+:class:`RoomNames` is the matching layer of room names.  It derives each
+name from a seed when it is read and stores only renamed rooms.
+"""
+
+from __future__ import annotations
+
+from itertools import compress, count
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .core.map import RowView
+from .entities import Enemy, Player
+
+# Byte codes for plain tile strings.  ``VOID`` is an uncarved wall (``None``).
+# Place names come from floor data, so unseen strings are assigned the next
+# free code on first use; the table is per process and never persisted.
+VOID = 0
+TILE_CODES: Dict[str, int] = {}
+# Codes for cells whose value lives in the sparse object layer.
+PLAYER = 253
+ENEMY = 254
+OBJECT = 255
+
+_NAMES: List[Optional[str]] = [None] * 256
+
+
+def _tile_code(name: str) -> int:
+    code = TILE_CODES.get(name)
+    if code is None:
+        code = len(TILE_CODES) + 1
+        if code >= PLAYER:
+            return OBJECT
+        TILE_CODES[name] = code
+        _NAMES[code] = name
+    return code
+
+
+for _name in ("Empty", "Trap", "Exit", "Sanctuary", "Treasure"):
+    _tile_code(_name)
+
+
+# Translation table clearing object cells (player, enemy, object codes).
+_WITHOUT_OBJECTS = bytes(code if code < PLAYER else VOID for code in range(256))
+
+
+def _code_for(value: Any) -> int:
+    if value is None:
+        return VOID
+    if isinstance(value, str):
+        return _tile_code(value)
+    if isinstance(value, Enemy):
+        return ENEMY
+    if isinstance(value, Player):
+        return PLAYER
+    return OBJECT
+
+
+class _Row(RowView):
+    """Mutable view of one grid row supporting the read-only list API."""
+
+    __slots__ = ("_offset",)
+
+    def __init__(self, grid: "TileGrid", y: int) -> None:
+        super().__init__(grid, y)
+        self._offset = y * grid.width
+
+    def _get(self, x: int) -> Any:
+        code = self._grid.kinds[self._offset + x]
+        if code >= PLAYER:
+            return self._grid.objects[(x, self._y)]
+        return _NAMES[code]
+
+    def _set(self, x: int, value: Any) -> None:
+        self._grid.set(x, self._y, value)
+
+
+class EntityIndex:
+    """Positions of a grid's objects grouped by type and by name.
+
+    :meth:`TileGrid.set` keeps the index in step with the object layer, so
+    lookups such as "where is the Rat King" or "every enemy" cost a dictionary
+    access instead of a scan of the grid.  Matches are returned in the order
+    the objects were placed.
+    """
+
+    __slots__ = ("_by_type", "_by_name", "_names")
+
+    def __init__(self) -> None:
+        self._by_type: Dict[type, Dict[Tuple[int, int], Any]] = {}
+        self._by_name: Dict[str, Dict[Tuple[int, int], Any]] = {}
+        # Name each cell was indexed under, in case the object is renamed.
+        self._names: Dict[Tuple[int, int], str] = {}
+
+    def __len__(self) -> int:
+        return sum(len(cells) for cells in self._by_type.values())
+
+    def add(self, pos: Tuple[int, int], obj: Any) -> None:
+        """Record ``obj`` at ``pos``."""
+
+        self._by_type.setdefault(type(obj), {})[pos] = obj
+        name = getattr(obj, "name", None)
+        if isinstance(name, str):
+            self._by_name.setdefault(name, {})[pos] = obj
+            self._names[pos] = name
+
+    def remove(self, pos: Tuple[int, int], obj: Any) -> None:
+        """Forget ``obj`` at ``pos``."""
+
+        cells = self._by_type.get(type(obj))
+        if cells is not None:
+            cells.pop(pos, None)
+        name = self._names.pop(pos, None)
+        if name is not None:
+            cells = self._by_name[name]
+            cells.pop(pos, None)
+            if not cells:
+                del self._by_name[name]
+
+    def named(self, name: str, cls: type = object) -> List[Tuple[Any, int, int]]:
+        """Return ``(obj, x, y)`` for every ``cls`` instance called ``name``."""
+
+        cells = self._by_name.get(name, {})
+        return [(obj, x, y) for (x, y), obj in cells.items() if isinstance(obj, cls)]
+
+    def of_type(self, cls: type) -> List[Tuple[Any, int, int]]:
+        """Return ``(obj, x, y)`` for every instance of ``cls`` or a subclass."""
+
+        return [
+            (obj, x, y)
+            for kind, cells in self._by_type.items()
+            if issubclass(kind, cls)
+            for (x, y), obj in cells.items()
+        ]
+
+
+class TileGrid:
+    """Byte-per-cell room grid with a sparse object layer.
+
+    Parameters
+    ----------
+    width, height:
+        Grid dimensions.  Every cell starts as ``None`` (uncarved).
+
+    Attributes
+    ----------
+    kinds:
+        ``bytearray`` of tile codes in row-major order.
+    objects:
+        Mapping of ``(x, y)`` to the object stored in that cell.
+    index:
+        :class:`EntityIndex` of :attr:`objects`.
+    walls_version:
+        Counter bumped whenever a cell turns into a wall or is opened up, so
+        caches built on walkability (see :mod:`dungeoncrawler.pathfinding`)
+        know when to rebuild.
+    """
+
+    __slots__ = ("width", "height", "kinds", "objects", "index", "walls_version", "_rows")
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.kinds = bytearray(width * height)
+        self.objects: Dict[Tuple[int, int], Any] = {}
+        self.index = EntityIndex()
+        self.walls_version = 0
+        self._rows = [_Row(self, y) for y in range(height)]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> "TileGrid":
+        """Build a grid from nested lists."""
+
+        height = len(rows)
+        grid = cls(len(rows[0]) if height else 0, height)
+        for y, row in enumerate(rows):
+            for x, value in enumerate(row):
+                if value is not None:
+                    grid.set(x, y, value)
+        return grid
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> _Row:
+        return self._rows[y]
+
+    def __iter__(self) -> Iterator[_Row]:
+        return iter(self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TileGrid):
+            return (
+                self.width == other.width
+                and self.kinds == other.kinds
+                and self.objects == other.objects
+            )
+        try:
+            return self.to_lists() == [list(row) for row in other]  # type: ignore[attr-defined]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TileGrid({self.width}x{self.height}, {len(self.objects)} objects)"
+
+    def get(self, x: int, y: int) -> Any:
+        """Return the value at ``(x, y)``."""
+
+        code = self.kinds[y * self.width + x]
+        if code >= PLAYER:
+            return self.objects[(x, y)]
+        return _NAMES[code]
+
+    def set(self, x: int, y: int, value: Any) -> None:
+        """Store ``value`` at ``(x, y)``."""
+
+        code = _code_for(value)
+        cell = y * self.width + x
+        pos = (x, y)
+        old = self.kinds[cell]
+        if old >= PLAYER:
+            self.index.remove(pos, self.objects.pop(pos))
+        if (old == VOID) != (code == VOID):
+            self.walls_version += 1
+        self.kinds[cell] = code
+        if code >= PLAYER:
+            self.objects[pos] = value
+            self.index.add(pos, value)
+
+    def is_open(self, x: int, y: int) -> bool:
+        """Return whether ``(x, y)`` is inside the grid and carved."""
+
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.kinds[y * self.width + x])
+
+    def open_cells(self) -> List[Tuple[int, int]]:
+        """Return row-major ``(x, y)`` positions of every carved cell."""
+
+        width = self.width
+        return [(index % width, index // width) for index in compress(count(), self.kinds)]
+
+    def positions(self, value: str) -> List[Tuple[int, int]]:
+        """Return row-major ``(x, y)`` positions holding the tile string ``value``."""
+
+        code = TILE_CODES.get(value)
+        if code is None:
+            return [pos for pos, obj in sorted(self.objects.items()) if obj == value]
+        kinds, width, columns = self.kinds, self.width, range(self.width)
+        return [
+            (x, y)
+            for y in range(self.height)
+            for x in compress(columns, map(code.__eq__, kinds[y * width : (y + 1) * width]))
+        ]
+
+    def enemies(self) -> Iterator[Tuple[Enemy, int, int]]:
+        """Yield ``(enemy, x, y)`` for every enemy on the grid."""
+
+        width = self.width
+        needle = bytes((ENEMY,))
+        index = self.kinds.find(needle)
+        while index != -1:
+            x, y = index % width, index // width
+            yield self.objects[(x, y)], x, y
+            index = self.kinds.find(needle, index + 1)
+
+    def to_lists(self) -> List[List[Any]]:
+        """Return the grid as nested lists."""
+
+        return [list(row) for row in self._rows]
+
+    def tile_bytes(self) -> Tuple[bytes, Dict[int, str]]:
+        """Return the tile layer without objects and the names of its codes.
+
+        Codes are interned per process, so the name table is needed to read
+        the bytes back with :meth:`from_tile_bytes` elsewhere.
+        """
+
+        kinds = bytes(self.kinds).translate(_WITHOUT_OBJECTS)
+        return kinds, {code: _NAMES[code] for code in set(kinds) if code}
+
+    @classmethod
+    def from_tile_bytes(
+        cls, width: int, height: int, kinds: bytes, names: Dict[int, str]
+    ) -> "TileGrid":
+        """Rebuild a grid from :meth:`tile_bytes` output.  Objects are not restored."""
+
+        table = bytearray(range(256))
+        for code, name in names.items():
+            table[code] = _tile_code(name)
+        grid = cls(width, height)
+        grid.kinds[:] = kinds.translate(table)
+        return grid
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(value: int) -> int:
+    """Scramble ``value`` into a well-distributed 64-bit integer (SplitMix64)."""
+
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class _NameRow(RowView):
+    """Mutable view of one row of :class:`RoomNames`."""
+
+    __slots__ = ()
+
+    def _get(self, x: int) -> str:
+        return self._grid.get(x, self._y)
+
+    def _set(self, x: int, value: str) -> None:
+        self._grid.set(x, self._y, value)
+
+
+class RoomNames:
+    """Room names of a floor, derived on demand from a seed.
+
+    The name of a cell is picked from ``adjectives`` and ``nouns`` by hashing
+    ``seed`` with the cell's index, so nothing is stored per cell and building
+    a floor draws no random numbers for names.  Only renamed rooms are kept,
+    in :attr:`overrides`.  ``names[y][x]`` reads and writes like the nested
+    lists this replaces.
+
+    Parameters
+    ----------
+    width, height:
+        Floor dimensions.
+    seed:
+        Integer the names are derived from.
+    adjectives, nouns:
+        Word lists combined into ``"<adjective> <noun>"`` names.
+    overrides:
+        Optional mapping of flat cell index (``y * width + x``) to name.
+    """
+
+    __slots__ = ("width", "height", "seed", "adjectives", "nouns", "overrides", "_rows")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        seed: int,
+        adjectives: Sequence[str],
+        nouns: Sequence[str],
+        overrides: Optional[Dict[int, str]] = None,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.adjectives = adjectives
+        self.nouns = nouns
+        self.overrides: Dict[int, str] = dict(overrides or {})
+        self._rows = [_NameRow(self, y) for y in range(height)]
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> _NameRow:
+        return self._rows[y]
+
+    def __iter__(self) -> Iterator[_NameRow]:
+        return iter(self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RoomNames):
+            return self.to_lists() == other.to_lists()
+        try:
+            return self.to_lists() == [list(row) for row in other]  # type: ignore[attr-defined]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RoomNames({self.width}x{self.height}, {len(self.overrides)} renamed)"
+
+    def generated(self, x: int, y: int) -> str:
+        """Return the name derived for ``(x, y)``, ignoring renames."""
+
+        value = _mix(self.seed ^ (y * self.width + x))
+        adjectives, nouns = self.adjectives, self.nouns
+        return f"{adjectives[value % len(adjectives)]} {nouns[(value >> 32) % len(nouns)]}"
+
+    def get(self, x: int, y: int) -> str:
+        """Return the name of the room at ``(x, y)``."""
+
+        name = self.overrides.get(y * self.width + x)
+        return self.generated(x, y) if name is None else name
+
+    def set(self, x: int, y: int, name: str) -> None:
+        """Rename the room at ``(x, y)``."""
+
+        index = y * self.width + x
+        if name == self.generated(x, y):
+            self.overrides.pop(index, None)
+        else:
+            self.overrides[index] = name
+
+    def to_lists(self) -> List[List[str]]:
+        """Return the names as nested lists."""
+
+        return [list(row) for row in self._rows]
+
+
+def find_tiles(rooms: Sequence[Sequence[Any]], value: str) -> List[Tuple[int, int]]:
+    """Return row-major positions in ``rooms`` equal to the tile string ``value``."""
+
+    if isinstance(rooms, TileGrid):
+        return rooms.positions(value)
+    return [(x, y) for y, row in enumerate(rooms) for x, obj in enumerate(row) if obj == value]
+
+
+def open_cells(rooms: Sequence[Sequence[Any]]) -> List[Tuple[int, int]]:
+    """Return row-major positions in ``rooms`` that are not walls."""
+
+    if isinstance(rooms, TileGrid):
+        return rooms.open_cells()
+    return [(x, y) for y, row in enumerate(rooms) for x, obj in enumerate(row) if obj is not None]
+
+
+def find_enemy(rooms: Sequence[Sequence[Any]], name: str) -> Optional[Tuple[Enemy, int, int]]:
+    """Return ``(enemy, x, y)`` for the first enemy called ``name`` or ``None``."""
+
+    if isinstance(rooms, TileGrid):
+        found = rooms.index.named(name, Enemy)
+        return found[0] if found else None
+    for y, row in enumerate(rooms):
+        for x, obj in enumerate(row):
+            if isinstance(obj, Enemy) and obj.name == name:
+                return obj, x, y
+    return None
+
+
+def find_entities(rooms: Sequence[Sequence[Any]], cls: type) -> List[Tuple[Any, int, int]]:
+    """Return ``(obj, x, y)`` for every instance of ``cls`` on the grid."""
+
+    if isinstance(rooms, TileGrid):
+        return rooms.index.of_type(cls)
+    return [
+        (obj, x, y)
+        for y, row in enumerate(rooms)
+        for x, obj in enumerate(row)
+        if isinstance(obj, cls)
+    ]
+
+
+__all__ = [
+    "TILE_CODES",
+    "EntityIndex",
+    "RoomNames",
+    "TileGrid",
+    "find_enemy",
+    "find_entities",
+    "find_tiles",
+    "open_cells",
+]
@@ -22,21 +22,17 @@ class Hooks(FloorHooks):
     def on_turn(self, state, floor):
         """Spawn spectral rats each turn unless the boss is stunned."""
         game = state.game
-        boss = None
-        for y, row in enumerate(game.rooms):
-            for x, obj in enumerate(row):
-                if isinstance(obj, Enemy) and obj.name == "Rat King":
-                    boss = obj
-                    break
-            if boss:
-                break
-        if not boss or "stun" in boss.status_effects:
+        found = state.find_enemy("Rat King")
+        if not found:
+            return
+        boss, bx, by = found
+        if "stun" in boss.status_effects:
             return
 
         # Find empty adjacent tiles around the boss
         positions = []
         for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = boss.x + dx, boss.y + dy
+            nx, ny = bx + dx, by + dy
             if 0 <= nx < game.width and 0 <= ny < game.height and game.rooms[ny][nx] is None:
                 positions.append((nx, ny))
         if not positions:
@@ -63,10 +59,8 @@ class Hooks(FloorHooks):
     def on_objective_check(self, state, floor):
         """Open the exit once the Rat King has been defeated."""
         game = state.game
-        for y, row in enumerate(game.rooms):
-            for x, obj in enumerate(row):
-                if isinstance(obj, Enemy) and obj.name == "Rat King":
-                    return False
+        if state.find_enemy("Rat King"):
+            return False
         if self.exit_location and game.exit_coords is None:
             ex, ey = self.exit_location
             game.rooms[ey][ex] = "Exit"
@@ -1,7 +1,6 @@
 from itertools import cycle
 
 from dungeoncrawler.dungeon import FloorHooks
-from dungeoncrawler.entities import Enemy
 
 
 class Hooks(FloorHooks):
@@ -11,15 +10,12 @@ class Hooks(FloorHooks):
         self._cycle = cycle(["physical", "fire", "ice"])
         self.current_immunity = next(self._cycle)
 
-    def _find_boss(self, game):
-        for row in game.rooms:
-            for obj in row:
-                if isinstance(obj, Enemy) and obj.name == "Warden Statue":
-                    return obj
-        return None
+    def _find_boss(self, state):
+        found = state.find_enemy("Warden Statue")
+        return found[0] if found else None
 
     def on_turn(self, state, floor):
-        boss = self._find_boss(state.game)
+        boss = self._find_boss(state)
         if boss:
             boss.current_immunity = self.current_immunity
             self.current_immunity = next(self._cycle)
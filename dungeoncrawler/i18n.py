@@ -1,9 +1,31 @@
 from __future__ import annotations
 
-import gettext
+import gettext as _gettext
 import locale
 from pathlib import Path
 
+# Catalog used by :func:`gettext`, resolved on first use.
+_catalog: _gettext.NullTranslations | None = None
+
+
+def gettext(message: str) -> str:
+    """Return the translation of ``message`` like :func:`gettext.gettext`.
+
+    :func:`gettext.gettext` searches for the message catalog on every call,
+    which dominates message-heavy code such as combat.  Here the catalog of
+    the current text domain is looked up once and reused until
+    :func:`set_language` runs again.
+    """
+
+    global _catalog
+    if _catalog is None:
+        domain = _gettext.textdomain()
+        try:
+            _catalog = _gettext.translation(domain, _gettext.bindtextdomain(domain), fallback=True)
+        except OSError:
+            _catalog = _gettext.NullTranslations()
+    return _catalog.gettext(message)
+
 
 def set_language(lang: str | None = None) -> None:
     """Initialize translations for the given language code.
@@ -28,6 +50,8 @@ def set_language(lang: str | None = None) -> None:
 
     localedir = Path(__file__).resolve().parent.parent / "locale"
     languages = [lang] if lang else None
-    gettext.translation(
+    global _catalog
+    _catalog = None
+    _gettext.translation(
         "messages", localedir=localedir, languages=languages, fallback=True
     ).install()
@@ -0,0 +1,253 @@
+"""Paths and walking distances over the room grid.
+
+A cell is walkable when it holds anything other than ``None``, the same rule
+:func:`dungeoncrawler.map.move_player` applies.  :class:`Pathfinder` answers
+two kinds of query for one floor:
+
+* :meth:`Pathfinder.path` runs A* between two cells.
+* :meth:`Pathfinder.distance_map` measures the walking distance from every
+  cell to the nearest of several sources.  Every step costs the same, so the
+  Dijkstra search is a breadth-first search.  One map serves any number of
+  agents heading for the same goal, which is how :meth:`Pathfinder.step_toward`
+  answers many "which way to the player" questions per turn.
+
+Results are cached until a cell turns into a wall or opens up.  On a
+:class:`~dungeoncrawler.grid.TileGrid` that is tracked by
+:attr:`~dungeoncrawler.grid.TileGrid.walls_version`.  Nested lists have no
+such counter and are searched afresh on every query.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .grid import TileGrid
+
+Cell = Tuple[int, int]
+
+# Cached distance maps and paths kept per floor before the caches are reset.
+MAX_CACHED = 256
+
+
+class DistanceMap:
+    """Walking distances from every cell to the nearest source.
+
+    Parameters
+    ----------
+    width, height:
+        Grid dimensions.
+    distances:
+        Row-major distances with ``-1`` for cells that were not reached.
+    """
+
+    __slots__ = ("width", "height", "distances")
+
+    def __init__(self, width: int, height: int, distances: array) -> None:
+        self.width = width
+        self.height = height
+        self.distances = distances
+
+    def distance(self, x: int, y: int) -> Optional[int]:
+        """Return the steps from ``(x, y)`` to the nearest source or ``None``."""
+
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        distance = self.distances[y * self.width + x]
+        return None if distance < 0 else distance
+
+    def step_from(self, x: int, y: int) -> Optional[Cell]:
+        """Return the neighbour of ``(x, y)`` one step closer to a source.
+
+        ``None`` is returned at a source and for unreached cells.
+        """
+
+        distance = self.distance(x, y)
+        if not distance:
+            return None
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if self.distance(nx, ny) == distance - 1:
+                return nx, ny
+        return None  # pragma: no cover - a reached cell always has a parent
+
+    def path_from(self, x: int, y: int) -> Optional[List[Cell]]:
+        """Return the cells from ``(x, y)`` to the nearest source, inclusive."""
+
+        if self.distance(x, y) is None:
+            return None
+        path = [(x, y)]
+        step = self.step_from(x, y)
+        while step is not None:
+            path.append(step)
+            step = self.step_from(*step)
+        return path
+
+
+class Pathfinder:
+    """Cached path and distance queries for one floor's ``rooms``.
+
+    Parameters
+    ----------
+    rooms:
+        A :class:`~dungeoncrawler.grid.TileGrid` or nested lists.
+    """
+
+    def __init__(self, rooms: Sequence[Sequence[Any]]) -> None:
+        self.rooms = rooms
+        self.height = len(rooms)
+        self.width = len(rooms[0]) if self.height else 0
+        self._version: Optional[int] = None
+        self._maps: Dict[Tuple[Tuple[int, ...], Optional[int]], DistanceMap] = {}
+        self._paths: Dict[Tuple[int, int], Optional[List[Cell]]] = {}
+
+    def _open(self) -> Sequence[int]:
+        """Return the walkability mask, dropping stale cached results."""
+
+        rooms = self.rooms
+        if isinstance(rooms, TileGrid):
+            if rooms.walls_version != self._version:
+                self._version = rooms.walls_version
+                self._maps.clear()
+                self._paths.clear()
+            return rooms.kinds
+        self._maps.clear()
+        self._paths.clear()
+        return bytes(cell is not None for row in rooms for cell in row)
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Return whether ``(x, y)`` is inside the grid and not a wall."""
+
+        return 0 <= x < self.width and 0 <= y < self.height and self.rooms[y][x] is not None
+
+    def distance_map(self, sources: Iterable[Cell], limit: Optional[int] = None) -> DistanceMap:
+        """Return walking distances to the nearest of ``sources``.
+
+        Parameters
+        ----------
+        sources:
+            Cells the distances are measured from.  Walls are ignored.
+        limit:
+            Optional search depth.  Farther cells are reported as unreached.
+        """
+
+        open_cells = self._open()
+        width, size = self.width, self.width * self.height
+        starts = tuple(
+            sorted(
+                {
+                    y * width + x
+                    for x, y in sources
+                    if 0 <= x < width and 0 <= y < self.height and open_cells[y * width + x]
+                }
+            )
+        )
+        key = (starts, limit)
+        cached = self._maps.get(key)
+        if cached is not None:
+            return cached
+
+        distances = array("i", [-1]) * size
+        for index in starts:
+            distances[index] = 0
+        frontier = list(starts)
+        steps = 0
+        last = width - 1
+        while frontier and (limit is None or steps < limit):
+            steps += 1
+            ring = []
+            for index in frontier:
+                x = index % width
+                for near, inside in (
+                    (index - 1, x > 0),
+                    (index + 1, x < last),
+                    (index - width, index >= width),
+                    (index + width, index + width < size),
+                ):
+                    if inside and open_cells[near] and distances[near] < 0:
+                        distances[near] = steps
+                        ring.append(near)
+            frontier = ring
+
+        result = DistanceMap(width, self.height, distances)
+        if len(self._maps) >= MAX_CACHED:
+            self._maps.clear()
+        self._maps[key] = result
+        return result
+
+    def path(self, start: Cell, goal: Cell) -> Optional[List[Cell]]:
+        """Return the cells of a shortest walk from ``start`` to ``goal``.
+
+        Both ends are included.  ``start`` itself need not be walkable, so an
+        entity standing on any cell can ask for a route.  Returns ``None``
+        when ``goal`` cannot be reached.
+        """
+
+        open_cells = self._open()
+        width, height = self.width, self.height
+        if not (0 <= start[0] < width and 0 <= start[1] < height):
+            return None
+        if not self.is_walkable(*goal):
+            return None
+        begin = start[1] * width + start[0]
+        end = goal[1] * width + goal[0]
+        key = (begin, end)
+        if key in self._paths:
+            cached = self._paths[key]
+            return None if cached is None else list(cached)
+
+        gx, gy = goal
+        size = width * height
+        last = width - 1
+        parents: Dict[int, int] = {begin: begin}
+        costs: Dict[int, int] = {begin: 0}
+        heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0, begin)]
+        found = False
+        while heap:
+            __, cost, index = heapq.heappop(heap)
+            if index == end:
+                found = True
+                break
+            if cost > costs[index]:
+                continue
+            x = index % width
+            cost += 1
+            for near, inside in (
+                (index - 1, x > 0),
+                (index + 1, x < last),
+                (index - width, index >= width),
+                (index + width, index + width < size),
+            ):
+                if inside and open_cells[near] and cost < costs.get(near, size):
+                    costs[near] = cost
+                    parents[near] = index
+                    nx, ny = near % width, near // width
+                    heapq.heappush(heap, (cost + abs(nx - gx) + abs(ny - gy), cost, near))
+
+        path: Optional[List[Cell]] = None
+        if found:
+            path = []
+            index = end
+            while index != begin:
+                path.append((index % width, index // width))
+                index = parents[index]
+            path.append(start)
+            path.reverse()
+        if len(self._paths) >= MAX_CACHED:
+            self._paths.clear()
+        self._paths[key] = path
+        return None if path is None else list(path)
+
+    def step_toward(self, start: Cell, goal: Cell, limit: Optional[int] = None) -> Optional[Cell]:
+        """Return the next cell on a shortest walk from ``start`` to ``goal``.
+
+        The walk comes from the cached distance map of ``goal``, so any
+        number of agents chasing the same goal share one search.  ``limit``
+        bounds that search; ``None`` is returned when ``start`` is farther
+        away, unreachable or already at ``goal``.
+        """
+
+        return self.distance_map([goal], limit).step_from(*start)
+
+
+__all__ = ["DistanceMap", "Pathfinder"]
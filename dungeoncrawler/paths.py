@@ -6,13 +6,15 @@ import logging
 import shutil
 from pathlib import Path
 
-from platformdirs import user_config_path, user_data_path
+from platformdirs import user_cache_path, user_config_path, user_data_path
 
 APP_NAME = "dungeon_crawler"
 
 # Base directories determined by platformdirs
 SAVE_DIR = Path(user_data_path(APP_NAME)) / "saves"
 CONFIG_DIR = Path(user_config_path(APP_NAME))
+# Disposable results such as cached balance simulations
+CACHE_DIR = Path(user_cache_path(APP_NAME))
 # Legacy directory used by older versions of the game
 LEGACY_DIR = Path.home() / ".dungeon_crawler"
 
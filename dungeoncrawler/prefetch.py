@@ -0,0 +1,77 @@
+"""Build the next dungeon floor in the background.
+
+Generating a late floor takes tens of milliseconds, which used to be spent
+synchronously when the player descended.  :class:`FloorPrefetcher` runs
+:func:`dungeoncrawler.map.build_floor` for the following floor on a daemon
+thread while the current one is played.  On descent the prepared layout is
+swapped in if it was built for the same key, otherwise the caller generates
+the floor as before.
+
+Builds only read a game's static data and draw from a per-floor random
+substream, so the prepared floor is identical to one generated on demand.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Dict, Hashable, Optional
+
+from .map import FloorLayout
+
+logger = logging.getLogger(__name__)
+
+
+class FloorPrefetcher:
+    """Holds at most one floor being built ahead of time."""
+
+    def __init__(self) -> None:
+        self._key: Optional[Hashable] = None
+        self._thread: Optional[threading.Thread] = None
+        self._result: Dict[str, FloorLayout] = {}
+
+    @property
+    def pending(self) -> Optional[Hashable]:
+        """Key of the floor being prepared, if any."""
+
+        return self._key
+
+    def start(self, key: Hashable, build: Callable[[], FloorLayout]) -> None:
+        """Run ``build`` on a background thread and remember it under ``key``.
+
+        A floor that is still being prepared is dropped.
+        """
+
+        result: Dict[str, FloorLayout] = {}
+
+        def run() -> None:
+            try:
+                result["layout"] = build()
+            except Exception:  # pragma: no cover - surfaced by the sync rebuild
+                logger.exception("Background generation of %r failed", key)
+
+        thread = threading.Thread(target=run, name="floor-prefetch", daemon=True)
+        self._key, self._thread, self._result = key, thread, result
+        thread.start()
+
+    def take(self, key: Hashable) -> Optional[FloorLayout]:
+        """Return the floor prepared for ``key``, waiting for it if needed.
+
+        Returns ``None`` when nothing was prepared for ``key`` or the build
+        failed.  The prefetcher is empty afterwards either way.
+        """
+
+        thread, result, pending = self._thread, self._result, self._key
+        self.discard()
+        if thread is None or pending != key:
+            return None
+        thread.join()
+        return result.get("layout")
+
+    def discard(self) -> None:
+        """Forget the floor being prepared."""
+
+        self._key, self._thread, self._result = None, None, {}
+
+
+__all__ = ["FloorPrefetcher"]
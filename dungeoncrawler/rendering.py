@@ -8,6 +8,7 @@ remain in this module.
 
 from __future__ import annotations
 
+from .core.map import as_bitgrid
 from .ui.terminal import Renderer  # re-export for existing imports
 
 # ----------------------------------------------------------------------
@@ -15,24 +16,37 @@ from .ui.terminal import Renderer  # re-export for existing imports
 # ----------------------------------------------------------------------
 
 
-def render_map_string(game) -> str:
-    """Return a simple string representation of the dungeon map."""
+# Discovered-but-not-visible cells print as "·", unseen cells as " ".
+_FOG = str.maketrans("01", " ·")
+
 
+def render_map_string(game) -> str:
+    """Return a simple string representation of the dungeon map.
+
+    Each row is built from the packed ``discovered`` bits and then the few
+    visible cells are filled in, rather than reading every cell through the
+    row views.
+    """
+
+    width, height = game.width, game.height
+    visible = as_bitgrid(game.visible, width, height)
+    discovered = as_bitgrid(game.discovered, width, height)
+    marks = {(game.player.x, game.player.y): "@"}
+    if game.exit_coords is not None:
+        marks.setdefault(tuple(game.exit_coords), "E")
+    top = 1 << width  # sentinel bit so ``format`` keeps leading zeros
     rows = []
-    for y in range(game.height):
-        row = ""
-        for x in range(game.width):
-            if game.visible[y][x]:
-                if (x, y) == (game.player.x, game.player.y):
-                    row += "@"
-                elif (x, y) == game.exit_coords:
-                    row += "E"
-                else:
-                    row += "."
-            elif game.discovered[y][x]:
-                row += "·"
-            else:
-                row += " "
+    for y in range(height):
+        row = format(discovered.row_mask(y) | top, "b")[:0:-1].translate(_FOG)
+        seen = visible.row_mask(y)
+        if seen:
+            cells = list(row)
+            while seen:
+                low = seen & -seen
+                x = low.bit_length() - 1
+                cells[x] = marks.get((x, y), ".")
+                seen ^= low
+            row = "".join(cells)
         rows.append(row)
     return "\n".join(rows)
 
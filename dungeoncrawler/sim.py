@@ -3,56 +3,175 @@
 from __future__ import annotations
 
 import argparse
+import math
 import random
+import sys
+import time
 from dataclasses import dataclass
-from typing import Dict, Mapping
+from itertools import cycle
+from statistics import NormalDist
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from .config import config
 from .core.combat import resolve_enemy_turn, resolve_player_action
+from .core.data import load_enemies
 from .core.entity import Entity
+from .core.rng import derive_seed
 from .dungeon import ENEMY_STATS
 from .entities import CLASS_DEFS
+from .map import floor_multipliers, scaled_enemy_ranges
 
+# Available combat resolvers. ``python`` replays each battle through
+# :mod:`dungeoncrawler.core.combat`; ``numpy`` resolves all runs at once using
+# :mod:`dungeoncrawler.batch_combat`.  ``game`` fights every battle through the
+# real ``combat.battle`` loop with skills, abilities and traits using
+# :mod:`dungeoncrawler.arena`.  ``exact`` solves the matchup as a Markov chain
+# with :mod:`dungeoncrawler.exact_combat` and ignores ``runs``.
+SAMPLING_ENGINES = ("python", "numpy", "game")
+ENGINES = SAMPLING_ENGINES + ("exact",)
 
-def simulate_battles(
+# Bump whenever a change to the combat resolvers alters simulated results so
+# cached balance results are recomputed.
+ENGINE_VERSION = 3
+
+# Hero profile used when callers do not supply player stats.
+DEFAULT_PLAYER_STATS = {"health": 30, "attack": 8, "speed": 10}
+
+# Battles simulated between confidence checks in adaptive mode.
+ADAPTIVE_BATCH = 25
+
+# Floor scaling for every enemy archetype, rebuilt whenever ``ENEMY_STATS``
+# or ``config.max_floors`` change.  See :func:`floor_stat_table`.
+_floor_table: Tuple[Any, Dict[Tuple[str, int], Dict[str, Any]]] = (None, {})
+
+
+def enemy_intents(enemy_name: str) -> List[str]:
+    """Return the repeating intent cycle for ``enemy_name``.
+
+    Intents come from ``data/core_enemies.json``.  Enemies without an entry
+    simply attack every turn.
+    """
+
+    intents = load_enemies().get(enemy_name, {}).get("intents", [])
+    return [entry.get("action", "attack") for entry in intents] or ["attack"]
+
+
+def scaled_stats(base: Sequence[int], floor: int) -> Dict[str, Any]:
+    """Return simulator stats for an ``ENEMY_STATS`` entry spawned on ``floor``."""
+
+    (hp_min, hp_max), (atk_min, atk_max), defense = scaled_enemy_ranges(tuple(base), floor)
+    hp_mult, dmg_mult = floor_multipliers(floor)
+    return {
+        "health": (int(hp_min * hp_mult), int(hp_max * hp_mult)),
+        "attack": (int(atk_min * dmg_mult), int(atk_max * dmg_mult)),
+        "defense": defense,
+        "speed": 10,
+    }
+
+
+def floor_stat_table() -> Dict[Tuple[str, int], Dict[str, Any]]:
+    """Return simulator stats for every ``(enemy_name, floor)`` pair.
+
+    The table applies the same scaling as
+    :func:`dungeoncrawler.map.generate_dungeon` on floors 1 to
+    ``config.max_floors``: floor-shifted health and attack ranges, defense
+    raised by ``floor // 3`` and the per-floor health and damage multipliers
+    including the hard band.  The multipliers are applied to the range
+    endpoints, so rolls are spread uniformly between them rather than over
+    the multiplied values of each integer roll.
+
+    The table is computed once and rebuilt only when ``ENEMY_STATS`` changes.
+    """
+
+    global _floor_table
+    fingerprint = (config.max_floors, tuple((k, tuple(v)) for k, v in ENEMY_STATS.items()))
+    if _floor_table[0] != fingerprint:
+        table = {
+            (name, floor): scaled_stats(base, floor)
+            for name, base in ENEMY_STATS.items()
+            for floor in range(1, config.max_floors + 1)
+        }
+        _floor_table = (fingerprint, table)
+    return _floor_table[1]
+
+
+def enemy_stat_ranges(
+    enemy_name: str, floor: int | None = None, stats: Sequence[int] | None = None
+) -> Dict[str, Any]:
+    """Return simulator stats for ``enemy_name`` with ``(low, high)`` roll ranges.
+
+    Without ``floor`` the unscaled archetype stats are returned.  With it the
+    stats match enemies spawned on that floor; see :func:`floor_stat_table`.
+    ``stats`` replaces the enemy's ``ENEMY_STATS`` entry, which lets callers
+    try out proposed stats without editing the table.
+    """
+
+    if stats is None and enemy_name not in ENEMY_STATS:
+        raise KeyError(f"Unknown enemy: {enemy_name}")
+    if floor is not None and not 1 <= floor <= config.max_floors:
+        raise ValueError(f"Floor must be between 1 and {config.max_floors}")
+    if stats is not None:
+        if floor is not None:
+            return scaled_stats(stats, floor)
+        hp_min, hp_max, atk_min, atk_max, defense = stats
+    elif floor is not None:
+        return dict(floor_stat_table()[enemy_name, floor])
+    else:
+        hp_min, hp_max, atk_min, atk_max, defense = ENEMY_STATS[enemy_name]
+    return {
+        "health": (hp_min, hp_max),
+        "attack": (atk_min, atk_max),
+        "defense": defense,
+        "speed": 10,
+    }
+
+
+def battle_outcomes(
     enemy_name: str,
     runs: int,
     seed: int | None = None,
     player_stats: Mapping[str, int] | None = None,
-) -> Dict[str, float]:
-    """Simulate ``runs`` battles against ``enemy_name``.
-
-    Parameters
-    ----------
-    enemy_name:
-        Name of the enemy archetype to fight.
-    runs:
-        Number of battles to simulate.
-    seed:
-        Optional seed for deterministic results.
-    player_stats:
-        Optional mapping defining the player's ``health``, ``attack`` and
-        ``speed`` values. Defaults to a basic hero profile.
+    engine: str = "python",
+    floor: int | None = None,
+    stats: Sequence[int] | None = None,
+    intents: bool = False,
+) -> Tuple[int, int]:
+    """Return ``(wins, total_turns)`` for ``runs`` battles against ``enemy_name``.
 
-    Returns
-    -------
-    dict
-        Dictionary with ``winrate`` and ``avg_turns``.
+    ``total_turns`` only counts battles the player won.  Raw counts rather
+    than rates let callers merge several independently seeded shards exactly.
+    The parameters match :func:`simulate_battles` but only the sampling
+    engines are accepted.  ``stats`` overrides the enemy's ``ENEMY_STATS``
+    entry as in :func:`enemy_stat_ranges`.
     """
 
+    if engine not in SAMPLING_ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    enemy_stats = enemy_stat_ranges(enemy_name, floor, stats)
+    hp_min, hp_max = enemy_stats["health"]
+    atk_min, atk_max = enemy_stats["attack"]
+    defense = enemy_stats["defense"]
+    base_player = {**DEFAULT_PLAYER_STATS, **(player_stats or {})}
+    cycle_actions = enemy_intents(enemy_name) if intents else ["attack"]
+
+    if engine == "numpy":
+        from .batch_combat import batch_outcomes
+
+        return batch_outcomes(enemy_stats, base_player, runs, seed=seed, intents=cycle_actions)
+    if engine == "game":
+        from .arena import run_arena
+
+        report = run_arena(enemy_name, runs, seed, base_player, floor, stats)
+        return report.wins, report.total_turns
+
+    # Stat rolls and combat rolls use private generators so concurrent
+    # simulations never share or disturb the global random state.  The
+    # combat stream is derived from the seed, as in RNGContext, so the two
+    # streams are independent.
     rng = random.Random(seed)
-    if seed is not None:
-        state = random.getstate()
-        random.seed(seed)
-    else:
-        state = None
-    if enemy_name not in ENEMY_STATS:
-        raise KeyError(f"Unknown enemy: {enemy_name}")
-    hp_min, hp_max, atk_min, atk_max, defense = ENEMY_STATS[enemy_name]
+    combat_rng = random.Random(None if seed is None else derive_seed(seed, "combat"))
     wins = 0
     total_turns = 0
-    base_player = {"health": 30, "attack": 8, "speed": 10}
-    if player_stats:
-        base_player.update(player_stats)
     for _ in range(runs):
         player = Entity("Hero", base_player.copy())
         enemy = Entity(
@@ -63,25 +182,186 @@ def simulate_battles(
                 "defense": defense,
                 "speed": 10,
             },
+            intent=cycle([(action, "") for action in cycle_actions]) if intents else None,
         )
         turns = 0
         while player.stats["health"] > 0 and enemy.stats["health"] > 0:
-            resolve_player_action(player, enemy, "attack")
+            resolve_player_action(player, enemy, "attack", combat_rng)
             if enemy.stats["health"] <= 0:
                 turns += 1
                 break
-            resolve_enemy_turn(enemy, player)
+            resolve_enemy_turn(enemy, player, combat_rng)
             turns += 1
         if player.stats["health"] > 0:
             wins += 1
             total_turns += turns
+    return wins, total_turns
+
+
+def solve_exact(
+    enemy_name: str,
+    player_stats: Mapping[str, int] | None,
+    floor: int | None = None,
+    stats: Sequence[int] | None = None,
+    intents: bool = False,
+) -> Optional[Dict[str, float]]:
+    """Return the exact solution for a duel or ``None`` when unsupported.
+
+    ``player_stats``, ``stats`` and ``intents`` are interpreted as in
+    :func:`battle_outcomes`.  The result holds ``winrate`` and
+    ``avg_turns`` from :func:`dungeoncrawler.exact_combat.solve_battle`.
+    """
+
+    from .exact_combat import UnsupportedMatchup, solve_battle
+
+    base_player = {**DEFAULT_PLAYER_STATS, **(player_stats or {})}
+    try:
+        return solve_battle(
+            enemy_stat_ranges(enemy_name, floor, stats),
+            base_player,
+            enemy_intents(enemy_name) if intents else ["attack"],
+        )
+    except UnsupportedMatchup:
+        return None
+
+
+def wilson_interval(wins: int, runs: int, z: float) -> Tuple[float, float]:
+    """Return the Wilson score interval for ``wins`` out of ``runs``."""
+
+    if runs <= 0:
+        return 0.0, 1.0
+    p = wins / runs
+    denom = 1 + z * z / runs
+    centre = (p + z * z / (2 * runs)) / denom
+    half = z * math.sqrt(p * (1 - p) / runs + z * z / (4 * runs * runs)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def sequential_outcomes(
+    enemy_name: str,
+    max_runs: int,
+    band: Tuple[float, float],
+    seed: int | None = None,
+    player_stats: Mapping[str, int] | None = None,
+    engine: str = "python",
+    alpha: float = 0.05,
+    batch_size: int = ADAPTIVE_BATCH,
+    floor: int | None = None,
+) -> Tuple[int, int, int]:
+    """Simulate in batches until the win rate is clearly inside or outside ``band``.
+
+    After every batch the Wilson interval of the win rate is compared with
+    ``band = (min, max)``.  Sampling stops as soon as the interval lies
+    entirely inside the band or entirely outside it, or when ``max_runs``
+    battles have been played.  The error rate ``alpha`` is split evenly over
+    every possible look (a Bonferroni correction) so repeated checks do not
+    inflate it.
+
+    Returns ``(wins, runs, total_turns)`` where ``runs`` is the number of
+    battles actually simulated.
+    """
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+    low, high = band
+    looks = max(1, math.ceil(max_runs / batch_size))
+    z = NormalDist().inv_cdf(1 - alpha / (2 * looks))
+    wins = runs = total_turns = 0
+    look = 0
+    while runs < max_runs:
+        n = min(batch_size, max_runs - runs)
+        batch_seed = None if seed is None else derive_seed(seed, "batch", look)
+        batch_wins, batch_turns = battle_outcomes(
+            enemy_name, n, seed=batch_seed, player_stats=player_stats, engine=engine, floor=floor
+        )
+        wins += batch_wins
+        total_turns += batch_turns
+        runs += n
+        look += 1
+        lo, hi = wilson_interval(wins, runs, z)
+        if (low <= lo and hi <= high) or hi < low or lo > high:
+            break
+    return wins, runs, total_turns
+
+
+def simulate_battles(
+    enemy_name: str,
+    runs: int,
+    seed: int | None = None,
+    player_stats: Mapping[str, int] | None = None,
+    engine: str = "python",
+    floor: int | None = None,
+    intents: bool = False,
+) -> Dict[str, float]:
+    """Simulate ``runs`` battles against ``enemy_name``.
+
+    Parameters
+    ----------
+    enemy_name:
+        Name of the enemy archetype to fight.
+    runs:
+        Number of battles to simulate.
+    seed:
+        Optional seed for deterministic results.
+    player_stats:
+        Optional mapping defining the player's ``health``, ``attack`` and
+        ``speed`` values. Defaults to a basic hero profile.
+    engine:
+        Combat resolver to use, one of :data:`ENGINES`. ``"numpy"`` requires
+        NumPy and agrees with the default engine statistically rather than
+        battle-for-battle. ``"game"`` fights through the real battle loop
+        and is slower but reflects skills, abilities and traits.
+        ``"exact"`` returns the true expected values and falls back to
+        ``"python"`` sampling for matchups the solver cannot express.
+    floor:
+        Optional dungeon floor whose enemy scaling to apply. Without it the
+        unscaled archetype stats are used.
+    intents:
+        Make the enemy follow its :func:`enemy_intents` cycle in the
+        ``python``, ``numpy`` and ``exact`` engines. By default it attacks
+        every turn. The ``game`` engine always uses the real enemy AI.
+
+    Returns
+    -------
+    dict
+        Dictionary with ``winrate`` and ``avg_turns``.
+    """
+
+    if engine == "exact":
+        solved = solve_exact(enemy_name, player_stats, floor, intents=intents)
+        if solved is not None:
+            return solved
+        engine = "python"
+
+    wins, total_turns = battle_outcomes(
+        enemy_name,
+        runs,
+        seed=seed,
+        player_stats=player_stats,
+        engine=engine,
+        floor=floor,
+        intents=intents,
+    )
     winrate = wins / runs if runs else 0
     avg_turns = total_turns / wins if wins else 0
-    if state is not None:
-        random.setstate(state)
     return {"winrate": winrate, "avg_turns": avg_turns}
 
 
+def class_player_stats(player_class: str) -> Dict[str, int]:
+    """Return simulator stats for ``player_class`` as defined in ``CLASS_DEFS``."""
+
+    cls = CLASS_DEFS.get(player_class)
+    if cls is None:
+        raise KeyError(f"Unknown player class: {player_class}")
+
+    base_stats = cls["stats"]
+    return {
+        "health": base_stats.get("max_health", 30),
+        "attack": base_stats.get("attack_power", 8),
+        "speed": 10,
+    }
+
+
 @dataclass
 class SimulationResult:
     """Aggregate outcome of a batch of simulated encounters.
@@ -91,9 +371,13 @@ class SimulationResult:
     win_rate:
         Proportion of battles the player won. Expressed as a float between
         0 and 1.
+    runs:
+        Number of battles actually simulated. Adaptive runs may stop early
+        and the exact solver simulates none.
     """
 
     win_rate: float
+    runs: int = 0
 
 
 def simulate(
@@ -103,6 +387,9 @@ def simulate(
     runs: int,
     *,
     seed: int | None = 0,
+    engine: str = "python",
+    band: Tuple[float, float] | None = None,
+    alpha: float = 0.05,
 ) -> SimulationResult:
     """Simulate a series of encounters for balance checks.
 
@@ -113,36 +400,74 @@ def simulate(
     enemy_kind:
         Enemy archetype to battle against.
     floor:
-        Dungeon floor number. Currently unused but accepted for future
-        expansion so the function signature matches the specification.
+        Dungeon floor number. Enemy stats are scaled as on that floor of a
+        real run; see :func:`floor_stat_table`.
     runs:
         Number of simulated encounters to perform.
     seed:
         Optional random seed to ensure deterministic results. Defaults to 0 to
         make automated tests reproducible.
+    engine:
+        Combat resolver passed through to :func:`simulate_battles`.
+    band:
+        Optional ``(min, max)`` acceptance band. When given, sampling engines
+        run adaptively via :func:`sequential_outcomes` and ``runs`` becomes
+        the budget rather than a fixed count.
+    alpha:
+        Error rate for adaptive stopping.
 
     Returns
     -------
     :class:`SimulationResult`
-        Object containing the win rate for the simulated matchup.
+        Object containing the win rate and number of battles simulated.
     """
 
-    cls = CLASS_DEFS.get(player_class)
-    if cls is None:
-        raise KeyError(f"Unknown player class: {player_class}")
+    player_stats = class_player_stats(player_class)
+    if engine == "exact":
+        solved = solve_exact(enemy_kind, player_stats, floor)
+        if solved is not None:
+            return SimulationResult(win_rate=solved["winrate"], runs=0)
+        engine = "python"
+    if band is not None:
+        wins, used, _ = sequential_outcomes(
+            enemy_kind,
+            runs,
+            band,
+            seed=seed,
+            player_stats=player_stats,
+            engine=engine,
+            alpha=alpha,
+            floor=floor,
+        )
+        return SimulationResult(win_rate=wins / used if used else 0, runs=used)
+    stats = simulate_battles(
+        enemy_kind, runs, seed=seed, player_stats=player_stats, engine=engine, floor=floor
+    )
+    return SimulationResult(win_rate=stats["winrate"], runs=runs)
 
-    base_stats = cls["stats"]
-    player_stats = {
-        "health": base_stats.get("max_health", 30),
-        "attack": base_stats.get("attack_power", 8),
-        "speed": 10,
-    }
-    stats = simulate_battles(enemy_kind, runs, seed=seed, player_stats=player_stats)
-    return SimulationResult(win_rate=stats["winrate"])
 
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command line entry point for quick balance simulations.
+
+    ``matrix`` as the first argument runs the full threshold matrix instead;
+    see :mod:`dungeoncrawler.balance`.  ``tune`` proposes enemy stat changes
+    that satisfy it; see :mod:`dungeoncrawler.tuner`.  ``autopilot`` plays
+    complete runs headlessly; see :mod:`dungeoncrawler.autopilot`.
+    """
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["matrix"]:
+        from .balance import main as matrix_main
+
+        sys.exit(matrix_main(argv[1:]))
+    if argv[:1] == ["tune"]:
+        from .tuner import main as tune_main
 
-def main() -> None:
-    """Command line entry point for quick balance simulations."""
+        sys.exit(tune_main(argv[1:]))
+    if argv[:1] == ["autopilot"]:
+        from .autopilot import main as autopilot_main
+
+        sys.exit(autopilot_main(argv[1:]))
 
     parser = argparse.ArgumentParser(description="Simulate battles against a given enemy.")
     parser.add_argument("enemy", help="Enemy name to fight")
@@ -150,10 +475,25 @@ def main() -> None:
     parser.add_argument(
         "--seed", type=int, default=None, help="Optional seed for deterministic results"
     )
+    parser.add_argument(
+        "--floor", type=int, default=None, help="Scale the enemy as on this dungeon floor"
+    )
     parser.add_argument("--player-health", type=int, default=30, help="Player health value")
     parser.add_argument("--player-attack", type=int, default=8, help="Player attack value")
     parser.add_argument("--player-speed", type=int, default=10, help="Player speed value")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Combat resolver: per-battle python loop, vectorised numpy batch, "
+        "the real game battle loop or exact solver",
+    )
+    parser.add_argument(
+        "--intents",
+        action="store_true",
+        help="Have the enemy follow its intent cycle from core_enemies.json",
+    )
+    args = parser.parse_args(argv)
 
     player_stats = {
         "health": args.player_health,
@@ -161,9 +501,21 @@ def main() -> None:
         "speed": args.player_speed,
     }
 
-    stats = simulate_battles(args.enemy, args.runs, seed=args.seed, player_stats=player_stats)
+    start = time.perf_counter()
+    stats = simulate_battles(
+        args.enemy,
+        args.runs,
+        seed=args.seed,
+        player_stats=player_stats,
+        engine=args.engine,
+        floor=args.floor,
+        intents=args.intents,
+    )
     print(f"Winrate: {stats['winrate']:.2%}")
     print(f"Average Turns: {stats['avg_turns']:.2f}")
+    elapsed = time.perf_counter() - start
+    if args.engine != "exact" and elapsed > 0:
+        print(f"Throughput: {args.runs / elapsed:,.0f} battles/s")
 
 
 if __name__ == "__main__":
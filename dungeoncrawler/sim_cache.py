@@ -0,0 +1,125 @@
+"""On-disk cache for balance simulation results.
+
+Each matchup result is stored under a key hashed from every input that can
+change it: the enemy's ``ENEMY_STATS``, ``ENEMY_ABILITIES``, ``ENEMY_TRAITS``
+and ``ENEMY_AI`` entries, the player's ``CLASS_DEFS`` entry, the stamina
+skills from ``skills.json``, the enemy's intent cycle from
+``core_enemies.json``, the balance
+fields of :data:`~dungeoncrawler.config.config`, the engine and
+:data:`~dungeoncrawler.sim.ENGINE_VERSION`, the seed and the run settings.
+Editing one enemy therefore only invalidates the matchups that use it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .paths import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = CACHE_DIR / "sim"
+
+# ``config`` fields that scale enemies or the floors they are rolled for.
+CONFIG_FIELDS = ("max_floors", "enemy_hp_mult", "enemy_dmg_mult", "loot_mult", "enable_debug")
+
+
+def matchup_key(
+    player_class: str,
+    enemy_kind: str,
+    engine: str,
+    seed: Optional[int],
+    runs: int,
+    **settings: Any,
+) -> str:
+    """Return the content hash identifying one simulated matchup.
+
+    Extra keyword ``settings`` (chunk size, stopping rule, ...) are folded
+    into the key as well.
+    """
+
+    from .config import config
+    from .dungeon import ENEMY_ABILITIES, ENEMY_AI, ENEMY_STATS, ENEMY_TRAITS
+    from .entities import CLASS_DEFS, SKILL_DEFS
+    from .sim import ENGINE_VERSION, enemy_intents
+
+    payload = {
+        "player_class": player_class,
+        "class_def": CLASS_DEFS.get(player_class),
+        "skills": SKILL_DEFS,
+        "enemy_kind": enemy_kind,
+        "enemy_stats": ENEMY_STATS.get(enemy_kind),
+        "enemy_ability": ENEMY_ABILITIES.get(enemy_kind),
+        "enemy_traits": ENEMY_TRAITS.get(enemy_kind),
+        "enemy_ai": ENEMY_AI.get(enemy_kind),
+        "intents": enemy_intents(enemy_kind),
+        "config": {name: getattr(config, name) for name in CONFIG_FIELDS},
+        "engine": engine,
+        "engine_version": ENGINE_VERSION,
+        "seed": seed,
+        "runs": runs,
+        "settings": settings,
+    }
+    text = json.dumps(payload, sort_keys=True, default=list)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SimCache:
+    """Directory of cached results with hit and miss counters.
+
+    Parameters
+    ----------
+    path:
+        Cache directory, created on first write.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_DIR) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for ``key`` or ``None``."""
+
+        try:
+            with open(self._file(key), encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store ``value`` under ``key``; failures are logged and ignored."""
+
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp = self._file(key).with_suffix(".tmp")
+            tmp.write_text(json.dumps(value), encoding="utf-8")
+            tmp.replace(self._file(key))
+        except OSError:
+            logger.exception("Failed to write simulation cache entry %s", key)
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+
+        for entry in self.path.glob("*.json"):
+            entry.unlink()
+
+    def report(self) -> str:
+        """Return a one-line hit/miss summary."""
+
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"Cache: {self.hits} hits, {self.misses} misses ({rate:.0%} hit rate)"
+
+
+__all__ = ["CONFIG_FIELDS", "DEFAULT_CACHE_DIR", "SimCache", "matchup_key"]
@@ -1,14 +1,19 @@
+from __future__ import annotations
+
 import csv
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .core.map import BitGrid
+
 
 class StatsLogger:
     """Collect and persist balance metrics for each dungeon run."""
 
-    def __init__(self) -> None:
-        self.run_id = int(time.time())
+    def __init__(self, run_id: Optional[int] = None, log_dir: Path | str = "logs") -> None:
+        self.run_id = int(time.time()) if run_id is None else run_id
+        self.log_dir = Path(log_dir)
         self.rows: List[Dict[str, object]] = []
         self.combat_rows: List[Dict[str, object]] = []
         self.current_floor: Optional[int] = None
@@ -81,7 +86,10 @@ class StatsLogger:
     def end_floor(self, game) -> None:
         if self.current_floor is None:
             return
-        discovered = sum(1 for row in game.discovered for cell in row if cell)
+        if isinstance(game.discovered, BitGrid):
+            discovered = game.discovered.count()
+        else:
+            discovered = sum(1 for row in game.discovered for cell in row if cell)
         fog_rate = discovered / self.total_tiles if self.total_tiles else 0
         self.rows.append(
             {
@@ -97,10 +105,10 @@ class StatsLogger:
         self.current_floor = None
 
     def finalize(self, game, death_cause: str) -> None:
-        """Write collected metrics to ``logs`` directory."""
+        """Write collected metrics to :attr:`log_dir` (``logs`` by default)."""
         if self.current_floor is not None:
             self.end_floor(game)
-        path = Path("logs")
+        path = self.log_dir
         path.mkdir(parents=True, exist_ok=True)
 
         if self.rows:
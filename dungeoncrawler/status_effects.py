@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import random
-from gettext import gettext as _
+from dataclasses import dataclass
+
+from .core.events import StatusApplied, StatusTicked
+from .i18n import gettext as _
 
 EFFECT_INFO = {
     "poison": "Lose 3 HP/turn.",
@@ -65,6 +68,30 @@ DEBUFFS = {
 }
 
 
+def entity_rng(entity):
+    """Return the random source bound to ``entity``.
+
+    Game entities carry the ``combat`` stream of their session; anything else
+    falls back to the global :mod:`random` module.
+    """
+
+    return getattr(entity, "rng", random)
+
+
+def _announce(entity, status: str, text: str) -> None:
+    """Publish ``text`` about ``entity``'s ``status`` or print it.
+
+    Entities in a battle carry the game's event bus; anything else writes
+    through its ``output_func``.
+    """
+
+    bus = getattr(entity, "event_bus", None)
+    if bus is None:
+        getattr(entity, "output_func", print)(text)
+        return
+    bus.publish(StatusTicked(text, getattr(entity, "name", ""), status))
+
+
 def add_status_effect(entity, effect: str, duration: int, source=None, _reflected=False) -> None:
     """Apply ``effect`` to ``entity`` and announce it."""
 
@@ -88,15 +115,20 @@ def add_status_effect(entity, effect: str, duration: int, source=None, _reflecte
     name = getattr(entity, "name", "")
     tag = effect.capitalize()
     if is_player:
-        print(_(f"You are {tag} ({duration} turns). {desc}"))
+        msg = _(f"You are {tag} ({duration} turns). {desc}")
+    else:
+        msg = _(f"The {name} is {tag} ({duration} turns). {desc}")
+    bus = getattr(entity, "event_bus", None)
+    if bus is None:
+        getattr(entity, "output_func", print)(msg)
     else:
-        print(_(f"The {name} is {tag} ({duration} turns). {desc}"))
+        bus.publish(StatusApplied(msg, name, effect, duration))
     if (
         source is not None
         and not _reflected
         and "spiteful_reflection" in effects
         and effect in DEBUFFS
-        and random.random() < 0.2
+        and entity_rng(entity).random() < 0.2
     ):
         add_status_effect(source, effect, duration, _reflected=True)
 
@@ -117,8 +149,8 @@ def adjust_skill_cost(entity, base_cost: int) -> int:
     trinket = getattr(entity, "trinket", None)
     if trinket and getattr(trinket, "name", "") == "Suppression Ring":
         multiplier = 1.0
-        if random.random() < 0.25:
-            print(_("The Suppression Ring overheats and crumbles!"))
+        if entity_rng(entity).random() < 0.25:
+            _announce(entity, "mana_lock", _("The Suppression Ring overheats and crumbles!"))
             entity.trinket = None
     return int(base_cost * multiplier)
 
@@ -127,7 +159,7 @@ def cleansing_fails(entity) -> bool:
     """Return ``True`` if cleanse or dispel attempts fizzle under Mana Lock."""
 
     effects = getattr(entity, "status_effects", {})
-    return "mana_lock" in effects and random.random() < 0.25
+    return "mana_lock" in effects and entity_rng(entity).random() < 0.25
 
 
 def shield_block(entity, base_block: int) -> int:
@@ -150,247 +182,261 @@ def temporal_lag_trigger(entity, state, action, resource_attr: str, cost: int) -
     effects = getattr(entity, "status_effects", {})
     if "temporal_lag" not in effects or not action or action in {"wait", "defend"}:
         return False
-    if random.random() >= 0.15:
+    rng = entity_rng(entity)
+    if rng.random() >= 0.15:
         return False
     if cost:
         setattr(entity, resource_attr, getattr(entity, resource_attr) + cost)
     targets = [entity] + list(getattr(state, "enemies", []))
     state.game.repeat_action = action
-    state.game.repeat_target = random.choice(targets) if targets else None
+    state.game.repeat_target = rng.choice(targets) if targets else None
     state.game.last_action = None
     return True
 
 
-def _handle_poison(entity, effects, is_player, name):
-    if effects["poison"] > 0:
-        entity.health -= 3
-        remaining = effects["poison"] - 1
-        msg = _(f"Poison -3 HP ({remaining} turns left).")
-        if is_player:
-            print(msg)
-        else:
-            print(_(f"The {name} {msg.lower()}"))
-        effects["poison"] -= 1
-    if effects["poison"] <= 0:
-        del effects["poison"]
-        if is_player:
-            print(_("Poison faded."))
-        else:
-            print(_(f"The {name}'s poison faded."))
-    return False
-
-
-def _handle_burn(entity, effects, is_player, name):
-    if effects["burn"] > 0:
-        damage = 4
-        traits = getattr(entity, "traits", [])
-        if "fire_vulnerable" in traits:
-            damage *= 2
-        entity.health -= damage
-        remaining = effects["burn"] - 1
-        msg = _(f"Burn -{damage} HP ({remaining} turns left).")
-        if is_player:
-            print(msg)
-        else:
-            print(_(f"The {name} {msg.lower()}"))
-        effects["burn"] -= 1
-    if effects["burn"] <= 0:
-        del effects["burn"]
-        if is_player:
-            print(_("Burn ended."))
-        else:
-            print(_(f"The {name}'s burn ended."))
-    return False
-
-
-def _handle_bleed(entity, effects, is_player, name):
-    if effects["bleed"] > 0:
-        entity.health -= 2
-        remaining = effects["bleed"] - 1
-        msg = _(f"Bleeding -2 HP ({remaining} turns left).")
-        if is_player:
-            print(msg)
-        else:
-            print(_(f"The {name} {msg.lower()}"))
-        effects["bleed"] -= 1
-    if effects["bleed"] <= 0:
-        del effects["bleed"]
-        if is_player:
-            print(_("Bleeding stopped."))
-        else:
-            print(_(f"The {name}'s bleeding stopped."))
-    return False
-
-
-def _handle_freeze(entity, effects, is_player, name):
-    skip_turn = False
-    if effects["freeze"] > 0:
-        remaining = effects["freeze"] - 1
-        msg = _(f"Frozen ({remaining} turns left).")
-        if is_player:
-            print(msg)
-        else:
-            print(_(f"The {name} is {msg[0].lower() + msg[1:]}"))
-        effects["freeze"] -= 1
-        skip_turn = True
-    if effects["freeze"] <= 0:
-        del effects["freeze"]
-        if is_player:
-            print(_("You thaw out."))
-        else:
-            print(_(f"The {name} thaws out."))
-    return skip_turn
-
-
-def _handle_stun(entity, effects, is_player, name):
-    skip_turn = False
-    if effects["stun"] > 0:
-        remaining = effects["stun"] - 1
-        msg = _(f"Stunned ({remaining} turns left).")
-        if is_player:
-            print(msg)
-        else:
-            print(_(f"The {name} is {msg[0].lower() + msg[1:]}"))
-        effects["stun"] -= 1
-        skip_turn = True
-    if effects["stun"] <= 0:
-        del effects["stun"]
-        if is_player:
-            print(_("You recover from the stun."))
-        else:
-            print(_(f"The {name} recovers from the stun."))
-    return skip_turn
-
-
-def _handle_shield(entity, effects, is_player, name):
-    effects["shield"] -= 1
-    remaining = effects.get("shield", 0)
-    if remaining > 0:
-        if is_player:
-            print(_(f"Shield ({remaining} turns left)."))
-        else:
-            print(_(f"The {name}'s shield ({remaining} turns left)."))
-    if effects["shield"] <= 0:
-        if is_player:
-            print(_("Your shield fades."))
-        else:
-            print(_(f"The {name}'s shield fades."))
-        del effects["shield"]
-    return False
-
-
-def _handle_inspire(entity, effects, is_player, name):
-    if effects["inspire"] == 3 and hasattr(entity, "attack_power"):
-        entity.attack_power += 3
-    effects["inspire"] -= 1
-    remaining = effects.get("inspire", 0)
-    if remaining > 0:
-        if is_player:
-            print(_(f"Inspire ({remaining} turns left)."))
-        else:
-            print(_(f"The {name} is inspired ({remaining} turns left)."))
-    if effects.get("inspire", 0) <= 0:
-        if hasattr(entity, "attack_power"):
-            entity.attack_power -= 3
-        del effects["inspire"]
-        if is_player:
-            print(_("Inspiration fades."))
-        else:
-            print(_(f"The {name}'s inspiration fades."))
-    return False
+@dataclass(frozen=True)
+class StatModifier:
+    """Stat change held while a table-driven effect is active.
 
+    With ``add`` the stat is raised by that amount and lowered again on
+    expiry, and entities without the stat are left alone.  Otherwise it is
+    multiplied by ``scale`` (rounded down when ``whole``) and restored on
+    expiry from the value saved in ``saved``.  ``flag`` marks an entity
+    whose stat is currently modified, so the change is applied only once.
+    """
 
-def _handle_blessed(entity, effects, is_player, name):
-    effects["blessed"] -= 1
-    remaining = effects.get("blessed", 0)
-    if remaining > 0:
-        if is_player:
-            print(_(f"Blessed ({remaining} turns left)."))
-        else:
-            print(_(f"The {name} is blessed ({remaining} turns left)."))
-    if effects["blessed"] <= 0:
-        del effects["blessed"]
-        if is_player:
-            print(_("Blessing fades."))
+    stat: str
+    flag: str
+    add: int = 0
+    scale: float = 1.0
+    whole: bool = False
+    saved: str = ""
+    default: float = 0
+
+    def apply(self, entity) -> None:
+        if getattr(entity, self.flag, False):
+            return
+        if self.add:
+            if hasattr(entity, self.stat):
+                setattr(entity, self.flag, True)
+                setattr(entity, self.stat, getattr(entity, self.stat) + self.add)
+            return
+        setattr(entity, self.flag, True)
+        value = getattr(entity, self.stat, self.default)
+        setattr(entity, self.saved, value)
+        value *= self.scale
+        setattr(entity, self.stat, int(value) if self.whole else value)
+
+    def revert(self, entity) -> None:
+        if self.add:
+            if getattr(entity, self.flag, False):
+                setattr(entity, self.stat, getattr(entity, self.stat) - self.add)
         else:
-            print(_(f"The {name}'s blessing fades."))
-    return False
+            setattr(entity, self.stat, getattr(entity, self.saved, self.default))
+        setattr(entity, self.flag, False)
+
+
+@dataclass(frozen=True)
+class TickRule:
+    """How a table-driven status effect acts each turn.
+
+    Parameters
+    ----------
+    damage:
+        Health lost per tick, or per stack with ``per_stack``.
+    vulnerable:
+        Trait that doubles ``damage``.
+    skip_turn:
+        Whether the entity loses its turn while the effect ticks.
+    countdown:
+        Whether the count is a duration that runs out.  Other effects keep
+        their count (often a stack size) until something removes them.
+    tick_at_zero:
+        Whether the tick using up the last turn is announced.  Damage and
+        control effects act on every remaining turn and announce each one;
+        timed buffs count down first and only announce the fade.
+    tick, tick_other, fade, fade_other:
+        ``str.format`` messages for the player and for other entities,
+        filled with ``name``, ``remaining`` and ``damage``.
+    modifier:
+        Optional stat change held while the effect lasts.
+    """
 
+    damage: int = 0
+    per_stack: bool = False
+    vulnerable: str = ""
+    skip_turn: bool = False
+    countdown: bool = True
+    tick_at_zero: bool = False
+    tick: str = ""
+    tick_other: str = ""
+    fade: str = ""
+    fade_other: str = ""
+    modifier: StatModifier | None = None
+
+
+def _dot(damage: int, label: str, fade: str, fade_other: str, **kwargs) -> TickRule:
+    """Return the rule of a damage-over-time effect named ``label``."""
+
+    return TickRule(
+        damage=damage,
+        tick_at_zero=True,
+        tick=label + " -{damage} HP ({remaining} turns left).",
+        tick_other="The {name} " + label.lower() + " -{damage} hp ({remaining} turns left).",
+        fade=fade,
+        fade_other=fade_other,
+        **kwargs,
+    )
+
+
+def _timed(label: str, other: str, fade: str, fade_other: str, **kwargs) -> TickRule:
+    """Return the rule of a timed effect announced as ``label`` or ``other``."""
+
+    return TickRule(
+        tick=label + " ({remaining} turns left).",
+        tick_other=other + " ({remaining} turns left).",
+        fade=fade,
+        fade_other=fade_other,
+        **kwargs,
+    )
+
+
+# Effects whose upkeep is plain data.  Effects with bespoke logic live in
+# ``STATUS_EFFECT_HANDLERS``, which takes precedence over this table.
+STATUS_EFFECT_TABLE: dict[str, TickRule] = {
+    "poison": _dot(3, "Poison", "Poison faded.", "The {name}'s poison faded."),
+    "burn": _dot(
+        4, "Burn", "Burn ended.", "The {name}'s burn ended.", vulnerable="fire_vulnerable"
+    ),
+    "bleed": _dot(2, "Bleeding", "Bleeding stopped.", "The {name}'s bleeding stopped."),
+    "freeze": TickRule(
+        skip_turn=True,
+        tick_at_zero=True,
+        tick="Frozen ({remaining} turns left).",
+        tick_other="The {name} is frozen ({remaining} turns left).",
+        fade="You thaw out.",
+        fade_other="The {name} thaws out.",
+    ),
+    "stun": TickRule(
+        skip_turn=True,
+        tick_at_zero=True,
+        tick="Stunned ({remaining} turns left).",
+        tick_other="The {name} is stunned ({remaining} turns left).",
+        fade="You recover from the stun.",
+        fade_other="The {name} recovers from the stun.",
+    ),
+    "shield": _timed(
+        "Shield", "The {name}'s shield", "Your shield fades.", "The {name}'s shield fades."
+    ),
+    "inspire": _timed(
+        "Inspire",
+        "The {name} is inspired",
+        "Inspiration fades.",
+        "The {name}'s inspiration fades.",
+        modifier=StatModifier("attack_power", "_inspire_active", add=3),
+    ),
+    "blessed": _timed(
+        "Blessed", "The {name} is blessed", "Blessing fades.", "The {name}'s blessing fades."
+    ),
+    "cursed": _timed("Cursed", "The {name} is cursed", "Curse fades.", "The {name}'s curse fades."),
+    "beetle_bane": _timed(
+        "Beetle Bane",
+        "The {name} studies beetle weaknesses",
+        "Your beetle lore fades.",
+        "The {name}'s beetle lore fades.",
+    ),
+    "blood_torrent": TickRule(
+        damage=1,
+        per_stack=True,
+        countdown=False,
+        tick="Blood Torrent -{damage} HP.",
+        tick_other="The {name} blood torrent -{damage} hp.",
+    ),
+    "blood_scent": TickRule(),
+    "compression_sickness": _timed(
+        "Compression Sickness",
+        "The {name} reels",
+        "Compression Sickness fades.",
+        "The {name} steadies.",
+        modifier=StatModifier(
+            "speed",
+            "_compression_sickness_applied",
+            scale=0.9,
+            whole=True,
+            saved="_compression_prev_speed",
+        ),
+    ),
+    "miasma_aura": TickRule(
+        modifier=StatModifier(
+            "heal_multiplier",
+            "_miasma_active",
+            scale=0.5,
+            saved="_miasma_prev_heal",
+            default=1.0,
+        ),
+    ),
+    "spiteful_reflection": TickRule(countdown=False),
+    "temporal_lag": TickRule(countdown=False),
+    # Spotlight ping lasts until an item clears it.
+    "spotlight_ping": TickRule(countdown=False),
+}
 
-def _handle_cursed(entity, effects, is_player, name):
-    effects["cursed"] -= 1
-    remaining = effects.get("cursed", 0)
-    if remaining > 0:
-        if is_player:
-            print(_(f"Cursed ({remaining} turns left)."))
-        else:
-            print(_(f"The {name} is cursed ({remaining} turns left)."))
-    if effects["cursed"] <= 0:
-        del effects["cursed"]
-        if is_player:
-            print(_("Curse fades."))
-        else:
-            print(_(f"The {name}'s curse fades."))
-    return False
 
+def _report(entity, bus, effect: str, template: str, name: str, remaining=0, damage=0) -> None:
+    """Print or publish a table-driven tick message about ``entity``."""
 
-def _handle_beetle_bane(entity, effects, is_player, name):
-    effects["beetle_bane"] -= 1
-    remaining = effects.get("beetle_bane", 0)
-    if remaining > 0:
-        if is_player:
-            print(_(f"Beetle Bane ({remaining} turns left)."))
-        else:
-            print(_(f"The {name} studies beetle weaknesses ({remaining} turns left)."))
-    if effects.get("beetle_bane", 0) <= 0:
-        del effects["beetle_bane"]
-        if is_player:
-            print(_("Your beetle lore fades."))
-        else:
-            print(_(f"The {name}'s beetle lore fades."))
-    return False
+    if bus is None:
+        getattr(entity, "output_func", print)(
+            _(template).format(name=name, remaining=remaining, damage=damage)
+        )
+    else:
+        bus.publish(StatusTicked(None, name, effect, remaining, damage, _(template)))
 
 
-def _handle_blood_torrent(entity, effects, is_player, name):
-    stacks = effects.get("blood_torrent", 0)
-    if stacks > 0:
-        entity.health -= stacks
-        msg = _(f"Blood Torrent -{stacks} HP.")
-        if is_player:
-            print(msg)
-        else:
-            print(_(f"The {name} {msg.lower()}"))
-    return False
+def _remove(entity, effects, effect: str) -> None:
+    """Drop ``effect`` from ``effects``, undoing any stat change its rule holds."""
 
+    if effects.pop(effect, None) is None:
+        return
+    rule = STATUS_EFFECT_TABLE.get(effect)
+    if rule is not None and rule.modifier is not None:
+        if getattr(entity, rule.modifier.flag, False):
+            rule.modifier.revert(entity)
 
-def _handle_blood_scent(entity, effects, is_player, name):
-    effects["blood_scent"] -= 1
-    if effects["blood_scent"] <= 0:
-        del effects["blood_scent"]
-    return False
 
+def _tick(entity, effect: str, rule: TickRule, effects, is_player, name, bus, listening) -> bool:
+    """Apply one turn of a table-driven ``effect`` and return the skip flag."""
 
-def _handle_compression_sickness(entity, effects, is_player, name):
-    if not getattr(entity, "_compression_sickness_applied", False):
-        entity._compression_sickness_applied = True
-        entity._compression_prev_speed = getattr(entity, "speed", 0)
-        entity.speed = int(entity.speed * 0.9)
-    effects["compression_sickness"] -= 1
-    remaining = effects.get("compression_sickness", 0)
-    if remaining > 0:
-        if is_player:
-            print(_(f"Compression Sickness ({remaining} turns left)."))
-        else:
-            print(_(f"The {name} reels ({remaining} turns left)."))
-    if effects.get("compression_sickness", 0) <= 0:
-        entity.speed = getattr(entity, "_compression_prev_speed", entity.speed)
-        entity._compression_sickness_applied = False
-        effects.pop("compression_sickness", None)
-        if is_player:
-            print(_("Compression Sickness fades."))
-        else:
-            print(_(f"The {name} steadies."))
-    return False
+    turns = effects[effect]
+    modifier = rule.modifier
+    if modifier is not None:
+        modifier.apply(entity)
+    skip_turn = False
+    if rule.countdown and not rule.tick_at_zero:
+        turns -= 1
+        effects[effect] = turns
+        if turns > 0 and listening and rule.tick:
+            template = rule.tick if is_player else rule.tick_other
+            _report(entity, bus, effect, template, name, turns)
+    elif turns > 0:
+        damage = rule.damage * turns if rule.per_stack else rule.damage
+        if damage:
+            if rule.vulnerable and rule.vulnerable in getattr(entity, "traits", ()):
+                damage *= 2
+            entity.health -= damage
+        if rule.countdown:
+            turns -= 1
+            effects[effect] = turns
+        if listening and rule.tick:
+            template = rule.tick if is_player else rule.tick_other
+            _report(entity, bus, effect, template, name, turns, damage)
+        skip_turn = rule.skip_turn
+    if rule.countdown and turns <= 0:
+        _remove(entity, effects, effect)
+        if listening and rule.fade:
+            template = rule.fade if is_player else rule.fade_other
+            _report(entity, bus, effect, template, name)
+    return skip_turn
 
 
 def _handle_brood_bloom(entity, effects, is_player, name):
@@ -414,19 +460,6 @@ def _handle_brood_bloom(entity, effects, is_player, name):
     return False
 
 
-def _handle_miasma_aura(entity, effects, is_player, name):
-    if not getattr(entity, "_miasma_active", False):
-        entity._miasma_active = True
-        entity._miasma_prev_heal = getattr(entity, "heal_multiplier", 1.0)
-        entity.heal_multiplier = entity._miasma_prev_heal * 0.5
-    effects["miasma_aura"] -= 1
-    if effects["miasma_aura"] <= 0:
-        entity.heal_multiplier = getattr(entity, "_miasma_prev_heal", 1.0)
-        entity._miasma_active = False
-        effects.pop("miasma_aura", None)
-    return False
-
-
 def _handle_entropic_debt(entity, effects, is_player, name):
     stacks = effects.get("entropic_debt", 0)
     if stacks <= 0:
@@ -437,17 +470,9 @@ def _handle_entropic_debt(entity, effects, is_player, name):
     entity.health -= damage
     msg = _(f"Entropic Debt -{damage} HP ({stacks} stacks).")
     if is_player:
-        print(msg)
+        _announce(entity, "entropic_debt", msg)
     else:
-        print(_(f"The {name} {msg.lower()}"))
-    return False
-
-
-def _handle_spiteful_reflection(entity, effects, is_player, name):
-    return False
-
-
-def _handle_temporal_lag(entity, effects, is_player, name):
+        _announce(entity, "entropic_debt", _(f"The {name} {msg.lower()}"))
     return False
 
 
@@ -469,24 +494,17 @@ def _handle_fester_mark(entity, effects, is_player, name):
         remaining = effects.get("fester_mark", 0) - 1
         msg = _(f"Fester Mark -{damage} HP ({remaining} turns left).")
         if is_player:
-            print(msg)
+            _announce(entity, "fester_mark", msg)
         else:
-            print(_(f"The {name} {msg.lower()}"))
+            _announce(entity, "fester_mark", _(f"The {name} {msg.lower()}"))
     effects["fester_mark"] -= 1
     if effects["fester_mark"] <= 0:
         effects.pop("fester_mark", None)
         entity._fester_mark_damage = 0
         if is_player:
-            print(_("The mark fades."))
+            _announce(entity, "fester_mark", _("The mark fades."))
         else:
-            print(_(f"The {name}'s mark fades."))
-    return False
-
-
-def _handle_spotlight_ping(entity, effects, is_player, name):
-    """Spotlight ping persists until manually removed."""
-    # No automatic duration reduction; effect remains until cleared by items.
-    effects["spotlight_ping"] = effects.get("spotlight_ping", 1)
+            _announce(entity, "fester_mark", _(f"The {name}'s mark fades."))
     return False
 
 
@@ -498,21 +516,21 @@ def _handle_creeping_corruption(entity, effects, is_player, name):
             entity.vision = max(1, entity._corruption_prev_vision - 1)
         effects["creeping_corruption"] -= 1
         for buff in ("blessed", "inspire"):
-            effects.pop(buff, None)
+            _remove(entity, effects, buff)
         msg = _("Corruption clouds your vision.")
         if is_player:
-            print(msg)
+            _announce(entity, "creeping_corruption", msg)
         else:
-            print(_(f"The {name} is engulfed in corruption."))
+            _announce(entity, "creeping_corruption", _(f"The {name} is engulfed in corruption."))
     else:
         if getattr(entity, "_corruption_active", False):
             entity.vision = getattr(entity, "_corruption_prev_vision", entity.vision)
             delattr(entity, "_corruption_active")
         effects.pop("creeping_corruption", None)
         if is_player:
-            print(_("The corruption recedes."))
+            _announce(entity, "creeping_corruption", _("The corruption recedes."))
         else:
-            print(_(f"The {name}'s corruption fades."))
+            _announce(entity, "creeping_corruption", _(f"The {name}'s corruption fades."))
     return False
 
 
@@ -580,47 +598,49 @@ def clear_soul_tax(entity):
 
 
 STATUS_EFFECT_HANDLERS = {
-    "poison": _handle_poison,
-    "burn": _handle_burn,
-    "bleed": _handle_bleed,
-    "freeze": _handle_freeze,
-    "stun": _handle_stun,
-    "shield": _handle_shield,
-    "inspire": _handle_inspire,
-    "blessed": _handle_blessed,
-    "cursed": _handle_cursed,
-    "beetle_bane": _handle_beetle_bane,
-    "blood_torrent": _handle_blood_torrent,
-    "blood_scent": _handle_blood_scent,
-    "compression_sickness": _handle_compression_sickness,
-    "entropic_debt": _handle_entropic_debt,
-    "spiteful_reflection": _handle_spiteful_reflection,
     "brood_bloom": _handle_brood_bloom,
-    "miasma_aura": _handle_miasma_aura,
-    "temporal_lag": _handle_temporal_lag,
+    "entropic_debt": _handle_entropic_debt,
     "haste_dysphoria": _handle_haste_dysphoria,
     "fester_mark": _handle_fester_mark,
     "soul_tax": _handle_soul_tax,
-    "spotlight_ping": _handle_spotlight_ping,
     "audience_fatigue": _handle_audience_fatigue,
     "creeping_corruption": _handle_creeping_corruption,
 }
 
 
 def apply_status_effects(entity) -> bool:
-    """Update ``entity`` based on active status effects."""
+    """Update ``entity`` based on active status effects.
+
+    Registered handlers run for effects in ``STATUS_EFFECT_HANDLERS`` and the
+    rest follow their ``STATUS_EFFECT_TABLE`` rule, all in one pass.  Returns
+    whether the entity loses its turn.
+    """
     effects = getattr(entity, "status_effects", None)
     if effects is None:
         effects = {}
         setattr(entity, "status_effects", effects)
         return False
+    if not effects:
+        return False
     skip_turn = False
     is_player = entity.__class__.__name__ == "Player"
     name = entity.name if hasattr(entity, "name") else ""
-
-    for effect in list(effects.keys()):
+    bus = getattr(entity, "event_bus", None)
+    # Tick messages are only formatted when someone will see them.
+    listening = bus is None or bus.has_subscribers(StatusTicked)
+
+    for effect in list(effects):
+        if effect not in effects:
+            # Removed by an earlier effect this turn, e.g. creeping corruption.
+            continue
         handler = STATUS_EFFECT_HANDLERS.get(effect)
         if handler:
             skip_turn = handler(entity, effects, is_player, name) or skip_turn
+            continue
+        rule = STATUS_EFFECT_TABLE.get(effect)
+        if rule is not None:
+            skip_turn = (
+                _tick(entity, effect, rule, effects, is_player, name, bus, listening) or skip_turn
+            )
 
     return skip_turn
@@ -0,0 +1,402 @@
+"""Search enemy stat adjustments that bring every balance matchup into band.
+
+The tuner runs coordinate descent over multiplicative factors:
+
+* two global factors, one for the health ranges and one for the attack
+  ranges of every tuned enemy (the data-file counterpart of
+  ``enemy_hp_mult`` and ``enemy_dmg_mult``);
+* one health and one attack factor per enemy that appears in
+  ``balance_thresholds.yml``.
+
+Each coordinate is bisected on its own until every matchup it affects is
+inside its band.  A matchup's miss is how far its win rate lies above
+``max`` or below ``min``, and is zero inside the band.  Because stronger
+enemies never raise the win rate, every miss shrinks monotonically as a
+factor grows, which is what makes bisection valid.  A coordinate is only
+moved while every failing matchup lies on the same side of its band, and
+the search steps back whenever a passing matchup would be pushed out the
+other side, so one matchup above its band never offsets another below it.  Defense is left alone:
+it moves in whole points and has a much coarser effect.
+
+Win rates are memoised per ``(matchup, stats)`` and, when a
+:class:`~dungeoncrawler.sim_cache.SimCache` is given, stored on disk as well.
+Factors are rounded into integer stats before simulating, so neighbouring
+bisection steps often map to the same stats and are answered from the cache.
+
+The result is a unified diff against ``data/enemies.json``::
+
+    python -m dungeoncrawler.sim tune --output rebalance.diff
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .balance import THRESHOLDS_PATH, Matchup, load_matchups, shard_seed
+from .dungeon import DATA_DIR, ENEMY_STATS
+from .sim import ENGINES, battle_outcomes, class_player_stats, solve_exact
+from .sim_cache import DEFAULT_CACHE_DIR, SimCache, matchup_key
+
+ENEMIES_PATH = DATA_DIR / "enemies.json"
+
+# Range searched for every factor.
+MIN_FACTOR = 0.25
+MAX_FACTOR = 4.0
+
+# Bisection steps per coordinate; 12 steps narrow the range to under 0.001.
+DEFAULT_STEPS = 12
+
+Stats = Tuple[int, int, int, int, int]
+
+
+def band_miss(matchup: Matchup, win_rate: float) -> float:
+    """Return how far ``win_rate`` lies outside the band of ``matchup``.
+
+    Positive values mean the matchup is too easy for the player, negative
+    values too hard, and ``0`` means it passes.
+    """
+
+    if win_rate > matchup.max:
+        return win_rate - matchup.max
+    if win_rate < matchup.min:
+        return win_rate - matchup.min
+    return 0.0
+
+
+def _direction(misses: Sequence[float]) -> int:
+    # ``1`` when every failing matchup is too easy, so enemies should get
+    # stronger, ``-1`` when every failing matchup is too hard, and ``0`` when
+    # all pass or they fail on both sides.
+    easy = any(miss > 0 for miss in misses)
+    hard = any(miss < 0 for miss in misses)
+    return int(easy) - int(hard)
+
+
+def apply_factors(base: Sequence[int], hp_factor: float, atk_factor: float) -> Stats:
+    """Return ``base`` with its health and attack ranges scaled and rounded."""
+
+    hp_min, hp_max, atk_min, atk_max, defense = base
+    return (
+        max(1, round(hp_min * hp_factor)),
+        max(1, round(hp_max * hp_factor)),
+        max(1, round(atk_min * atk_factor)),
+        max(1, round(atk_max * atk_factor)),
+        defense,
+    )
+
+
+@dataclass
+class TuneResult:
+    """Outcome of :meth:`Tuner.tune`.
+
+    Attributes
+    ----------
+    stats:
+        Proposed ``ENEMY_STATS`` entry for every tuned enemy.
+    win_rates:
+        Final win rate keyed by :attr:`Matchup.key`.
+    passed:
+        Whether every matchup ended up inside its band.
+    evaluations:
+        Number of matchups actually simulated, excluding cache hits.
+    changed:
+        Enemies whose proposed stats differ from the current ones.
+    """
+
+    stats: Dict[str, Stats]
+    win_rates: Dict[str, float]
+    passed: bool
+    evaluations: int = 0
+    changed: List[str] = field(default_factory=list)
+
+
+class Tuner:
+    """Coordinate-descent search over enemy health and attack factors.
+
+    Parameters
+    ----------
+    matchups:
+        Matchups to satisfy, usually from
+        :func:`~dungeoncrawler.balance.load_matchups`.
+    engine:
+        Combat resolver.  ``"exact"`` is deterministic and fast; the sampling
+        engines simulate each matchup's ``runs`` with a fixed seed so every
+        candidate faces the same dice.
+    seed:
+        Base seed for the sampling engines.
+    cache:
+        Optional on-disk cache shared with later invocations.
+    steps:
+        Bisection steps per coordinate.
+    """
+
+    def __init__(
+        self,
+        matchups: Sequence[Matchup],
+        engine: str = "exact",
+        seed: int = 0,
+        cache: Optional[SimCache] = None,
+        steps: int = DEFAULT_STEPS,
+    ) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        self.matchups = list(matchups)
+        self.engine = engine
+        self.seed = seed
+        self.cache = cache
+        self.steps = steps
+        self.base: Dict[str, Stats] = {}
+        for matchup in self.matchups:
+            if matchup.enemy_kind not in ENEMY_STATS:
+                raise KeyError(f"Unknown enemy: {matchup.enemy_kind}")
+            self.base[matchup.enemy_kind] = tuple(ENEMY_STATS[matchup.enemy_kind])
+        self.global_factors = [1.0, 1.0]
+        self.factors: Dict[str, List[float]] = {name: [1.0, 1.0] for name in self.base}
+        self.evaluations = 0
+        self._memo: Dict[Tuple[str, Stats], float] = {}
+
+    def proposed(self, enemy: str) -> Stats:
+        """Return the stats ``enemy`` would have with the current factors."""
+
+        hp, atk = self.factors[enemy]
+        return apply_factors(
+            self.base[enemy], hp * self.global_factors[0], atk * self.global_factors[1]
+        )
+
+    def win_rate(self, matchup: Matchup, stats: Stats) -> float:
+        """Return the win rate of ``matchup`` against an enemy with ``stats``."""
+
+        memo_key = (matchup.key, stats)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+        key = None
+        if self.cache is not None:
+            key = matchup_key(
+                matchup.player_class,
+                matchup.enemy_kind,
+                self.engine,
+                self.seed,
+                matchup.runs,
+                floor=matchup.floor,
+                stats=list(stats),
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._memo[memo_key] = cached["win_rate"]
+                return cached["win_rate"]
+        rate = self._simulate(matchup, stats)
+        self.evaluations += 1
+        self._memo[memo_key] = rate
+        if self.cache is not None and key is not None:
+            self.cache.put(key, {"win_rate": rate})
+        return rate
+
+    def _simulate(self, matchup: Matchup, stats: Stats) -> float:
+        player_stats = class_player_stats(matchup.player_class)
+        engine = self.engine
+        if engine == "exact":
+            solved = solve_exact(matchup.enemy_kind, player_stats, matchup.floor, stats)
+            if solved is not None:
+                return solved["winrate"]
+            engine = "python"
+        wins, _ = battle_outcomes(
+            matchup.enemy_kind,
+            matchup.runs,
+            seed=shard_seed(self.seed, matchup, "tune"),
+            player_stats=player_stats,
+            engine=engine,
+            floor=matchup.floor,
+            stats=stats,
+        )
+        return wins / matchup.runs if matchup.runs else 0.0
+
+    def misses(self, matchups: Sequence[Matchup]) -> List[float]:
+        """Return the band miss of each of ``matchups`` under current factors."""
+
+        return [band_miss(m, self.win_rate(m, self.proposed(m.enemy_kind))) for m in matchups]
+
+    def error(self, matchups: Sequence[Matchup]) -> float:
+        """Return the summed absolute band miss of ``matchups``."""
+
+        return sum(abs(miss) for miss in self.misses(matchups))
+
+    def _bisect(self, values: List[float], index: int, matchups: Sequence[Matchup]) -> None:
+        start = _direction(self.misses(matchups))
+        if start == 0:
+            return
+        # Every failing matchup lies on the same side, so the fix lies on
+        # the same side of the current factor.
+        if start > 0:
+            low, high = values[index], MAX_FACTOR
+        else:
+            low, high = MIN_FACTOR, values[index]
+        # Unreachable targets leave the factor at the bound; the other
+        # coordinates may still make up the difference.
+        values[index] = high if start > 0 else low
+        if _direction(self.misses(matchups)) == start:
+            return
+        for _ in range(self.steps):
+            mid = (low + high) / 2
+            values[index] = mid
+            misses = self.misses(matchups)
+            if not any(misses):
+                return
+            # Keep going while the failures stay on the starting side; step
+            # back once a passing matchup overshoots to the other side.
+            if (_direction(misses) == start) == (start > 0):
+                low = mid
+            else:
+                high = mid
+        values[index] = low if start > 0 else high
+
+    def tune(self, rounds: int = 4) -> TuneResult:
+        """Run up to ``rounds`` passes of coordinate descent.
+
+        Each pass bisects the global health and attack factors against every
+        matchup, then each enemy's own factors against its matchups.  The
+        search stops early once every matchup passes.
+        """
+
+        by_enemy: Dict[str, List[Matchup]] = {}
+        for matchup in self.matchups:
+            by_enemy.setdefault(matchup.enemy_kind, []).append(matchup)
+
+        for _ in range(rounds):
+            if self._passed():
+                break
+            for index in (0, 1):
+                self._bisect(self.global_factors, index, self.matchups)
+            for enemy, matchups in by_enemy.items():
+                for index in (0, 1):
+                    self._bisect(self.factors[enemy], index, matchups)
+
+        stats = {enemy: self.proposed(enemy) for enemy in self.base}
+        return TuneResult(
+            stats=stats,
+            win_rates={m.key: self.win_rate(m, stats[m.enemy_kind]) for m in self.matchups},
+            passed=self._passed(),
+            evaluations=self.evaluations,
+            changed=[enemy for enemy in self.base if stats[enemy] != self.base[enemy]],
+        )
+
+    def _passed(self) -> bool:
+        return all(
+            band_miss(m, self.win_rate(m, self.proposed(m.enemy_kind))) == 0 for m in self.matchups
+        )
+
+
+def enemies_json_diff(stats: Mapping[str, Sequence[int]], path: Path | str = ENEMIES_PATH) -> str:
+    """Return a unified diff replacing the ``stats`` arrays in ``enemies.json``.
+
+    Only the numbers inside each affected ``"stats"`` array are rewritten so
+    the rest of the hand-formatted file is left untouched.  Enemies missing
+    from the file, such as those added by mods, are ignored.
+    """
+
+    path = Path(path)
+    original = path.read_text(encoding="utf-8")
+    updated = original
+    for name, values in stats.items():
+        pattern = re.compile(
+            r'("name":\s*' + re.escape(f'"{name}"') + r',\s*"stats":\s*\[)([^\]]*)'
+        )
+        match = pattern.search(updated)
+        if match is None:
+            continue
+        numbers = iter(values)
+        body = re.sub(r"-?\d+", lambda _: str(next(numbers)), match.group(2))
+        updated = updated[: match.start(2)] + body + updated[match.end(2) :]
+    return "".join(
+        difflib.unified_diff(
+            original.splitlines(keepends=True),
+            updated.splitlines(keepends=True),
+            fromfile=f"a/data/{path.name}",
+            tofile=f"b/data/{path.name}",
+        )
+    )
+
+
+def format_result(result: TuneResult, matchups: Sequence[Matchup]) -> str:
+    """Return a plain-text summary of the tuned win rates."""
+
+    lines = []
+    for m in matchups:
+        rate = result.win_rates[m.key]
+        status = "PASS" if band_miss(m, rate) == 0 else "FAIL"
+        lines.append(f"{m.key:<28} {rate:>7.3f} {m.min:.2f}-{m.max:.2f}  {status}")
+    lines.append(
+        f"{sum(1 for m in matchups if band_miss(m, result.win_rates[m.key]) == 0)}/"
+        f"{len(matchups)} matchups within thresholds after {result.evaluations} simulations"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for ``python -m dungeoncrawler.sim tune``.
+
+    Prints the tuned win rates and writes the proposed ``enemies.json`` diff
+    to ``--output`` (stdout by default).  Returns ``0`` when every matchup
+    could be brought inside its band and ``1`` otherwise.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m dungeoncrawler.sim tune",
+        description="Propose enemy stat changes that satisfy balance_thresholds.yml.",
+    )
+    parser.add_argument(
+        "--thresholds", default=str(THRESHOLDS_PATH), help="Path to balance_thresholds.yml"
+    )
+    parser.add_argument(
+        "--enemies", default=str(ENEMIES_PATH), help="enemies.json the diff is made against"
+    )
+    parser.add_argument("--engine", choices=ENGINES, default="exact", help="Combat resolver")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the sampling engines")
+    parser.add_argument("--rounds", type=int, default=4, help="Coordinate descent passes")
+    parser.add_argument(
+        "--steps", type=int, default=DEFAULT_STEPS, help="Bisection steps per coordinate"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="Directory for cached matchup results",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Simulate every candidate and skip the cache"
+    )
+    parser.add_argument(
+        "--output", default="-", help="Write the proposed diff to this path ('-' for stdout)"
+    )
+    args = parser.parse_args(argv)
+
+    matchups = load_matchups(args.thresholds)
+    cache = None if args.no_cache else SimCache(args.cache_dir)
+    tuner = Tuner(matchups, engine=args.engine, seed=args.seed, cache=cache, steps=args.steps)
+    result = tuner.tune(rounds=args.rounds)
+    print(format_result(result, matchups))
+    if cache is not None:
+        print(cache.report())
+    diff = enemies_json_diff({e: result.stats[e] for e in result.changed}, args.enemies)
+    if not diff:
+        print("No stat changes needed.")
+    elif args.output == "-":
+        sys.stdout.write(diff)
+    else:
+        Path(args.output).write_text(diff, encoding="utf-8")
+        print(f"Proposed changes written to {args.output}")
+    return 0 if result.passed else 1
+
+
+__all__ = [
+    "TuneResult",
+    "Tuner",
+    "apply_factors",
+    "band_miss",
+    "enemies_json_diff",
+    "format_result",
+]
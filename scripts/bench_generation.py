@@ -0,0 +1,57 @@
+"""Time dungeon generation for every distinct floor size.
+
+Reports the median time of the layout carving step alone and of a full
+``generate_dungeon`` call over several seeds::
+
+    python scripts/bench_generation.py --seeds 20
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import statistics
+import time
+
+from dungeoncrawler import map as dungeon_map
+from dungeoncrawler.dungeon import DungeonBase, floor_size
+from dungeoncrawler.entities import Player
+
+
+def _median_ms(func, seeds):
+    times = []
+    for seed in seeds:
+        start = time.perf_counter()
+        func(seed)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=10, help="Seeds timed per floor")
+    args = parser.parse_args(argv)
+
+    game = DungeonBase(1, 1)
+    game.player = Player("Bench")
+    seeds = range(args.seeds)
+    print(f"{'Floor':>5} {'Size':>7} {'Carve ms':>9} {'Generate ms':>12}")
+    seen = set()
+    for floor in range(1, 19):
+        size = floor_size(floor)
+        if size in seen:
+            continue
+        seen.add(size)
+        carve = _median_ms(lambda s: dungeon_map.carve_layout(*size, random.Random(s)), seeds)
+
+        def generate(seed):
+            game.rng.reseed(seed)
+            dungeon_map.generate_dungeon(game, floor)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            full = _median_ms(generate, seeds)
+        print(f"{floor:>5} {size[0]:>3}x{size[1]:<3} {carve:>9.2f} {full:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
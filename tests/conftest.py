@@ -2,7 +2,7 @@ import pytest
 
 from dungeoncrawler.data import load_floor_definitions
 from dungeoncrawler.dungeon import DungeonBase
-from dungeoncrawler.entities import Player
+from dungeoncrawler.entities import Enemy, Player
 
 
 @pytest.fixture
@@ -26,3 +26,46 @@ def game(player: Player) -> DungeonBase:
     game.visible = [[False for _ in range(game.width)] for _ in range(game.height)]
     game.rooms[player.y][player.x] = player
     return game
+
+
+@pytest.fixture
+def make_game():
+    """Return a factory for quiet games seeded for floor generation tests."""
+
+    def make(seed, prefetch=False, cache=None) -> DungeonBase:
+        load_floor_definitions()
+        game = DungeonBase(1, 1, seed=seed)
+        game.player = Player("Tester")
+        game.persistent = False
+        game.prefetch_floors = prefetch
+        game.floor_cache = cache
+        return game
+
+    return make
+
+
+def _floor_snapshot(game):
+    cells = [
+        (
+            (cell.name, cell.health, cell.attack_power)
+            if isinstance(cell, Enemy)
+            else type(cell).__name__
+        )
+        for row in game.rooms
+        for cell in row
+    ]
+    return (
+        cells,
+        game.room_names,
+        game.exit_coords,
+        (game.player.x, game.player.y),
+        game.active_quest.__class__,
+        game.messages,
+    )
+
+
+@pytest.fixture
+def floor_snapshot():
+    """Return a function summarising a game's current floor for comparisons."""
+
+    return _floor_snapshot
@@ -0,0 +1,63 @@
+import pytest
+
+from dungeoncrawler.arena import Arena, DuelPolicy, make_enemy, run_arena
+from dungeoncrawler.entities import Companion, Player
+from dungeoncrawler.sim import battle_outcomes, enemy_stat_ranges
+from dungeoncrawler.sim import main as sim_main
+from dungeoncrawler.sim import simulate_battles
+
+
+def test_duel_runs_real_battle_silently(capsys):
+    arena = Arena(seed=3)
+    player = Player("Hero")
+    enemy = make_enemy("Goblin", enemy_stat_ranges("Goblin"), arena.rng.generation)
+
+    turns = arena.duel(player, enemy)
+
+    assert turns > 0
+    assert not (player.is_alive() and enemy.is_alive())
+    assert capsys.readouterr().out == ""
+    assert "output_func" not in vars(player) and "output_func" not in vars(enemy)
+    assert player.output_func is print
+
+
+def test_policy_spends_stamina_on_skills():
+    arena = Arena()
+    arena.player = Player("Hero")
+    policy = DuelPolicy()
+    assert policy.answer(arena, "Choose action: ") == "4"
+    assert policy.answer(arena, "Choose skill: ") == "1"
+
+    arena.player.stamina = 0
+    assert policy.answer(arena, "Choose action: ") == "1"
+
+
+def test_run_arena_is_deterministic_and_reports_throughput():
+    first = run_arena("Bandit", 40, seed=5, player_stats={"health": 60, "attack": 12})
+    second = run_arena("Bandit", 40, seed=5, player_stats={"health": 60, "attack": 12})
+    assert (first.wins, first.total_turns) == (second.wins, second.total_turns)
+    assert first.battles_per_second > 0
+
+
+def test_loadout_companions_assist():
+    def loadout(player):
+        player.companions.append(Companion("Ally", attack_power=50))
+
+    report = run_arena("Goblin", 20, seed=1, loadout=loadout)
+    assert report.wins == 20
+
+
+def test_game_engine_through_simulate_battles():
+    stats = simulate_battles("Bandit", 30, seed=2, engine="game", floor=1)
+    assert 0 <= stats["winrate"] <= 1
+
+
+def test_sim_cli_reports_throughput(capsys):
+    sim_main(["Goblin", "--runs", "10", "--seed", "1", "--engine", "game"])
+    assert "battles/s" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("engine", ["python", "game"])
+def test_engines_accept_stat_override(engine):
+    wins, _ = battle_outcomes("Bandit", 10, seed=0, engine=engine, stats=(1, 1, 1, 1, 0))
+    assert wins == 10
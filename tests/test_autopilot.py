@@ -0,0 +1,117 @@
+import json
+import random
+
+import pytest
+
+import dungeoncrawler.dungeon as dungeon_module
+from dungeoncrawler.autopilot import Policy, classify_prompt, next_step, play_run, run_autopilot
+from dungeoncrawler.dungeon import DungeonBase
+from dungeoncrawler.entities import Enemy, Player
+from dungeoncrawler.items import Item
+from dungeoncrawler.sim import main as sim_main
+
+
+def _no_stdin(_prompt=""):
+    raise AssertionError("headless run read from stdin")
+
+
+def test_classify_prompt():
+    assert classify_prompt("Action: ") == "move"
+    assert classify_prompt("Choose action: ") == "battle"
+    assert classify_prompt("Retire for score or Descend (r/d): ") == "descend"
+    assert classify_prompt("Sell Rusty Pike for 2 credits? (y/n) ") == "sell"
+    assert classify_prompt("Something new: ") == "other"
+
+
+def test_next_step_avoids_enemies_and_heads_for_key(game):
+    # Player at (1, 1) on a 3x3 grid of empty rooms.
+    game.rooms = [["Empty"] * 3 for _ in range(3)]
+    game.rooms[1][1] = game.player
+    game.rooms[1][2] = Enemy("Goblin", 10, 2, 0, 0)
+    game.rooms[2][2] = Item("Key", "")
+    game.exit_coords = (0, 0)
+    assert next_step(game) == (0, 1)
+
+    game.player.inventory.append(Item("Key", ""))
+    assert next_step(game) in {(-1, 0), (0, -1)}
+
+
+def test_next_step_keeps_clear_of_dead_ends(game):
+    # A treasure in a one-tile pocket to the left, another down the corridor.
+    game.width = 4
+    game.rooms = [[None, "Empty", "Empty", "Empty"] for _ in range(3)]
+    game.rooms[1][0] = "Treasure"
+    game.rooms[1][3] = "Treasure"
+    game.player.x, game.player.y = 1, 1
+    game.rooms[1][1] = game.player
+    game.exit_coords = None
+    assert next_step(game) == (1, 0)
+
+
+def test_next_step_fights_when_the_exit_is_sealed(game):
+    game.rooms = [["Empty"] * 3 for _ in range(3)]
+    game.player.x, game.player.y = 1, 1
+    game.rooms[1][1] = game.player
+    game.rooms[1][2] = Enemy("Rat King", 150, 20, 8, 50)
+    game.player.inventory.append(Item("Key", ""))
+    game.exit_coords = None
+    assert next_step(game) == (1, 0)
+
+
+def test_policy_descends_through_floor_completion(tmp_path, monkeypatch):
+    monkeypatch.setattr(dungeon_module, "SAVE_FILE", tmp_path / "save.json")
+    monkeypatch.setattr("builtins.input", _no_stdin)
+    game = DungeonBase(1, 1)
+    game.persistent = False
+    game.player = Player("Tester")
+    game.player.inventory.append(Item("Key", ""))
+    game.exit_coords = (0, 0)
+    policy = Policy()
+    game.input_func = lambda text: policy.answer(game, text)
+
+    assert game.check_floor_completion(4) == (5, False)
+    assert game.check_floor_completion(9) == (10, False)
+    assert not (tmp_path / "save.json").exists()
+
+
+def test_run_autopilot_plays_headless_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr("builtins.input", _no_stdin)
+    report = run_autopilot(3, player_class="Warrior", seed=1, log_dir=tmp_path)
+
+    assert len(report.results) == 3
+    assert len({r.seed for r in report.results}) == 3
+    assert all(r.outcome in {"died", "finished", "stalled"} for r in report.results)
+    assert all(r.floor >= 1 for r in report.results)
+    assert report.runs_per_second > 0
+    assert (tmp_path / "balance.csv").exists()
+
+
+def test_seeded_run_gets_past_the_first_floor(tmp_path, monkeypatch):
+    monkeypatch.setattr("builtins.input", _no_stdin)
+    # Floor hooks still draw from the global generator.
+    random.seed(0)
+    result = play_run(8, log_dir=tmp_path)
+
+    assert result.floor > 1
+
+
+def test_autopilot_cli(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr("builtins.input", _no_stdin)
+    out = tmp_path / "runs.json"
+    with pytest.raises(SystemExit) as exc:
+        sim_main(["autopilot", "--runs", "2", "--log-dir", str(tmp_path), "--json", str(out)])
+    assert exc.value.code == 0
+    assert "runs/s" in capsys.readouterr().out
+    data = json.loads(out.read_text())
+    assert len(data["runs"]) == 2
+    assert data["player_class"] == "Warrior"
+
+
+def test_autopilot_cli_json_to_stdout(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr("builtins.input", _no_stdin)
+    with pytest.raises(SystemExit) as exc:
+        sim_main(["autopilot", "--runs", "1", "--log-dir", str(tmp_path), "--json", "-"])
+    assert exc.value.code == 0
+    captured = capsys.readouterr()
+    assert len(json.loads(captured.out)["runs"]) == 1
+    assert "runs/s" in captured.err
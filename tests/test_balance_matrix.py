@@ -15,5 +15,6 @@ def test_balance_matrix(case):
         case["enemy_kind"],
         case["floor"],
         case.get("runs", 100),
+        engine="exact",
     )
     assert case["min"] <= result.win_rate <= case["max"]
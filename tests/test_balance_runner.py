@@ -0,0 +1,104 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from dungeoncrawler.balance import (
+    Matchup,
+    load_matchups,
+    plan_shards,
+    results_to_json,
+    run_matrix,
+    shard_seed,
+)
+from dungeoncrawler.sim import simulate
+
+MATCHUPS = [
+    Matchup("Warrior", "Bandit", 1, 120, 0.0, 1.0),
+    Matchup("Mage", "Bandit", 1, 90, 0.0, 1.0),
+]
+
+
+def test_plan_shards_splits_runs_and_seeds_deterministically():
+    shards = plan_shards(MATCHUPS, chunk_size=50, seed=3)
+    assert [runs for _, m, runs, _ in shards if m is MATCHUPS[0]] == [50, 50, 20]
+    assert [runs for _, m, runs, _ in shards if m is MATCHUPS[1]] == [50, 40]
+    seeds = [seed for *_, seed in shards]
+    assert len(set(seeds)) == len(seeds)
+    assert seeds[0] == shard_seed(3, MATCHUPS[0], 0)
+
+
+def test_run_matrix_identical_for_any_worker_count():
+    serial = run_matrix(MATCHUPS, workers=1, chunk_size=40)
+    parallel = run_matrix(MATCHUPS, workers=2, chunk_size=40)
+    assert [r.to_dict() for r in serial] == [r.to_dict() for r in parallel]
+    assert [r.runs for r in serial] == [120, 90]
+
+
+def test_results_to_json_reports_pass_fail():
+    failing = Matchup("Warrior", "Bandit", 1, 20, 0.99, 1.0)
+    results = run_matrix([MATCHUPS[0], failing], workers=1)
+    data = json.loads(results_to_json(results, seed=0))
+    assert data["seed"] == 0
+    assert data["passed"] is False
+    assert [m["passed"] for m in data["matchups"]] == [True, False]
+
+
+def test_matrix_cli(tmp_path):
+    pytest.importorskip("yaml")
+    out = tmp_path / "results.json"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "dungeoncrawler.sim",
+            "matrix",
+            "--workers",
+            "2",
+            "--json",
+            str(out),
+            "--cache-dir",
+            str(tmp_path / "cache"),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert "Result" in result.stdout
+    data = json.loads(out.read_text())
+    assert len(data["matchups"]) == 4
+    assert data["passed"] is True
+    assert result.returncode == 0
+
+
+def test_matrix_cli_json_to_stdout(tmp_path):
+    pytest.importorskip("yaml")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "dungeoncrawler.sim",
+            "matrix",
+            "--workers",
+            "1",
+            "--json",
+            "-",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    data = json.loads(result.stdout)
+    assert len(data["matchups"]) == 4
+    assert "Result" in result.stderr
+
+
+def test_default_thresholds_pass_sampled_and_exact():
+    pytest.importorskip("yaml")
+    matchups = load_matchups()
+    results = run_matrix(matchups, workers=1)
+    assert [r.passed for r in results] == [True] * len(matchups)
+    for m in matchups:
+        exact = simulate(m.player_class, m.enemy_kind, m.floor, m.runs, engine="exact")
+        assert m.min <= exact.win_rate <= m.max
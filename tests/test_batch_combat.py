@@ -0,0 +1,43 @@
+import pytest
+
+from dungeoncrawler.sim import simulate, simulate_battles
+
+np = pytest.importorskip("numpy")
+
+from dungeoncrawler.batch_combat import BatchSide, resolve_batch, simulate_batch  # noqa: E402
+
+
+def test_numpy_engine_matches_python_engine():
+    scalar = simulate("Mage", "Bandit", 1, 2000, seed=1)
+    batch = simulate("Mage", "Bandit", 1, 2000, seed=1, engine="numpy")
+    assert abs(scalar.win_rate - batch.win_rate) < 0.05
+
+
+def test_numpy_engine_is_deterministic_with_seed():
+    first = simulate_battles("Bandit", 50, seed=7, engine="numpy")
+    second = simulate_battles("Bandit", 50, seed=7, engine="numpy")
+    assert first == second
+
+
+def test_defend_intent_reduces_next_hit():
+    rng = np.random.default_rng(0)
+    player = BatchSide.from_stats({"health": 1000, "attack": 10, "speed": 100}, 4)
+    enemy = BatchSide.from_stats({"health": 1000, "attack": 0}, 4)
+    resolve_batch(player, enemy, rng, intents=["defend"], max_rounds=2)
+    # First hit lands for 10, the second is softened to 6 by the defend.
+    assert enemy.health.tolist() == [984] * 4
+    assert enemy.defend_damage.tolist() == [1] * 4
+    assert enemy.defend_attack.tolist() == [2] * 4
+
+
+def test_heavy_intent_increases_damage():
+    rng = np.random.default_rng(0)
+    player = BatchSide.from_stats({"health": 100, "speed": -100}, 3)
+    enemy = BatchSide.from_stats({"health": 10, "attack": 10, "speed": 100}, 3)
+    resolve_batch(player, enemy, rng, intents=["heavy_attack"], max_rounds=1)
+    assert player.health.tolist() == [85] * 3
+
+
+def test_stalemates_stop_and_count_as_losses():
+    stats = simulate_batch({"health": 10, "defense": 50}, {"health": 10, "attack": 5}, 5, seed=0)
+    assert stats == {"winrate": 0, "avg_turns": 0}
@@ -0,0 +1,102 @@
+import json
+import subprocess
+import sys
+
+from dungeoncrawler.bench import (
+    FloorSample,
+    floor_passed,
+    parse_floors,
+    plan_chunks,
+    results_to_json,
+    run_gen,
+    summarize,
+)
+
+
+def test_parse_floors_and_plan_chunks():
+    assert parse_floors("1-3,9, 2") == [1, 2, 3, 9]
+    chunks = plan_chunks([1, 2], seeds=12, base_seed=5, chunk_size=5)
+    assert chunks[:3] == [(1, [5, 6, 7, 8, 9]), (1, [10, 11, 12, 13, 14]), (1, [15, 16])]
+    assert len(chunks) == 6
+
+
+def test_layout_figures_identical_for_any_worker_count():
+    serial = run_gen([1, 4], 6, workers=1, chunk_size=6, memory_samples=1)
+    parallel = run_gen([1, 4], 6, workers=2, chunk_size=4, memory_samples=1)
+    assert [entry["layout"] for entry in serial] == [entry["layout"] for entry in parallel]
+    first = serial[0]
+    assert first["samples"] == 6
+    assert first["layout"]["walkable"]["mean"] == 0.5
+    assert first["layout"]["unreachable_exit"] == first["layout"]["unreachable_key"] == 0
+    assert all(floor_passed(entry) for entry in serial)
+
+
+def test_results_to_json_reports_failing_checks():
+    results = run_gen([2], 3, workers=1, memory_samples=0)
+    assert results[0]["peak_kb"] is None
+    results[0]["layout"]["unreachable_key"] = 1
+    data = json.loads(results_to_json(results, seed=0))
+    assert data["passed"] is False
+    assert data["floors"][0]["floor"] == 2
+
+
+def test_summarize_counts_enemy_density_misses():
+    samples = [
+        FloorSample(seed, 1.0, None, 0.5, count, 4, True, True) for seed, count in [(0, 3), (1, 9)]
+    ]
+    entry = summarize(1, (20, 12), samples)
+    assert entry["layout"]["enemies"]["expected"] == [3, 4]
+    assert entry["layout"]["enemies"]["out_of_range"] == 1
+    assert not floor_passed(entry)
+
+
+def test_gen_cli(tmp_path):
+    out = tmp_path / "gen.json"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "dungeoncrawler.bench",
+            "gen",
+            "--floors",
+            "1-2",
+            "--seeds",
+            "4",
+            "--workers",
+            "1",
+            "--json",
+            str(out),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert "Result" in result.stdout
+    data = json.loads(out.read_text())
+    assert [entry["floor"] for entry in data["floors"]] == [1, 2]
+    assert result.returncode == (0 if data["passed"] else 1)
+
+
+def test_gen_cli_json_to_stdout():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "dungeoncrawler.bench",
+            "gen",
+            "--floors",
+            "1",
+            "--seeds",
+            "2",
+            "--workers",
+            "1",
+            "--memory-samples",
+            "0",
+            "--json",
+            "-",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    data = json.loads(result.stdout)
+    assert [entry["floor"] for entry in data["floors"]] == [1]
+    assert "Result" in result.stderr
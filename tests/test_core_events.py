@@ -1,3 +1,5 @@
+import sys
+
 from dungeoncrawler.core.combat import resolve_attack, resolve_enemy_turn, resolve_player_action
 from dungeoncrawler.core.entity import Entity
 from dungeoncrawler.core.events import AttackResolved, IntentTelegraphed, StatusApplied
@@ -50,3 +52,20 @@ def test_update_visibility_yields_events():
     assert coords == {(0, 0), (1, 0), (0, 1)}
     # calling again should yield no new events
     assert gm.update_visibility(0, 0, 1) == []
+
+
+def test_attack_message_is_formatted_on_demand(monkeypatch):
+    rolls = iter([1, 100, 100])
+    monkeypatch.setattr("dungeoncrawler.core.combat.random.randint", lambda a, b: next(rolls))
+    attacker = Entity("A", {"health": 10, "attack": 5})
+    defender = Entity("D", {"health": 4, "defense": 1})
+
+    hit = resolve_attack(attacker, defender)
+    miss = resolve_attack(attacker, defender)
+
+    assert hit.text is None
+    assert hit.message == "A hits D for 4 damage. D is defeated."
+    assert hit.text == hit.message
+    assert miss.message == "A misses D."
+    assert AttackResolved("Custom.", "A", "D", 1, False).message == "Custom."
+    assert hasattr(hit, "__dict__") == (sys.version_info < (3, 10))
@@ -1,6 +1,6 @@
 """Tests ensuring defense values are considered in combat."""
 
-from dungeoncrawler.combat import enemy_turn
+from dungeoncrawler.combat import Combatant, enemy_turn
 from dungeoncrawler.core.combat import resolve_player_action
 from dungeoncrawler.core.entity import Entity as CoreEntity
 from dungeoncrawler.entities import Armor, Enemy, Player
@@ -56,3 +56,38 @@ def test_player_attack_respects_enemy_defense(monkeypatch):
     resolve_player_action(p_entity, e_entity, "attack")
 
     assert e_entity.stats["health"] == enemy.health - (player.attack_power - enemy.defense)
+
+
+def test_combatant_shares_stats_with_owner():
+    """Combatant stats read the live owner and write health back."""
+
+    player = Player("Hero")
+    combatant = Combatant.for_player(player)
+    assert combatant.stats["defense"] == 0
+
+    player.armor = Armor("Plate", "", defense=4)
+    player.attack_power = 17
+    assert combatant.stats["defense"] == 4
+    assert combatant.stats.get("attack") == 17
+    assert combatant.stats.get("crit", 0) == 0
+
+    combatant.stats["health"] = 12
+    assert player.health == 12
+    combatant.stats["crit"] = 25
+    assert dict(combatant.stats)["crit"] == 25
+
+
+def test_defend_status_carries_into_enemy_turn(monkeypatch):
+    """A player's Defend softens the next enemy hit of the same battle."""
+
+    monkeypatch.setattr("dungeoncrawler.core.combat.random.randint", lambda a, b: 1)
+    player = Player("Hero")
+    enemy = Enemy("Goblin", 10, 10, 0, 0)
+    combatants = (Combatant.for_enemy(enemy), Combatant.for_player(player))
+    start = player.health
+
+    resolve_player_action(combatants[1], combatants[0], "defend")
+    enemy_turn(enemy, player, DummyRenderer(), combatants=combatants)
+
+    assert player.health == start - 6
+    assert combatants[1].status == ["defend_attack"]
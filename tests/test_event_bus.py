@@ -0,0 +1,89 @@
+from dungeoncrawler.arena import Arena, make_enemy
+from dungeoncrawler.core.bus import EventBus
+from dungeoncrawler.core.events import AttackResolved, Event, StatusApplied, StatusTicked
+from dungeoncrawler.entities import Player
+from dungeoncrawler.sim import enemy_stat_ranges
+from dungeoncrawler.status_effects import add_status_effect
+
+
+def test_subscriptions_filter_by_type():
+    bus = EventBus()
+    attacks, everything = [], []
+    bus.subscribe(attacks.append, AttackResolved)
+    bus.subscribe(everything.append)
+    hit = AttackResolved(None, "A", "B", 3, False)
+    note = StatusApplied("A defends.", "A", "defend", 1)
+
+    bus.publish(hit)
+    bus.publish(note)
+
+    assert attacks == [hit]
+    assert everything == [hit, note]
+    assert bus.has_subscribers(StatusApplied)
+    assert not EventBus().has_subscribers()
+
+
+def test_batched_subscription_waits_for_flush():
+    bus = EventBus()
+    batches = []
+    subscription = bus.subscribe(batches.append, Event, batched=True)
+    bus.publish_all([Event("one"), Event("two")])
+    assert batches == []
+
+    bus.flush()
+    bus.flush()
+    assert [[event.message for event in batch] for batch in batches] == [["one", "two"]]
+
+    bus.unsubscribe(subscription)
+    bus.publish(Event("three"))
+    bus.flush()
+    assert len(batches) == 1
+
+
+def test_status_effects_publish_on_bound_bus(capsys):
+    bus = EventBus()
+    events = []
+    bus.subscribe(events.append)
+    player = Player("Hero")
+    player.event_bus = bus
+
+    add_status_effect(player, "poison", 2)
+    player.apply_status_effects()
+
+    assert capsys.readouterr().out == ""
+    assert isinstance(events[0], StatusApplied)
+    assert isinstance(events[1], StatusTicked)
+    assert (events[1].target, events[1].status) == ("Hero", "poison")
+
+
+def test_battle_publishes_turns_on_game_bus():
+    arena = Arena(seed=4)
+    turns = []
+    arena.event_bus.subscribe(turns.append, AttackResolved, batched=True)
+    player = Player("Hero")
+    enemy = make_enemy("Goblin", enemy_stat_ranges("Goblin"), arena.rng.generation)
+
+    rounds = arena.duel(player, enemy)
+
+    assert 0 < len(turns) <= rounds + 1
+    assert all(isinstance(event, AttackResolved) for batch in turns for event in batch)
+    assert "event_bus" not in vars(player) and "event_bus" not in vars(enemy)
+
+
+def test_status_messages_after_a_battle_use_output_func():
+    arena = Arena(seed=4)
+    own_bus = EventBus()
+    player = Player("Hero")
+    player.event_bus = own_bus
+    enemy = make_enemy("Goblin", enemy_stat_ranges("Goblin"), arena.rng.generation)
+    arena.duel(player, enemy)
+    assert player.event_bus is own_bus
+
+    del player.event_bus
+    lines = []
+    player.output_func = lines.append
+    player.status_effects.clear()
+    add_status_effect(player, "poison", 2)
+    player.apply_status_effects()
+
+    assert lines and any("Poison" in line for line in lines)
@@ -0,0 +1,45 @@
+import pytest
+
+from dungeoncrawler import sim
+from dungeoncrawler.exact_combat import UnsupportedMatchup, solve_battle
+from dungeoncrawler.sim import class_player_stats, enemy_stat_ranges, simulate_battles
+
+
+def test_certain_one_hit_kill():
+    result = solve_battle({"health": 10, "speed": 10}, {"health": 5, "attack": 20, "speed": 35})
+    assert result == {"winrate": 1.0, "avg_turns": 1.0}
+
+
+def test_duel_of_one_hit_kills_matches_closed_form():
+    player = {"health": 5, "attack": 20, "speed": 10}
+    enemy = {"health": 10, "attack": 20, "speed": 10}
+    result = solve_battle(enemy, player)
+    # Each round the player wins with 0.75; both miss with 0.25 * 0.25.
+    assert result["winrate"] == pytest.approx(0.75 / (1 - 0.0625))
+    assert result["avg_turns"] == pytest.approx(1 / (1 - 0.0625))
+
+
+def test_stalemate_counts_as_loss():
+    result = solve_battle({"health": 10, "defense": 50}, {"health": 10, "attack": 5})
+    assert result == {"winrate": 0.0, "avg_turns": 0.0}
+
+
+@pytest.mark.parametrize("intents", [["attack"], ["attack", "defend"], ["heavy_attack"]])
+def test_exact_agrees_with_sampling(monkeypatch, intents):
+    monkeypatch.setattr(sim, "enemy_intents", lambda name: intents)
+    stats = class_player_stats("Mage")
+    exact = simulate_battles("Goblin", 3000, player_stats=stats, engine="exact", intents=True)
+    sampled = simulate_battles("Goblin", 3000, seed=1, player_stats=stats, intents=True)
+    assert abs(exact["winrate"] - sampled["winrate"]) < 0.04
+    assert abs(exact["avg_turns"] - sampled["avg_turns"]) < 0.5
+
+
+def test_unbounded_defend_stacking_is_unsupported():
+    with pytest.raises(UnsupportedMatchup):
+        solve_battle(enemy_stat_ranges("Bandit"), {"health": 30, "attack": 8}, ["defend"])
+
+
+def test_exact_engine_falls_back_to_sampling(monkeypatch):
+    monkeypatch.setattr(sim, "enemy_intents", lambda name: ["defend"])
+    stats = simulate_battles("Bandit", 20, seed=0, engine="exact", intents=True)
+    assert stats["winrate"] == 1.0
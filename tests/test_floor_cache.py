@@ -0,0 +1,53 @@
+from dungeoncrawler import map as dungeon_map
+from dungeoncrawler.config import config
+from dungeoncrawler.dungeon import DungeonBase
+from dungeoncrawler.floor_cache import FloorCache, floor_key
+
+
+def test_floor_depends_only_on_seed_floor_and_settings(make_game):
+    settings = dungeon_map.FloorSettings(1.0, 1.0, 0.1, 1.0)
+    first, second = make_game(21), make_game(21)
+    second.rng.combat.random()
+    second.rng.generation.random()
+
+    a = dungeon_map.build_floor(first, 6, settings=settings)
+    b = dungeon_map.build_floor(second, 6, settings=settings)
+    assert a.rooms.kinds == b.rooms.kinds and a.room_names == b.room_names
+    assert floor_key(first, 6, settings) == floor_key(second, 6, settings)
+    assert floor_key(first, 7, settings) != floor_key(first, 6, settings)
+    assert floor_key(make_game(22), 6, settings) != floor_key(first, 6, settings)
+    assert floor_key(first, 6, dungeon_map.FloorSettings(2.0, 1.0, 0.1, 1.0)) != floor_key(
+        first, 6, settings
+    )
+    assert floor_key(DungeonBase(1, 1), 6, settings) is None
+
+
+def test_cached_floor_matches_generated_floor(tmp_path, monkeypatch, make_game, floor_snapshot):
+    cache = FloorCache(tmp_path)
+    cold = make_game(21, cache=cache)
+    monkeypatch.setattr(config, "trap_chance", config.trap_chance)
+    base_trap_chance = config.trap_chance
+    cold.generate_dungeon(12)
+    # generate_dungeon raises the global trap chance for deep floors.
+    config.trap_chance = base_trap_chance
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    warm = make_game(21, cache=cache)
+    warm.generate_dungeon(12)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert floor_snapshot(warm) == floor_snapshot(cold)
+    assert warm.distance_field.buckets == cold.distance_field.buckets
+
+
+def test_corrupt_entries_are_regenerated(tmp_path, monkeypatch, make_game):
+    monkeypatch.setattr(config, "trap_chance", config.trap_chance)
+    cache = FloorCache(tmp_path)
+    make_game(21, cache=cache).generate_dungeon(2)
+    (entry,) = tmp_path.glob("*.json")
+    entry.write_text("{}", encoding="utf-8")
+
+    game = make_game(21, cache=cache)
+    game.generate_dungeon(2)
+    assert cache.misses == 2
+    assert game.exit_coords is not None
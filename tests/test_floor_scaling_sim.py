@@ -0,0 +1,46 @@
+import pytest
+
+from dungeoncrawler.config import config
+from dungeoncrawler.dungeon import ENEMY_STATS
+from dungeoncrawler.map import floor_multipliers
+from dungeoncrawler.sim import enemy_stat_ranges, floor_stat_table, simulate
+
+
+def test_floor_multipliers_include_hard_band():
+    assert floor_multipliers(1) == (1, 1)
+    hp9, dmg9 = floor_multipliers(9)
+    hp10, dmg10 = floor_multipliers(10)
+    assert hp10 - hp9 == pytest.approx(0.2)
+    assert dmg10 - dmg9 == pytest.approx(0.14)
+
+
+def test_table_covers_every_enemy_and_floor():
+    table = floor_stat_table()
+    assert len(table) == len(ENEMY_STATS) * config.max_floors
+    assert table is floor_stat_table()
+
+
+def test_enemy_stats_scale_like_generation():
+    hp_min, hp_max, atk_min, atk_max, defense = ENEMY_STATS["Bandit"]
+    assert enemy_stat_ranges("Bandit", 1) == {
+        "health": (hp_min + 1, hp_max + 1),
+        "attack": (atk_min + 1, atk_max + 1),
+        "defense": max(1, defense),
+        "speed": 10,
+    }
+    floor12 = enemy_stat_ranges("Bandit", 12)
+    assert floor12["health"] == (int((hp_min + 24) * 1.7), int((hp_max + 24) * 1.7))
+    assert floor12["attack"] == (int((atk_min + 24) * 1.54), int((atk_max + 24) * 1.54))
+    assert floor12["defense"] == max(1, defense + 4)
+    with pytest.raises(ValueError):
+        enemy_stat_ranges("Bandit", config.max_floors + 1)
+
+
+def test_table_follows_enemy_stat_edits(monkeypatch):
+    monkeypatch.setitem(ENEMY_STATS, "Bandit", (1, 1, 1, 1, 0))
+    assert enemy_stat_ranges("Bandit", 1)["health"] == (2, 2)
+
+
+def test_deeper_floors_are_harder():
+    rates = [simulate("Mage", "Bandit", floor, 0, engine="exact").win_rate for floor in (1, 5, 10)]
+    assert rates[0] > rates[1] > rates[2]
@@ -0,0 +1,130 @@
+import pytest
+
+from dungeoncrawler.dungeon import ROOM_NAME_ADJECTIVES, ROOM_NAME_NOUNS, DungeonBase
+from dungeoncrawler.entities import Enemy, Player
+from dungeoncrawler.grid import (
+    TILE_CODES,
+    RoomNames,
+    TileGrid,
+    find_enemy,
+    find_entities,
+    find_tiles,
+    open_cells,
+)
+from dungeoncrawler.map import build_floor
+
+
+def test_rows_read_and_write_like_lists():
+    grid = TileGrid(4, 3)
+    grid[1][2] = "Empty"
+    grid[2][-1] = "Trap"
+
+    assert grid[1][2] == "Empty"
+    assert grid[2][3] == "Trap"
+    assert grid[0][0] is None
+    assert len(grid) == 3 and len(grid[0]) == 4
+    assert grid[1][1:3] == [None, "Empty"]
+    with pytest.raises(IndexError):
+        grid[0][4]
+    assert grid == [[None] * 4, [None, None, "Empty", None], [None, None, None, "Trap"]]
+
+
+def test_objects_live_in_sparse_layer():
+    grid = TileGrid(3, 3)
+    goblin = Enemy("Goblin", 10, 2, 0, 0)
+    grid[0][1] = goblin
+    grid[2][2] = Player("Hero")
+
+    assert grid[0][1] is goblin
+    assert set(grid.objects) == {(1, 0), (2, 2)}
+    grid[0][1] = "Empty"
+    assert (1, 0) not in grid.objects
+    assert isinstance(grid.kinds, bytearray) and len(grid.kinds) == 9
+
+
+def test_unknown_place_names_are_interned():
+    grid = TileGrid(2, 1)
+    grid[0][0] = "Hall of Echoes"
+
+    assert "Hall of Echoes" in TILE_CODES
+    assert grid[0][0] == "Hall of Echoes"
+    assert not grid.objects
+
+
+def test_helpers_match_on_grids_and_lists():
+    goblin = Enemy("Goblin", 10, 2, 0, 0)
+    rows = [["Empty", None, "Empty"], [goblin, "Empty", None]]
+    grid = TileGrid.from_rows(rows)
+
+    assert grid.to_lists() == rows
+    assert find_tiles(grid, "Empty") == find_tiles(rows, "Empty") == [(0, 0), (2, 0), (1, 1)]
+    assert find_enemy(grid, "Goblin") == find_enemy(rows, "Goblin") == (goblin, 0, 1)
+    assert find_enemy(grid, "Orc") is None
+    assert open_cells(grid) == open_cells(rows) == [(0, 0), (2, 0), (0, 1), (1, 1)]
+
+
+def test_room_names_are_derived_from_seed_and_store_only_renames():
+    names = RoomNames(6, 4, 99, ROOM_NAME_ADJECTIVES, ROOM_NAME_NOUNS)
+    again = RoomNames(6, 4, 99, ROOM_NAME_ADJECTIVES, ROOM_NAME_NOUNS)
+    adjective, noun = names[2][3].split(" ")
+    assert adjective in ROOM_NAME_ADJECTIVES and noun in ROOM_NAME_NOUNS
+    assert names == again.to_lists()
+    assert names != RoomNames(6, 4, 100, ROOM_NAME_ADJECTIVES, ROOM_NAME_NOUNS)
+    assert len({name for row in names for name in row}) > 10
+
+    original = names[2][3]
+    names[2][3] = "Glittering Vault"
+    assert names[2][3] == "Glittering Vault"
+    assert names.overrides == {2 * 6 + 3: "Glittering Vault"}
+    names[2][-3] = original
+    assert names.overrides == {}
+    with pytest.raises(IndexError):
+        names[0][6] = "Sealed Gate"
+    with pytest.raises(IndexError):
+        names[0][-7] = "Sealed Gate"
+    assert names.overrides == {}
+
+
+def test_floor_room_names_depend_on_seed_and_floor():
+    game = DungeonBase(1, 1, seed=5)
+    layout = build_floor(game, 3)
+    assert layout.room_names == build_floor(game, 3).room_names
+    assert layout.room_names != build_floor(game, 4).room_names
+    assert not layout.room_names.overrides
+
+
+def test_entity_index_follows_grid_writes():
+    grid = TileGrid(5, 5)
+    rat = Enemy("Rat", 3, 1, 0, 0)
+    king = Enemy("Rat King", 30, 4, 1, 0)
+    grid[1][1] = rat
+    grid[2][3] = king
+    grid[4][4] = Player("Hero")
+    assert find_enemy(grid, "Rat King") == (king, 3, 2)
+    assert [obj for obj, *_ in find_entities(grid, Enemy)] == [rat, king]
+    assert len(grid.index) == 3
+
+    king.name = "Fallen King"
+    grid[2][3] = "Empty"
+    grid[1][1] = king
+    assert find_enemy(grid, "Rat King") is None
+    assert find_enemy(grid, "Fallen King") == (king, 1, 1)
+    assert grid.index.named("Rat") == []
+    assert len(grid.index) == 2
+
+
+def test_game_state_lookups_use_the_index():
+    game = DungeonBase(1, 1, seed=3)
+    game.player = Player("Tester")
+    game.persistent = False
+    game.prefetch_floors = False
+    game.generate_dungeon(4)
+    state = game._make_state(4)
+
+    on_grid = [obj for obj in game.rooms.objects.values() if isinstance(obj, Enemy)]
+    assert sorted(map(id, state.enemies)) == sorted(map(id, on_grid))
+    assert state.elites == []
+    on_grid[0].rarity = "elite"
+    assert state.elites == [on_grid[0]]
+    enemy, x, y = state.find_enemy(on_grid[0].name)
+    assert game.rooms[y][x] is enemy
@@ -29,3 +29,18 @@ def test_set_language_handles_missing_locale(monkeypatch):
     # Should not raise and should call translation with languages=None
     i18n.set_language()
     assert captured["languages"] is None
+
+
+def test_gettext_resolves_catalog_once(monkeypatch):
+    calls = []
+    real_translation = gettext.translation
+
+    def counting_translation(*args, **kwargs):
+        calls.append(args)
+        return real_translation(*args, **kwargs)
+
+    monkeypatch.setattr(i18n, "_catalog", None)
+    monkeypatch.setattr(gettext, "translation", counting_translation)
+    assert i18n.gettext("Attack") == "Attack"
+    assert i18n.gettext("Defend") == "Defend"
+    assert len(calls) == 1
@@ -17,19 +17,34 @@ def test_render_map_snapshot():
         "                    \n"
         "         .          \n"
         "        ...         \n"
-        "         ...        \n"
-        "         ....       \n"
-        "         .  ..      \n"
-        "         .@ ...     \n"
-        "         .......    \n"
-        "       ........     \n"
+        "       ...          \n"
+        "       .E...        \n"
+        "       . ...        \n"
+        "        ..@.  .     \n"
+        "        .......     \n"
+        "        .......     \n"
         "         .....      \n"
-        "          ...       \n"
-        "          ..        "
+        "        .. ..       \n"
+        "         . .        "
     )
     assert rendered == expected
 
 
+def test_render_map_reads_packed_and_list_layers_alike():
+    random.seed(0)
+    load_floor_definitions()
+    game = DungeonBase(1, 1)
+    game.player = Player("Tester")
+    dungeon_map.generate_dungeon(game, floor=1)
+    packed = dungeon_map.render_map_string(game)
+
+    game.visible = game.visible.to_lists()
+    game.discovered = game.discovered.to_lists()
+    game.discovered[0][0] = True
+
+    assert dungeon_map.render_map_string(game) == "·" + packed[1:]
+
+
 def test_render_map_symbols_after_show_map():
     random.seed(0)
     load_floor_definitions()
@@ -70,3 +85,67 @@ def test_map_legend_toggle():
         assert entry in game.renderer.lines
     assert game.renderer.lines.count("Legend:") == 1
     assert not game.renderer.legend_visible
+
+
+def test_carve_layout_fills_half_the_grid_deterministically():
+    cells, start = dungeon_map.carve_layout(92, 72, random.Random(4))
+    assert start == (46, 36)
+    assert start in cells
+    assert len(cells) == 92 * 72 // 2
+    assert all(0 <= x < 92 and 0 <= y < 72 for x, y in cells)
+    assert dungeon_map.carve_layout(92, 72, random.Random(4)) == (cells, start)
+
+
+def test_distance_field_measures_walking_distance():
+    # A U-shaped corridor: (2, 0) is two tiles from the origin in a straight
+    # line but six steps away on foot.
+    cells = [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0)]
+    field = dungeon_map.DistanceField(cells, (0, 0))
+
+    assert field.distance((2, 0)) == 6
+    assert field.distance((5, 5)) is None
+    assert len(field) == 6 and (0, 0) not in field
+
+    rng = random.Random(1)
+    near = {field.take_within(2, rng) for _ in range(2)}
+    assert near == {(0, 1), (0, 2)}
+    assert field.take_within(2, rng) is None
+    field.discard((2, 0))
+    assert sorted(cell for bucket in field.buckets for cell in bucket) == [(1, 2), (2, 1), (2, 2)]
+
+
+def test_generation_leaves_nearby_empty_tiles_in_distance_field():
+    random.seed(4)
+    load_floor_definitions()
+    game = DungeonBase(1, 1)
+    game.player = Player("Tester")
+    dungeon_map.generate_dungeon(game, floor=1)
+
+    field = game.distance_field
+    assert field.origin == (game.player.x, game.player.y)
+    assert field.distance(game.exit_coords) <= 10
+    near_empty = {
+        (x, y)
+        for y, row in enumerate(game.rooms)
+        for x, obj in enumerate(row)
+        if obj == "Empty" and field.distance((x, y)) is not None
+    }
+    assert near_empty
+    assert {cell for bucket in field.buckets for cell in bucket} == near_empty
+    assert max(field.distances.values()) <= dungeon_map.NEAR_START_STEPS
+
+
+def test_quest_field_is_rebuilt_from_the_player_when_off_start():
+    random.seed(4)
+    load_floor_definitions()
+    game = DungeonBase(1, 1)
+    game.player = Player("Tester")
+    dungeon_map.generate_dungeon(game, floor=1)
+    start = (game.player.x, game.player.y)
+    game.player.x, game.player.y = game.distance_field.buckets[1][0]
+
+    game.generate_quest(1)
+
+    field = game.distance_field
+    assert field.origin == (game.player.x, game.player.y)
+    assert field.distance(start) == 1
@@ -0,0 +1,70 @@
+from dungeoncrawler.dungeon import DungeonBase
+from dungeoncrawler.entities import Player
+from dungeoncrawler.grid import TileGrid
+from dungeoncrawler.pathfinding import Pathfinder
+from dungeoncrawler.quests import EscortNPC, EscortQuest
+
+LAYOUT = [
+    ".....",
+    ".###.",
+    ".#...",
+    ".#.#.",
+    "...#.",
+]
+
+
+def _rows(layout=LAYOUT):
+    return [[None if ch == "#" else "Empty" for ch in row] for row in layout]
+
+
+def test_path_goes_around_walls():
+    finder = Pathfinder(TileGrid.from_rows(_rows()))
+    path = finder.path((2, 2), (0, 4))
+    assert path[0] == (2, 2) and path[-1] == (0, 4)
+    assert len(path) - 1 == 4
+    assert all(finder.is_walkable(x, y) for x, y in path)
+    assert all(abs(ax - bx) + abs(ay - by) == 1 for (ax, ay), (bx, by) in zip(path, path[1:]))
+    assert finder.path((2, 2), (1, 1)) is None
+
+
+def test_distance_map_measures_from_nearest_source():
+    finder = Pathfinder(_rows())
+    field = finder.distance_map([(0, 0), (4, 4)])
+    assert field.distance(0, 4) == 4
+    assert field.distance(2, 2) == 4
+    assert field.distance(1, 1) is None
+    assert field.path_from(4, 2) == [(4, 2), (4, 3), (4, 4)]
+    assert finder.distance_map([(0, 0)], limit=2).distance(0, 3) is None
+
+
+def test_results_are_cached_until_walls_change():
+    grid = TileGrid.from_rows(_rows())
+    finder = Pathfinder(grid)
+    field = finder.distance_map([(0, 0)])
+    assert finder.distance_map([(0, 0)]) is field
+    assert finder.step_toward((2, 4), (0, 0)) == (1, 4)
+
+    grid[2][4] = "Trap"
+    assert finder.distance_map([(0, 0)]) is field
+    grid[4][1] = None
+    assert finder.distance_map([(0, 0)]) is not field
+    assert finder.step_toward((2, 4), (0, 0)) == (2, 3)
+    assert len(finder.path((2, 4), (0, 4))) - 1 == 14
+
+
+def test_escort_npc_walks_around_walls():
+    game = DungeonBase(5, 5)
+    game.rooms = TileGrid.from_rows(_rows())
+    game.player = Player("Hero")
+    game.player.x, game.player.y = 0, 3
+    game.rooms[3][0] = game.player
+    npc = EscortNPC("Scout", 2, 2)
+    game.rooms[2][2] = npc
+    game.active_quest = EscortQuest(npc, reward=5, flavor="")
+
+    seen = []
+    while not npc.following and len(seen) < 10:
+        game.check_quest_progress()
+        seen.append((npc.x, npc.y))
+    assert seen == [(2, 3), (2, 4), (1, 4), (0, 4), (0, 3)]
+    assert npc.following
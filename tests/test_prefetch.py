@@ -0,0 +1,33 @@
+from dungeoncrawler.config import config
+
+
+def test_prefetched_floor_matches_on_demand_generation(make_game, floor_snapshot):
+    eager, lazy = make_game(11, prefetch=True), make_game(11)
+    eager.generate_dungeon(3)
+    lazy.generate_dungeon(3)
+    assert eager.floor_prefetcher.pending == (11, 4, eager._floor_settings(4))
+    assert lazy.floor_prefetcher.pending is None
+
+    # What happens on the current floor does not leak into the next one.
+    for _ in range(50):
+        eager.rng.combat.random()
+    prepared = eager.floor_prefetcher._thread
+    eager.generate_dungeon(4)
+    lazy.generate_dungeon(4)
+
+    assert prepared is not None and not prepared.is_alive()
+    assert floor_snapshot(eager) == floor_snapshot(lazy)
+
+
+def test_prefetched_floor_is_dropped_when_settings_change(monkeypatch, make_game):
+    game = make_game(11, prefetch=True)
+    game.generate_dungeon(2)
+    monkeypatch.setattr(config, "loot_mult", config.loot_mult + 1)
+    assert game.floor_prefetcher.take((11, 3, game._floor_settings(3))) is None
+    assert game.floor_prefetcher.pending is None
+
+
+def test_unseeded_games_generate_on_demand(make_game):
+    game = make_game(None, prefetch=True)
+    game.generate_dungeon(1)
+    assert game.floor_prefetcher.pending is None
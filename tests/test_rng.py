@@ -0,0 +1,79 @@
+import random
+import threading
+
+from dungeoncrawler import map as dungeon_map
+from dungeoncrawler.arena import Arena, make_enemy
+from dungeoncrawler.core.combat import resolve_player_action
+from dungeoncrawler.core.entity import Entity
+from dungeoncrawler.core.rng import RNGContext, stream_for
+from dungeoncrawler.data import load_floor_definitions
+from dungeoncrawler.dungeon import DungeonBase
+from dungeoncrawler.entities import Player
+from dungeoncrawler.sim import enemy_stat_ranges, simulate_battles
+
+
+def _layout(seed):
+    load_floor_definitions()
+    game = DungeonBase(1, 1, seed=seed)
+    game.player = Player("Tester")
+    dungeon_map.generate_dungeon(game, 3)
+    return [[type(room).__name__ for room in row] for row in game.rooms], game.room_names
+
+
+def test_seeded_streams_are_reproducible_and_independent():
+    first, second = RNGContext(7), RNGContext(7)
+    assert [first.combat.random() for _ in range(5)] == [second.combat.random() for _ in range(5)]
+    # Consuming one stream leaves the others untouched.
+    assert first.loot.random() == RNGContext(7).loot.random()
+    assert RNGContext(7).ai.random() != RNGContext(7).events.random()
+
+
+def test_unseeded_context_uses_global_random():
+    context = RNGContext()
+    assert context.combat is random
+    assert stream_for(object(), "combat") is random
+
+
+def test_seeded_generation_ignores_global_state():
+    random.seed(1)
+    expected = _layout(42)
+    random.seed(2)
+    assert _layout(42) == expected
+    state = random.getstate()
+    _layout(42)
+    assert random.getstate() == state
+
+
+def test_combat_rolls_follow_injected_rng():
+    def attack(rng):
+        player = Entity("Hero", {"health": 10, "attack": 5, "speed": 10})
+        enemy = Entity("Slime", {"health": 100, "defense": 0, "speed": 10})
+        for _ in range(20):
+            resolve_player_action(player, enemy, "attack", rng)
+        return enemy.stats["health"]
+
+    assert attack(random.Random(3)) == attack(random.Random(3))
+
+
+def test_parallel_simulations_match_serial_results():
+    expected = simulate_battles("Goblin", 50, seed=5)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(simulate_battles("Goblin", 50, seed=5)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 4
+
+
+def test_battle_binds_the_combat_stream_only_for_the_fight():
+    arena = Arena(seed=2)
+    player = Player("Hero")
+    enemy = make_enemy("Goblin", enemy_stat_ranges("Goblin"), arena.rng.generation)
+
+    arena.duel(player, enemy)
+
+    assert player.rng is random and "rng" not in vars(player)
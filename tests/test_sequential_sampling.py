@@ -0,0 +1,45 @@
+import pytest
+
+from dungeoncrawler.balance import Matchup, run_matrix
+from dungeoncrawler.sim import class_player_stats, sequential_outcomes, simulate, wilson_interval
+
+
+def test_wilson_interval_brackets_rate():
+    lo, hi = wilson_interval(30, 100, 1.96)
+    assert lo < 0.3 < hi
+    assert wilson_interval(0, 0, 1.96) == (0.0, 1.0)
+    assert wilson_interval(5, 5, 1.96)[1] == pytest.approx(1.0)
+
+
+def test_adaptive_stops_early_when_clearly_outside_band():
+    result = simulate("Mage", "Bandit", 1, 2000, seed=1, band=(0.95, 1.0))
+    assert result.runs < 200
+    assert result.win_rate < 0.95
+
+
+def test_adaptive_stops_early_when_clearly_inside_band():
+    result = simulate("Mage", "Bandit", 1, 2000, seed=1, band=(0.3, 0.9))
+    assert result.runs < 200
+    assert 0.3 <= result.win_rate <= 0.9
+
+
+def test_adaptive_uses_full_budget_when_undecided():
+    # A band far narrower than any interval 60 battles can produce.
+    mage = class_player_stats("Mage")
+    wins, runs, _ = sequential_outcomes("Bandit", 60, (0.57, 0.59), seed=2, player_stats=mage)
+    assert runs == 60
+    assert 0 <= wins <= 60
+
+
+def test_fixed_mode_reports_runs():
+    assert simulate("Mage", "Bandit", 1, 40).runs == 40
+    assert simulate("Mage", "Bandit", 1, 40, engine="exact").runs == 0
+
+
+def test_run_matrix_adaptive_reports_runs_used():
+    matchups = [Matchup("Mage", "Bandit", 1, 1000, 0.95, 1.0)]
+    serial = run_matrix(matchups, workers=1, alpha=0.05)
+    again = run_matrix(matchups, workers=1, alpha=0.05)
+    assert serial[0].runs < 1000
+    assert not serial[0].passed
+    assert serial[0].to_dict() == again[0].to_dict()
@@ -0,0 +1,72 @@
+import pytest
+
+from dungeoncrawler import dungeon, entities
+from dungeoncrawler.balance import Matchup, run_matrix
+from dungeoncrawler.config import config
+from dungeoncrawler.sim_cache import SimCache, matchup_key
+
+MATCHUPS = [
+    Matchup("Warrior", "Bandit", 1, 60, 0.0, 1.0),
+    Matchup("Mage", "Goblin", 1, 60, 0.0, 1.0),
+]
+
+
+def test_matchup_key_tracks_inputs():
+    base = matchup_key("Warrior", "Bandit", "python", 0, 100)
+    assert base == matchup_key("Warrior", "Bandit", "python", 0, 100)
+    assert base != matchup_key("Warrior", "Bandit", "python", 1, 100)
+    assert base != matchup_key("Warrior", "Bandit", "python", 0, 200)
+    assert base != matchup_key("Warrior", "Bandit", "numpy", 0, 100)
+    assert base != matchup_key("Mage", "Bandit", "python", 0, 100)
+    assert base != matchup_key("Warrior", "Bandit", "python", 0, 100, chunk_size=50)
+
+
+def test_matchup_key_tracks_config_multipliers(monkeypatch):
+    base = matchup_key("Warrior", "Bandit", "python", 0, 100)
+    monkeypatch.setattr(config, "enemy_hp_mult", config.enemy_hp_mult * 2)
+    assert base != matchup_key("Warrior", "Bandit", "python", 0, 100)
+
+
+@pytest.mark.parametrize("table", ["ENEMY_ABILITIES", "ENEMY_TRAITS", "ENEMY_AI"])
+def test_matchup_key_tracks_enemy_behaviour(monkeypatch, table):
+    base = matchup_key("Warrior", "Bandit", "game", 0, 100)
+    monkeypatch.setitem(getattr(dungeon, table), "Bandit", ["changed"])
+    assert base != matchup_key("Warrior", "Bandit", "game", 0, 100)
+
+
+def test_matchup_key_tracks_skills(monkeypatch):
+    base = matchup_key("Warrior", "Bandit", "game", 0, 100)
+    monkeypatch.setattr(entities, "SKILL_DEFS", [])
+    assert base != matchup_key("Warrior", "Bandit", "game", 0, 100)
+
+
+def test_cached_matrix_matches_uncached(tmp_path):
+    cache = SimCache(tmp_path)
+    first = run_matrix(MATCHUPS, workers=1, chunk_size=30, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    second = run_matrix(MATCHUPS, workers=1, chunk_size=30, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+    plain = run_matrix(MATCHUPS, workers=1, chunk_size=30)
+    assert [r.to_dict() for r in first] == [r.to_dict() for r in second]
+    assert [r.to_dict() for r in first] == [r.to_dict() for r in plain]
+    assert "2 hits, 2 misses" in cache.report()
+
+
+def test_editing_an_enemy_only_recomputes_its_matchups(tmp_path, monkeypatch):
+    cache = SimCache(tmp_path)
+    run_matrix(MATCHUPS, workers=1, cache=cache)
+    hp_min, hp_max, atk_min, atk_max, defense = dungeon.ENEMY_STATS["Goblin"]
+    monkeypatch.setitem(
+        dungeon.ENEMY_STATS, "Goblin", (hp_min + 5, hp_max + 5, atk_min, atk_max, defense)
+    )
+    cache.hits = cache.misses = 0
+    run_matrix(MATCHUPS, workers=1, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_corrupt_entry_counts_as_miss(tmp_path):
+    cache = SimCache(tmp_path)
+    key = matchup_key("Warrior", "Bandit", "python", 0, 10)
+    (tmp_path / f"{key}.json").write_text("{not json")
+    assert cache.get(key) is None
+    assert cache.misses == 1
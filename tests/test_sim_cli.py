@@ -1,6 +1,8 @@
 import subprocess
 import sys
 
+import pytest
+
 
 def test_simulate_battles_cli():
     result = subprocess.run(
@@ -20,3 +22,25 @@ def test_simulate_battles_cli():
     )
     assert "Winrate:" in result.stdout
     assert "Average Turns:" in result.stdout
+
+
+def test_simulate_battles_cli_numpy_engine():
+    pytest.importorskip("numpy")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "dungeoncrawler.sim",
+            "Bandit",
+            "--runs",
+            "50",
+            "--seed",
+            "0",
+            "--engine",
+            "numpy",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "Winrate:" in result.stdout
@@ -1,3 +1,9 @@
+import random
+
+import pytest
+
+from dungeoncrawler import sim
+from dungeoncrawler.core.rng import derive_seed
 from dungeoncrawler.sim import simulate_battles
 
 
@@ -5,3 +11,32 @@ def test_simulate_battles():
     stats = simulate_battles("Bandit", runs=5, seed=0)
     assert 0 <= stats["winrate"] <= 1
     assert stats["avg_turns"] >= 0
+
+
+def test_simulate_battles_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        simulate_battles("Bandit", runs=1, engine="cuda")
+
+
+def test_stat_and_combat_streams_use_distinct_seeds(monkeypatch):
+    seeds = []
+
+    class Recording(random.Random):
+        def __init__(self, seed=None):
+            seeds.append(seed)
+            super().__init__(seed)
+
+    monkeypatch.setattr(sim.random, "Random", Recording)
+    sim.battle_outcomes("Bandit", 3, seed=7)
+    assert seeds == [7, derive_seed(7, "combat")]
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_intent_cycles_are_opt_in(monkeypatch, engine):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    plain = simulate_battles("Goblin", 200, seed=3, engine=engine)
+    monkeypatch.setattr(sim, "enemy_intents", lambda name: ["defend", "attack"])
+
+    assert simulate_battles("Goblin", 200, seed=3, engine=engine) == plain
+    assert simulate_battles("Goblin", 200, seed=3, engine=engine, intents=True) != plain
@@ -1,7 +1,11 @@
 import pytest
 
+from dungeoncrawler.core.bus import EventBus
+from dungeoncrawler.core.events import StatusTicked
 from dungeoncrawler.status_effects import (
     STATUS_EFFECT_HANDLERS,
+    STATUS_EFFECT_TABLE,
+    TickRule,
     add_status_effect,
     apply_status_effects,
 )
@@ -88,3 +92,70 @@ def test_add_status_effect_initialises_dict_when_missing():
     entity = Dummy()
     add_status_effect(entity, "poison", 3)
     assert entity.status_effects == {"poison": 3}
+
+
+def test_inspire_with_short_duration_restores_attack():
+    player = Player(attack_power=5, status_effects={"inspire": 1})
+    apply_status_effects(player)
+    assert player.attack_power == 5
+    assert "inspire" not in player.status_effects
+
+
+def test_creeping_corruption_reverts_the_inspire_bonus():
+    player = Player(attack_power=5, status_effects={"inspire": 3})
+    apply_status_effects(player)
+    assert player.attack_power == 8
+
+    player.status_effects["creeping_corruption"] = 2
+    apply_status_effects(player)
+
+    assert player.attack_power == 5
+    assert not player._inspire_active
+    assert "inspire" not in player.status_effects
+
+    player.status_effects["inspire"] = 2
+    apply_status_effects(player)
+    assert player.attack_power == 5
+    assert "inspire" not in player.status_effects
+
+
+def test_table_effects_tick_silently_without_listeners(capsys, monkeypatch):
+    def fail(*args, **kwargs):  # pragma: no cover - must not be called
+        raise AssertionError("message formatted")
+
+    monkeypatch.setattr("dungeoncrawler.status_effects._report", fail)
+    player = Player(status_effects={"poison": 2, "blessed": 2})
+    player.event_bus = EventBus()
+
+    apply_status_effects(player)
+
+    assert player.health == 7
+    assert player.status_effects == {"poison": 1, "blessed": 1}
+    assert capsys.readouterr().out == ""
+
+
+def test_table_tick_events_format_on_demand():
+    bus = EventBus()
+    events = []
+    bus.subscribe(events.append, StatusTicked)
+    player = Player(status_effects={"burn": 1})
+    player.event_bus = bus
+
+    apply_status_effects(player)
+
+    assert [event.text for event in events] == [None, None]
+    assert [event.message for event in events] == ["Burn -4 HP (0 turns left).", "Burn ended."]
+
+
+def test_handlers_take_precedence_over_table(monkeypatch):
+    def handler(entity, effects, is_player, name):
+        del effects["poison"]
+        return True
+
+    monkeypatch.setitem(STATUS_EFFECT_TABLE, "slow", TickRule(damage=1, tick_at_zero=True))
+    monkeypatch.setitem(STATUS_EFFECT_HANDLERS, "poison", handler)
+    player = Player(status_effects={"poison": 3, "slow": 2})
+
+    assert apply_status_effects(player) is True
+    assert player.health == 9
+    assert player.status_effects == {"slow": 1}
@@ -0,0 +1,116 @@
+import pytest
+
+from dungeoncrawler.balance import Matchup
+from dungeoncrawler.dungeon import ENEMY_STATS
+from dungeoncrawler.sim import main as sim_main
+from dungeoncrawler.sim_cache import SimCache
+from dungeoncrawler.tuner import Tuner, apply_factors, band_miss, enemies_json_diff
+
+ENEMIES_JSON = """[
+  {
+    "name": "Bandit",
+    "stats": [
+      60,
+      90,
+      8,
+      16,
+      3
+    ],
+    "traits": ["keep"]
+  }
+]
+"""
+
+
+def _matchups():
+    return [
+        Matchup("Warrior", "Bandit", 1, 200, 0.45, 0.55),
+        Matchup("Mage", "Bandit", 1, 200, 0.55, 0.75),
+    ]
+
+
+def test_band_miss_and_factors():
+    matchup = Matchup("Mage", "Bandit", 1, 100, 0.4, 0.6)
+    assert band_miss(matchup, 0.5) == 0
+    assert band_miss(matchup, 0.7) == pytest.approx(0.1)
+    assert band_miss(matchup, 0.3) == pytest.approx(-0.1)
+    assert apply_factors((60, 90, 8, 16, 3), 0.5, 2.0) == (30, 45, 16, 32, 3)
+
+
+def test_tuner_brings_matchups_into_band(tmp_path):
+    before = ENEMY_STATS["Bandit"]
+    cache = SimCache(tmp_path / "cache")
+    result = Tuner(_matchups(), cache=cache).tune()
+
+    assert result.passed
+    assert result.changed == ["Bandit"]
+    assert ENEMY_STATS["Bandit"] == before
+    for matchup in _matchups():
+        assert matchup.min <= result.win_rates[matchup.key] <= matchup.max
+
+    again = Tuner(_matchups(), cache=SimCache(tmp_path / "cache")).tune()
+    assert again.stats == result.stats
+    assert again.evaluations == 0
+
+
+def test_bisect_does_not_trade_one_miss_for_another(monkeypatch):
+    easy = Matchup("Warrior", "Bandit", 1, 100, 0.4, 0.65)
+    hard = Matchup("Mage", "Bandit", 1, 100, 0.3, 0.6)
+    tuner = Tuner([easy, hard])
+    # Win rates fall as the health factor grows; both pass for 0.5-0.75.
+    offsets = {easy.key: 0.55, hard.key: 0.25}
+
+    def win_rate(matchup, stats):
+        return offsets[matchup.key] + (1 - tuner.global_factors[0]) * 0.2
+
+    monkeypatch.setattr(tuner, "win_rate", win_rate)
+    assert tuner.misses([easy, hard]) == [0, pytest.approx(-0.05)]
+    assert tuner.error([easy, hard]) == pytest.approx(0.05)
+
+    tuner._bisect(tuner.global_factors, 0, [easy, hard])
+    assert 0.5 <= tuner.global_factors[0] <= 0.75
+
+    # Failing on both sides cannot be fixed by one factor, so it stays put.
+    offsets[hard.key] = 0.1
+    offsets[easy.key] = 0.8
+    tuner.global_factors[0] = 1.0
+    tuner._bisect(tuner.global_factors, 0, [easy, hard])
+    assert tuner.global_factors[0] == 1.0
+
+
+def test_enemies_json_diff_only_touches_stats(tmp_path):
+    path = tmp_path / "enemies.json"
+    path.write_text(ENEMIES_JSON)
+    diff = enemies_json_diff({"Bandit": (45, 67, 8, 17, 3), "Modded": (1, 1, 1, 1, 1)}, path)
+
+    assert "-      60,\n" in diff and "+      45,\n" in diff
+    assert "+      17,\n" in diff
+    assert enemies_json_diff({"Bandit": (60, 90, 8, 16, 3)}, path) == ""
+
+
+def test_tune_cli(tmp_path, capsys):
+    thresholds = tmp_path / "thresholds.yml"
+    thresholds.write_text(
+        "matchups:\n"
+        "  - {player_class: Warrior, enemy_kind: Bandit, floor: 1, min: 0.45, max: 0.55}\n"
+    )
+    enemies = tmp_path / "enemies.json"
+    enemies.write_text(ENEMIES_JSON)
+    out = tmp_path / "rebalance.diff"
+    with pytest.raises(SystemExit) as exc:
+        sim_main(
+            [
+                "tune",
+                "--thresholds",
+                str(thresholds),
+                "--enemies",
+                str(enemies),
+                "--cache-dir",
+                str(tmp_path / "cache"),
+                "--output",
+                str(out),
+            ]
+        )
+    assert exc.value.code == 0
+    assert "1/1 matchups within thresholds" in capsys.readouterr().out
+    assert out.read_text().startswith("--- a/data/enemies.json")
@@ -1,6 +1,14 @@
 """Visibility and discovery handling tests."""
 
-from dungeoncrawler.core.map import GameMap
+import random
+
+import pytest
+
+from dungeoncrawler import map as dungeon_map
+from dungeoncrawler.core.map import BitGrid, GameMap
+from dungeoncrawler.data import load_floor_definitions
+from dungeoncrawler.dungeon import DungeonBase
+from dungeoncrawler.entities import Player
 
 
 def test_visibility_and_discovery_on_small_map():
@@ -56,3 +64,70 @@ def test_light_radius_limits_monster_detection():
     # Increasing enemy sight reveals the player
     enemy_view_far = gm.compute_visibility(4, 4, 8)
     assert (0, 0) in enemy_view_far
+
+
+def test_fog_layers_are_packed_and_cleared_in_place():
+    grid = [[1 for _ in range(10)] for _ in range(10)]
+    gm = GameMap(grid)
+    visible, discovered = gm.visible, gm.discovered
+
+    gm.update_visibility(0, 0, 2)
+    gm.update_visibility(9, 9, 2)
+
+    assert gm.visible is visible and gm.discovered is discovered
+    assert len(visible.bits) == 13
+    assert visible.count() == 6 and not visible[0][0]
+    assert discovered.count() == 12 and discovered[0][0] is True
+
+
+def test_update_visibility_packs_list_layers():
+    grid = [[1, 1], [1, 1]]
+    gm = GameMap(grid)
+    gm.discovered = [[False, False], [False, True]]
+
+    events = gm.update_visibility(0, 0, 1)
+
+    assert isinstance(gm.discovered, BitGrid)
+    assert gm.discovered == [[True, True], [True, True]]
+    assert sorted((event.x, event.y) for event in events) == [(0, 0), (0, 1), (1, 0)]
+
+
+def test_bit_rows_expose_packed_masks_and_check_bounds():
+    layer = BitGrid.from_rows([[True, False, True], [False, True, True], [True, True, False]])
+
+    assert [layer.row_mask(y) for y in range(3)] == [0b101, 0b110, 0b011]
+    assert layer[1][-1] is True and layer[1][0:2] == [False, True]
+    layer[2][-1] = True
+    assert layer.row_mask(2) == 0b111
+    with pytest.raises(IndexError):
+        layer[0][3] = True
+    with pytest.raises(IndexError):
+        layer[0][-4]
+
+
+def test_incremental_updates_match_full_recompute():
+    random.seed(3)
+    load_floor_definitions()
+    game = DungeonBase(1, 1)
+    game.player = Player("Tester")
+    dungeon_map.generate_dungeon(game, floor=5)
+    rng = random.Random(7)
+    seen = {(x, y) for y in range(game.height) for x in range(game.width) if game.discovered[y][x]}
+    for _ in range(60):
+        x, y = game.player.x, game.player.y
+        steps = [
+            (x + dx, y + dy)
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if 0 <= x + dx < game.width
+            and 0 <= y + dy < game.height
+            and game.rooms[y + dy][x + dx] is not None
+        ]
+        if not steps:
+            break
+        game.player.x, game.player.y = rng.choice(steps)
+        events = dungeon_map.update_visibility(game)
+
+        lit = dungeon_map.compute_visibility(game.rooms, game.player.x, game.player.y, 5)
+        assert game.visible.indices() == {y * game.width + x for x, y in lit}
+        assert {(event.x, event.y) for event in events} == lit - seen
+        seen |= lit